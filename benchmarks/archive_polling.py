@@ -0,0 +1,95 @@
+'''
+Compares fixed 5 seconds archive polling with the adaptive PollingStrategy against a local fake archive endpoint.
+
+Job durations and polling delays are scaled down by --scale so the run takes seconds; the printed numbers are
+converted back to real-time seconds. "lag" is the time between a job finishing and the client noticing it.
+
+    python benchmarks/archive_polling.py --scale 0.01
+'''
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from outscraper.polling import PollingStrategy
+from outscraper.transport import OutscraperTransport
+
+
+# (real-time duration in seconds, size hint: queries * limit)
+JOBS = [(2, 1), (4, 20), (15, 100), (60, 500), (300, 5000), (1200, 20000)]
+
+
+class FakeArchive(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    ready_at = {}
+    polls = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        if self.path.startswith('/requests?'):
+            now = time.monotonic()
+            body = [{'id': request_id, 'status': 'Pending'} for request_id, ready_at in list(FakeArchive.ready_at.items()) if ready_at > now]
+        else:
+            request_id = self.path.rsplit('/', 1)[-1]
+            with FakeArchive.lock:
+                FakeArchive.polls[request_id] = FakeArchive.polls.get(request_id, 0) + 1
+
+            status = 'Success' if time.monotonic() >= FakeArchive.ready_at[request_id] else 'Pending'
+            body = {'id': request_id, 'status': status, 'data': []}
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(name, polling, api_url, scale):
+    transport = OutscraperTransport('BENCH', api_urls=[api_url], polling=polling)
+
+    def wait(job):
+        index, (duration, size_hint) = job
+        request_id = f'{name}-{index}'
+        FakeArchive.ready_at[request_id] = time.monotonic() + duration * scale
+        transport._wait_request_archive(request_id, size_hint=size_hint)
+        return (time.monotonic() - FakeArchive.ready_at[request_id]) / scale
+
+    with ThreadPoolExecutor(len(JOBS)) as pool:
+        lags = list(pool.map(wait, enumerate(JOBS)))
+
+    print(f'{name}:')
+    for index, ((duration, size_hint), lag) in enumerate(zip(JOBS, lags)):
+        print(f'    job {duration:>5}s, size {size_hint:>6}: lag {lag:6.1f}s, {FakeArchive.polls[f"{name}-{index}"]:>4} polls')
+    print(f'    total polls: {sum(v for k, v in FakeArchive.polls.items() if k.startswith(name))}')
+    transport.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=0.01, help='wall-clock seconds per simulated second')
+    args = parser.parse_args()
+    scale = args.scale
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeArchive)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f'http://127.0.0.1:{server.server_port}'
+
+    fixed = PollingStrategy(first_delay=5 * scale, multiplier=1, max_delay=5 * scale, jitter=0)
+    adaptive = PollingStrategy(first_delay=1 * scale, max_delay=30 * scale, seconds_per_item=0.02 * scale)
+
+    run('fixed-5s', fixed, api_url, scale)
+    run('adaptive', adaptive, api_url, scale)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+'''
+Counts polling requests for many outstanding async requests, with and without the running requests listing.
+
+Each job finishes after a random duration; every client waits for all of them through the transport's
+ArchiveWatcher. "per-request" fetches each due archive separately, "shared" asks `GET /requests?type=running`
+once per batch of due requests and fetches archives only for finished ones.
+
+    python benchmarks/archive_watcher.py --jobs 2000 --scale 0.01
+'''
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from outscraper.polling import PollingStrategy
+from outscraper.transport import OutscraperTransport
+from outscraper.watcher import ArchiveWatcher
+
+
+class FakeApi(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    ready_at = {}
+    calls = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        now = time.monotonic()
+
+        if self.path.startswith('/requests?'):
+            kind = 'listing'
+            skip = int(self.path.split('skip=')[1].split('&')[0])
+            running = sorted(request_id for request_id, ready_at in list(FakeApi.ready_at.items()) if ready_at > now)
+            body = [{'id': request_id, 'status': 'Pending'} for request_id in running[skip:skip + 100]]
+        else:
+            kind = 'archive'
+            request_id = self.path.rsplit('/', 1)[-1]
+            status = 'Success' if now >= FakeApi.ready_at[request_id] else 'Pending'
+            body = {'id': request_id, 'status': status, 'data': []}
+
+        with FakeApi.lock:
+            FakeApi.calls[kind] += 1
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(name, history_threshold, api_url, jobs, scale):
+    polling = PollingStrategy(first_delay=1 * scale, max_delay=30 * scale, seconds_per_item=0)
+    transport = OutscraperTransport('BENCH', api_urls=[api_url], polling=polling, pool_maxsize=16)
+    transport._watcher = ArchiveWatcher(transport, history_threshold=history_threshold)
+
+    rng = random.Random(42)
+    FakeApi.calls.clear()
+    started = time.monotonic()
+    futures = []
+    for index in range(jobs):
+        request_id = f'{name}-{index}'
+        FakeApi.ready_at[request_id] = started + rng.uniform(1, 600) * scale
+        futures.append(transport.watcher.watch(request_id))
+
+    for future in futures:
+        future.result()
+
+    print(f'{name:>12}: {jobs} jobs, {FakeApi.calls["archive"]} archive polls + {FakeApi.calls["listing"]} listing calls '
+        f'in {(time.monotonic() - started) / scale:.0f} simulated seconds')
+    transport.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--jobs', type=int, default=2000)
+    parser.add_argument('--scale', type=float, default=0.01, help='wall-clock seconds per simulated second')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeApi)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f'http://127.0.0.1:{server.server_port}'
+
+    run('per-request', float('inf'), api_url, args.jobs, args.scale)
+    run('shared', 3, api_url, args.jobs, args.scale)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+'''
+Compares materializing business search items as `Business` dataclasses (`from_dict`, which keeps the whole item in
+`extra`) against compact `BusinessRecord` objects built a page at a time with `BusinessRecord.from_items()`.
+
+Each variant runs in a fresh interpreter, so the reported peak RSS is its own. Items are synthetic and shaped like
+API items: the `Business` fields plus `--extra-keys` other keys. Pages are released once converted, as a scan would.
+
+    python benchmarks/business_records.py --businesses 500000 --page-size 1000
+'''
+
+import argparse
+import gc
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from outscraper.schema.businesses import Business, BusinessRecord
+
+
+def page(start, size, extra_keys):
+    items = []
+    for i in range(start, start + size):
+        item = {
+            'os_id': f'os-{i}',
+            'place_id': f'ChIJ{i:020d}',
+            'google_id': f'0x{i:x}:0x{i * 7:x}',
+            'name': f'Business {i}',
+            'phone': f'+1 555 {i % 10000:04d}',
+            'website': f'https://business-{i}.example.com',
+            'address': f'{i} Main St, Springfield',
+            'state': 'IL',
+            'postal_code': f'{60000 + i % 1000}',
+            'rating': 3.5 + i % 15 / 10,
+            'reviews': i % 900,
+            'photo': f'https://photos.example.com/{i}.jpg',
+            'types': ['restaurant', 'bar'],
+        }
+        for key in range(extra_keys):
+            item[f'extra_{key}'] = f'value {i}-{key}'
+        items.append(item)
+    return items
+
+
+def materialize(variant, businesses, page_size, extra_keys):
+    records = []
+    elapsed = 0.0
+    for start in range(0, businesses, page_size):
+        items = page(start, min(page_size, businesses - start), extra_keys)
+
+        started = time.perf_counter()
+        if variant == 'dataclass':
+            records.extend(Business.from_dict(item) for item in items)
+        else:
+            records.extend(BusinessRecord.from_items(items))
+        elapsed += time.perf_counter() - started
+
+        del items
+    return records, elapsed
+
+
+def child(variant, businesses, page_size, extra_keys):
+    records, elapsed = materialize(variant, businesses, page_size, extra_keys)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    del records
+    gc.collect()
+
+    # retained size, measured apart since tracing slows construction down
+    tracemalloc.start()
+    records, _ = materialize(variant, min(businesses, 100000), page_size, extra_keys)
+    retained = tracemalloc.get_traced_memory()[0] / len(records)
+    tracemalloc.stop()
+
+    print(json.dumps({'elapsed': elapsed, 'peak_rss': peak_rss, 'retained': retained}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--businesses', type=int, default=500000)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--extra-keys', type=int, default=20)
+    parser.add_argument('--variant', choices=['dataclass', 'records'])
+    args = parser.parse_args()
+
+    if args.variant:
+        return child(args.variant, args.businesses, args.page_size, args.extra_keys)
+
+    for variant, name in (('dataclass', 'Business.from_dict'), ('records', 'BusinessRecord.from_items')):
+        output = subprocess.run([sys.executable, __file__, '--variant', variant, '--businesses', str(args.businesses),
+            '--page-size', str(args.page_size), '--extra-keys', str(args.extra_keys)], check=True, capture_output=True, text=True).stdout
+        result = json.loads(output)
+        print(f'{name:>26}: {args.businesses} businesses built in {result["elapsed"]:.2f}s '
+            f'({args.businesses / result["elapsed"]:.0f}/s), peak RSS {result["peak_rss"]:.0f} MiB, '
+            f'{result["retained"]:.0f} bytes retained per business')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+'''
+Compares the deduplicators on a synthetic stream of place records: throughput, memory per identifier and, for the
+Bloom filter, the share of new records wrongly taken for duplicates.
+
+Records carry a `place_id` and a `google_id`; `--duplicates` of them repeat an earlier place, as overlapping queries
+or map tiles would. Memory is measured with tracemalloc for the exact set, as the filter size for the Bloom filter and
+as the database size for the SQLite file.
+
+    python benchmarks/dedup.py --records 1000000 --duplicates 0.3
+'''
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from outscraper.dedup import BloomDeduplicator, DiskDeduplicator, ExactDeduplicator
+
+
+def records(count, duplicates, seed=0):
+    rng = random.Random(seed)
+    places = 0
+    for _ in range(count):
+        if places and rng.random() < duplicates:
+            i, new = rng.randrange(places), False
+        else:
+            i, new = places, True
+            places += 1
+        yield {'place_id': f'ChIJ{i:020d}', 'google_id': f'0x{i:x}:0x{i * 7:x}', 'name': f'Place {i}'}, new
+
+
+def run(dedup, count, duplicates):
+    stream = list(records(count, duplicates))
+    false_positives = 0
+
+    started = time.perf_counter()
+    for record, new in stream:
+        if not dedup.is_new(record) and new:
+            false_positives += 1
+    elapsed = time.perf_counter() - started
+
+    return elapsed, false_positives, sum(new for _, new in stream)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=1000000)
+    parser.add_argument('--duplicates', type=float, default=0.3)
+    parser.add_argument('--error-rate', type=float, default=0.001)
+    args = parser.parse_args()
+
+    # identifiers of the unique places, the size the Bloom filter has to be planned for
+    capacity = int(args.records * (1 - args.duplicates) * 2)
+
+    tracemalloc.start()
+    exact = ExactDeduplicator()
+    elapsed, false_positives, unique = run(exact, args.records, args.duplicates)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # tracing slows the set down, time it again untraced
+    elapsed, _, _ = run(ExactDeduplicator(), args.records, args.duplicates)
+    del exact
+    report('exact', args.records, elapsed, memory, unique, false_positives)
+
+    bloom = BloomDeduplicator(capacity, args.error_rate)
+    elapsed, false_positives, unique = run(bloom, args.records, args.duplicates)
+    report('bloom', args.records, elapsed, bloom.memory, unique, false_positives)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'seen.sqlite3')
+        with DiskDeduplicator(path) as disk:
+            elapsed, false_positives, unique = run(disk, args.records, args.duplicates)
+        memory = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        report('disk', args.records, elapsed, memory, unique, false_positives)
+
+
+def report(name, count, elapsed, memory, unique, false_positives):
+    print(f'{name:>6}: {count / elapsed:>9.0f} records/s, {memory / 2 ** 20:7.1f} MiB, '
+        f'{memory / (unique * 2):5.1f} bytes per identifier, {false_positives} of {unique} new records dropped')
+
+
+if __name__ == '__main__':
+    main()
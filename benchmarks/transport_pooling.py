@@ -0,0 +1,107 @@
+'''
+Compares per-call connections (module-level `requests.request`, as before) against the pooled keep-alive transport.
+
+Runs against a local stub server, so the numbers show the TCP connection setup saved per call;
+over TLS to the real API the savings per call are larger (one extra handshake round trip or two).
+
+    python benchmarks/transport_pooling.py --calls 2000 --threads 8
+'''
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from outscraper import OutscraperClient
+from outscraper.polling import PollingStrategy
+
+
+# the stub finishes jobs instantly, poll right away to measure only connection handling
+INSTANT_POLLING = PollingStrategy(first_delay=0.001, multiplier=1, max_delay=0.001, jitter=0)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    connections = 0
+    connections_lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StubHandler.connections_lock:
+            StubHandler.connections += 1
+
+    def do_GET(self):
+        if self.path.startswith('/phones-enricher'):
+            body = {'id': 'stub-request', 'status': 'Pending'}
+        elif self.path.startswith('/requests/'):
+            body = {'id': 'stub-request', 'status': 'Success', 'data': [[{'phone': '+1 281 236 8208', 'carrier_type': 'mobile'}]]}
+        else:
+            body = {'data': [[{'query': 'Central Park, NY', 'latitude': 40.78, 'longitude': -73.96}]]}
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class UnpooledClient(OutscraperClient):
+    def __init__(self, api_key, api_url):
+        super().__init__(api_key, api_urls=[api_url], polling=INSTANT_POLLING)
+        transport = self._transport
+
+        def api_request(method, path, *, wait_async, async_request, use_handle_response, **kwargs):
+            response = requests.request(method, f'{api_url}{path}', headers=transport._api_headers, **kwargs)
+            if use_handle_response:
+                return transport._handle_response(response, wait_async, async_request)
+            return response
+
+        transport.api_request = api_request
+
+
+def run(client, calls, threads):
+    def call(i):
+        if i % 2:
+            return client.geocoding('Central Park, NY')
+        return client.phones_enricher('+1 281 236 8208')
+
+    StubHandler.connections = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(call, range(calls)))
+    return time.perf_counter() - started, StubHandler.connections
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f'http://127.0.0.1:{server.server_port}'
+
+    unpooled = UnpooledClient('BENCH', api_url)
+    pooled = OutscraperClient('BENCH', api_urls=[api_url], pool_maxsize=args.threads, polling=INSTANT_POLLING)
+
+    for name, client in (('per-call connections', unpooled), ('pooled keep-alive', pooled)):
+        elapsed, connections = run(client, args.calls, args.threads)
+        print(f'{name:>22}: {args.calls} calls in {elapsed:.2f}s ({args.calls / elapsed:.0f} calls/s), {connections} TCP connections opened')
+
+    pooled.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,44 @@
 from .client import OutscraperClient
+from .async_client import AsyncOutscraperClient
+from .cache import ResponseCache
+from .dedup import ExactDeduplicator, BloomDeduplicator, DiskDeduplicator
+from .exceptions import (OutscraperError, APIError, HTTPStatusError, APIResponseError, APIConnectionError, ChunkedRequestError,
+    ClientClosedError, RateLimitExceeded, TileSearchError)
+from .export import read_archive
+from .journal import JobJournal
+from .futures import RequestHandle, wait, as_completed, ALL_COMPLETED, FIRST_COMPLETED, FIRST_EXCEPTION
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .webhooks import WebhookReceiver
 
 ApiClient = OutscraperClient
 
 __all__ = [
     'OutscraperClient',
+    'AsyncOutscraperClient',
     'ApiClient',
+    'ResponseCache',
+    'JobJournal',
+    'ExactDeduplicator',
+    'BloomDeduplicator',
+    'DiskDeduplicator',
+    'OutscraperError',
+    'APIError',
+    'HTTPStatusError',
+    'APIResponseError',
+    'APIConnectionError',
+    'ChunkedRequestError',
+    'ClientClosedError',
+    'RateLimitExceeded',
+    'TileSearchError',
+    'RateLimiter',
+    'RetryPolicy',
+    'WebhookReceiver',
+    'read_archive',
+    'RequestHandle',
+    'wait',
+    'as_completed',
+    'ALL_COMPLETED',
+    'FIRST_COMPLETED',
+    'FIRST_EXCEPTION',
 ]
@@ -0,0 +1,385 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
+
+import requests
+
+from .cache import MISSING
+from .client import MAPS_SEARCH_RESULTS_LIMIT, OutscraperClient
+from .exceptions import HTTPStatusError, TileSearchError
+from .futures import RequestHandle
+from .journal import EXPIRED, EXPIRED_STATUS_CODES, PENDING
+from .pagination import aiter_offsets, aiter_pages, first_key
+from .polling import estimate_job_size
+from .singleflight import AsyncSingleFlight
+from .tiling import Area, AreaLike, plan_tiles
+
+
+class AsyncOutscraperClient(OutscraperClient):
+    '''AsyncOutscraperClient - asyncio version of OutscraperClient.
+
+    Every endpoint of OutscraperClient is available with the same parameters and returns an awaitable.
+    Archive polling uses `asyncio.sleep`, so waiting for results does not hold a thread; HTTP calls run on a
+    small shared executor (one worker per pooled connection by default).
+    ```python
+    import asyncio
+    from outscraper import AsyncOutscraperClient
+
+    async def main():
+        async with AsyncOutscraperClient(api_key='SECRET_API_KEY') as client:
+            maps_results, search_results = await asyncio.gather(
+                client.google_maps_search('restaurants brooklyn usa'),
+                client.google_search('bitcoin'),
+            )
+
+    asyncio.run(main())
+    ```
+    https://github.com/outscraper/outscraper-python
+    '''
+
+    def __init__(self, api_key: str, max_workers: Optional[int] = None, **options) -> None:
+        '''
+            Parameters:
+                api_key (str): Outscraper API key.
+                max_workers (int | None): number of threads performing HTTP calls. Default: the transport's `pool_maxsize`.
+                options: `cache`, `single_flight` and transport options, see `OutscraperClient`.
+        '''
+
+        super().__init__(api_key, **options)
+        self._async_single_flight = AsyncSingleFlight()
+        self._executor = ThreadPoolExecutor(max_workers or self._transport._pool_maxsize, thread_name_prefix='outscraper')
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        super().close()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    async def __aenter__(self) -> AsyncOutscraperClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _run(self, func, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    @property
+    def saved_requests(self) -> int:
+        return super().saved_requests + self._async_single_flight.saved
+
+    async def submit(self, endpoint: str, *args, **kwargs) -> RequestHandle:
+        '''
+            Awaitable version of `OutscraperClient.submit()`. Use `asyncio.wrap_future(handle)` to await the result.
+        '''
+
+        return await self._run(super().submit, endpoint, *args, **kwargs)
+
+    def _request(self, method: str, path: str, **kwargs):
+        return self._request_async(method, path, **kwargs)
+
+    async def _request_chunks_async(self, method: str, path: str, chunks: List[dict]) -> list:
+        semaphore = asyncio.Semaphore(self._chunk_concurrency)
+
+        async def send(chunk_kwargs):
+            async with semaphore:
+                try:
+                    return await self._request_async(method, path, wait_async=True, **chunk_kwargs), None
+                except Exception as e:
+                    return None, e
+
+        return self._merge_chunks(chunks, await asyncio.gather(*(send(chunk) for chunk in chunks)))
+
+    async def _request_async(self, method: str, path: str, *, wait_async: bool = False, async_request: bool = False, use_handle_response: bool = True, **kwargs):
+        chunks = self._chunks(path, async_request, use_handle_response, kwargs)
+        if chunks:
+            return await self._request_chunks_async(method, path, chunks)
+
+        params = kwargs.get('params') or kwargs.get('json')
+        cacheable = self._cacheable(use_handle_response, async_request, params)
+
+        if cacheable:
+            cached, cache_key, query_order = self._cache.lookup(method, path, params)
+            if cached is not MISSING:
+                return cached
+
+        async def send():
+            if self._journaled(wait_async, async_request, use_handle_response, params):
+                return await self._request_journaled_async(method, path, kwargs)
+
+            response = await self._run(self._transport.api_request, method, path,
+                wait_async=wait_async,
+                async_request=async_request,
+                use_handle_response=False,
+                **kwargs,
+            )
+
+            if not use_handle_response:
+                return response
+
+            # async_request=True makes the transport return the submitted request instead of blocking on the archive
+            result = self._transport._handle_response(response, wait_async, async_request=True)
+
+            if wait_async and not async_request:
+                result = (await self._wait_request_archive(result['id'], size_hint=estimate_job_size(params))).get('data', [])
+            return result
+
+        flight_key = self._single_flight and self._flight_key(method, path, wait_async, async_request, use_handle_response, kwargs)
+        result = await self._async_single_flight.do(flight_key, send) if flight_key else await send()
+
+        if cacheable:
+            self._cache.store(method, path, params, result, cache_key, query_order)
+        return result
+
+    async def _request_journaled_async(self, method: str, path: str, kwargs: dict) -> list:
+        params = kwargs.get('params') or kwargs.get('json')
+        key, entry = self._journal_lookup(method, path, params)
+
+        if entry is not None and entry.finished:
+            return self._journal.results(key)
+
+        if entry is not None and entry.status == PENDING:
+            try:
+                archive = await self._wait_journaled_async(key, entry.request_id, params)
+            except HTTPStatusError as e:
+                # see OutscraperClient._request_journaled()
+                if e.status_code not in EXPIRED_STATUS_CODES:
+                    raise
+            else:
+                if archive.get('status') != EXPIRED:
+                    return archive.get('data', [])
+
+        submitted = await self._run(self._transport.api_request, method, path, wait_async=True, async_request=True,
+            use_handle_response=True, watched=True, **kwargs)
+        self._journal.submitted(key, method, path, params, submitted['id'])
+        return (await self._wait_journaled_async(key, submitted['id'], params)).get('data', [])
+
+    async def _wait_journaled_async(self, key: str, request_id: str, params) -> dict:
+        future = self._transport.watcher.watch(request_id, size_hint=estimate_job_size(params))
+        waited = asyncio.wrap_future(future)
+        await asyncio.wait([waited])
+        # retrieved from the concurrent future below, once the outcome is journaled
+        waited.exception()
+        self._journaled_archive(key, future)
+        return future.result()
+
+    async def _wait_request_archive(self, request_id: str, size_hint: Optional[int] = None) -> dict:
+        return await asyncio.wrap_future(self._transport.watcher.watch(request_id, size_hint=size_hint))
+
+    async def get_tasks(self, query: str = '', last_id: str = '', page_size: int = 10) -> Tuple[list, bool]:
+        '''
+            Awaitable version of `OutscraperClient.get_tasks()`.
+
+            See: https://app.outscraper.com/api-docs#tag/Outscraper-Platform-UI/paths/~1tasks/get
+        '''
+
+        params = {
+            'query': query,
+            'lastId': last_id,
+            'pageSize': page_size,
+        }
+        response: requests.Response = await self._request('GET', '/tasks', use_handle_response=False, params=params)
+        return self._tasks_result(response)
+
+    async def get_requests_history(self, type: str = 'running', skip: int = 0, page_size: int = 25) -> list:
+        '''
+            Awaitable version of `OutscraperClient.get_requests_history()`.
+
+            See: https://app.outscraper.com/api-docs#tag/Requests/paths/~1requests/get
+        '''
+
+        params = {
+            'type': type,
+            'skip': skip,
+            'pageSize': page_size,
+        }
+        response: requests.Response = await self._request('GET', '/requests', use_handle_response=False, params=params)
+        return self._json_result(response)
+
+    def iter_requests_history(self, type: str = 'running', page_size: int = 100, limit: Optional[int] = None,
+        concurrency: int = 4) -> AsyncIterator[dict]:
+        '''
+            Async iterator version of `OutscraperClient.iter_requests_history()`.
+        '''
+
+        async def fetch(skip: int) -> list:
+            return self._page_items(await self.get_requests_history(type=type, skip=skip, page_size=page_size))
+
+        return aiter_offsets(fetch, page_size, limit=limit, concurrency=concurrency, key=first_key('id'))
+
+    def iter_google_maps_search(self, query: str, page_size: int = 100, limit: int = MAPS_SEARCH_RESULTS_LIMIT, concurrency: int = 4,
+        language: str = 'en', region: Optional[str] = None, coordinates: str = '', enrichment: Optional[list] = None,
+        fields: Union[list, str] = None) -> AsyncIterator[dict]:
+        '''
+            Async iterator version of `OutscraperClient.iter_google_maps_search()`.
+        '''
+
+        if page_size % 20:
+            raise ValueError('page_size must be a multiple of 20')
+
+        async def fetch(skip: int) -> list:
+            return self._page_items(await self.google_maps_search(query, limit=page_size, skip=skip, language=language,
+                region=region, coordinates=coordinates, enrichment=enrichment, fields=fields))
+
+        return aiter_offsets(fetch, page_size, limit=limit, concurrency=concurrency, key=first_key('place_id', 'google_id'))
+
+    async def iter_google_maps_search_area(self, query: str, area: Union[Area, AreaLike], cell_size_km: float = 2.0,
+        tile_limit: int = MAPS_SEARCH_RESULTS_LIMIT, min_cell_size_km: float = 0.25, concurrency: int = 4, clip: bool = True,
+        language: str = 'en', region: Optional[str] = None, enrichment: Optional[list] = None,
+        fields: Union[list, str] = None, split_threshold: Optional[int] = None, tile_retries: int = 1) -> AsyncIterator[dict]:
+        '''
+            Async generator version of `OutscraperClient.iter_google_maps_search_area()`.
+        '''
+
+        if not isinstance(area, Area):
+            area = Area(area)
+        split_threshold = self._split_threshold(tile_limit, split_threshold)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search(tile):
+            async with semaphore:
+                return self._page_items(await self.google_maps_search(query, limit=tile_limit, coordinates=tile.coordinates,
+                    language=language, region=region, enrichment=enrichment, fields=fields))
+
+        loop = asyncio.get_running_loop()
+        pending = {loop.create_task(search(tile)): (tile, 1) for tile in plan_tiles(area, cell_size_km)}
+        seen = set()
+        failed = []
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tile, attempt = pending.pop(task)
+                    try:
+                        places = task.result()
+                    except Exception as e:
+                        if attempt <= tile_retries:
+                            pending[loop.create_task(search(tile))] = (tile, attempt + 1)
+                        else:
+                            failed.append((tile, e))
+                        continue
+
+                    for child in self._split_capped_tile(area, tile, places, split_threshold, min_cell_size_km):
+                        pending[loop.create_task(search(child))] = (child, 1)
+
+                    for place in self._new_places(area, places, seen, clip):
+                        yield place
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if failed:
+            raise TileSearchError(failed)
+
+    def iter_trustpilot_search(self, query: str, page_size: int = 100, limit: Optional[int] = None, concurrency: int = 4,
+        enrichment: list = None, fields: Union[list, str] = None) -> AsyncIterator[dict]:
+        '''
+            Async iterator version of `OutscraperClient.iter_trustpilot_search()`.
+        '''
+
+        async def fetch(skip: int) -> list:
+            return self._page_items(await self.trustpilot_search(query, limit=page_size, skip=skip, enrichment=enrichment,
+                fields=fields))
+
+        return aiter_offsets(fetch, page_size, limit=limit, concurrency=concurrency, key=first_key('domain', 'url'))
+
+    async def get_request_archive(self, request_id: str, export_path: str = None) -> Union[dict, str]:
+        '''
+            Awaitable version of `OutscraperClient.get_request_archive()`.
+
+            See: https://app.outscraper.com/api-docs#tag/Requests/paths/~1requests~1{requestId}/get
+        '''
+
+        if export_path:
+            return await self.export_request_archive(request_id, export_path)
+
+        response = await self._request('GET', f'/requests/{request_id}',  use_handle_response=False)
+        return self._json_result(response)
+
+    async def iter_google_maps_reviews(self, query: str, page_size: int = 100, reviews_limit: int = 0, prefetch: int = 1,
+        sort: str = 'most_relevant', start: int = None, cutoff: int = None, cutoff_rating: int = None, ignore_empty: bool = False,
+        language: str = 'en', region: str = None, reviews_query: str = None, source: str = None,
+        last_pagination_id: str = None) -> AsyncIterator[dict]:
+        '''
+            Async generator version of `OutscraperClient.iter_google_maps_reviews()`. Accepts the same parameters.
+        '''
+
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1')
+
+        async def fetch(last_pagination_id: Optional[str]) -> Tuple[list, Optional[str]]:
+            result = await self.google_maps_reviews(query, reviews_limit=page_size, sort=sort, start=start, cutoff=cutoff,
+                cutoff_rating=cutoff_rating, ignore_empty=ignore_empty, language=language, region=region,
+                reviews_query=reviews_query, source=source, last_pagination_id=last_pagination_id)
+            return self._reviews_page(result, page_size)
+
+        yielded = 0
+        previous_ids = set()
+        pages = aiter_pages(fetch, last_pagination_id, prefetch)
+
+        try:
+            async for reviews in pages:
+                reviews, previous_ids = self._new_reviews(reviews, previous_ids)
+                for review in reviews:
+                    yield review
+                    yielded += 1
+                    if yielded == reviews_limit:
+                        return
+        finally:
+            await pages.aclose()
+
+    async def iter_request_archive(self, request_id: str, flatten: bool = True, batch_size: int = 256) -> AsyncIterator:
+        '''
+            Async iterator version of `OutscraperClient.iter_request_archive()`.
+            Records are parsed in the executor, `batch_size` at a time.
+        '''
+
+        async for item in self._iter_records(self._transport.iter_archive(request_id, flatten=flatten), batch_size):
+            yield item
+
+    async def iter_results(self, endpoint: str, *args, flatten: bool = True, batch_size: int = 256, **kwargs) -> AsyncIterator:
+        '''
+            Async iterator version of `OutscraperClient.iter_results()`.
+        '''
+
+        request = await self._async_endpoint_request(endpoint, args, kwargs)
+        async for item in self._iter_records(self._transport.iter_archive(request['id'], flatten=flatten), batch_size):
+            yield item
+
+    async def export_request_archive(self, request_id: str, path: str) -> str:
+        '''
+            Awaitable version of `OutscraperClient.export_request_archive()`.
+        '''
+
+        return await self._run(self._transport.export_archive, request_id, path)
+
+    async def export(self, endpoint: str, path: str, *args, **kwargs) -> str:
+        '''
+            Awaitable version of `OutscraperClient.export()`.
+        '''
+
+        request = await self._async_endpoint_request(endpoint, args, kwargs)
+        return await self._run(self._transport.export_archive, request['id'], path)
+
+    async def _iter_records(self, records: Iterator, batch_size: int) -> AsyncIterator:
+        try:
+            while True:
+                batch = await self._run(list, islice(records, batch_size))
+                if not batch:
+                    return
+
+                for item in batch:
+                    yield item
+        finally:
+            records.close()
+
+    @cached_property
+    def businesses(self):
+        from .businesses import AsyncBusinessesAPI
+        return AsyncBusinessesAPI(self)
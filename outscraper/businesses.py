@@ -1,7 +1,18 @@
 from __future__ import annotations
-from typing import Iterator, Optional, Union, Mapping, Any
-
-from .schema.businesses import BusinessFilters, BusinessSearchResult
+import asyncio
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import replace
+from heapq import heappop, heappush
+from queue import Full, Queue
+from threading import Event, Lock
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional, Union, Mapping, Any
+
+from .exceptions import APIError, APIResponseError, status_error
+from .pagination import LAST_PAGE, aiter_pages, iter_pages
+from .schema.businesses import BusinessFilters, BusinessRecord, BusinessSearchResult
 
 
 FiltersLike = Union[BusinessFilters, Mapping[str, Any], None]
@@ -11,13 +22,84 @@ EnrichmentsLike = Optional[Union[
     str,
 ]]
 
+# filter fields whose values select disjoint sets of businesses
+PARTITION_FIELDS = ('states', 'cities', 'postal_codes', 'geo_filters')
+
+IDENTIFIERS = ('os_id', 'place_id', 'google_id')
+GOOGLE_ID_PATTERN = re.compile(r'^0x[0-9a-f]+:0x[0-9a-f]+$', re.IGNORECASE)
+PLACE_ID_PREFIXES = ('ChIJ', 'GhIJ', 'Ei')
+
+
+def business_id_kind(business_id: str, kind: Optional[str] = None) -> str:
+    '''"google_id", "place_id" or "os_id": `kind` when given, otherwise guessed from the format of a business identifier.'''
+
+    if kind is not None:
+        if kind not in IDENTIFIERS:
+            raise ValueError(f'kind must be one of {", ".join(IDENTIFIERS)}')
+        return kind
+    if GOOGLE_ID_PATTERN.match(business_id):
+        return 'google_id'
+    if business_id.startswith(PLACE_ID_PREFIXES):
+        return 'place_id'
+    return 'os_id'
+
+
+class BusinessIdentityCache:
+    def __init__(self, max_entries: int = 10000) -> None:
+        '''
+            Recently fetched businesses, found by any of their identifiers (os_id, place_id and google_id).
+
+                Parameters:
+                    max_entries (int): maximum number of cached identifiers. Default: 10000.
+        '''
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+
+    def get(self, business_id: str, fields: Optional[list[str]] = None) -> Optional[dict]:
+        '''A copy of the business, if it was fetched with all the `fields` (None: all fields).'''
+
+        with self._lock:
+            entry = self._entries.get(business_id)
+            if entry is None:
+                return None
+
+            business, cached_fields = entry
+            if cached_fields is not None and (fields is None or not cached_fields.issuperset(fields)):
+                return None
+
+            self._entries.move_to_end(business_id)
+            self.hits += 1
+
+        return deepcopy(business)
+
+    def add(self, business: dict, fields: Optional[list[str]] = None) -> None:
+        entry = (deepcopy(business), frozenset(fields) if fields else None)
+
+        with self._lock:
+            for identifier in IDENTIFIERS:
+                if business.get(identifier):
+                    self._entries[business[identifier]] = entry
+                    self._entries.move_to_end(business[identifier])
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class BusinessesAPI:
     def __init__(self, client: OutscraperClient) -> None:
         self._client = client
+        self.identities = BusinessIdentityCache()
 
     def search(self, *, filters: FiltersLike = None, limit: int = 10, cursor: Optional[str] = None, include_total: bool = False,
-        fields: Optional[list[str]] = None, enrichments: EnrichmentsLike = None, query: str = '') -> BusinessSearchResult:
+        fields: Optional[list[str]] = None, enrichments: EnrichmentsLike = None, query: str = '',
+        records: bool = False) -> BusinessSearchResult:
         '''
             Retrieve business records with optional enrichment data.
 
@@ -49,6 +131,8 @@ class BusinessesAPI:
                         - "contacts_n_leads"
                         In those forms, each enrichment is sent with empty params.
                     query (str): natural language search.
+                    records (bool): Whether to return the items as compact `BusinessRecord` objects instead of dicts,
+                        which takes less memory when many businesses are kept. Default: False.
 
                 Returns:
                         BusinessSearchResult: Page of businesses with pagination info.
@@ -56,49 +140,16 @@ class BusinessesAPI:
             See: https://app.outscraper.com/api-docs
         '''
 
-        if limit < 1 or limit > 1000:
-            raise ValueError('limit must be in range [1, 1000]')
-
-        if filters is None:
-            filters_payload = {}
-        elif isinstance(filters, BusinessFilters):
-            filters_payload = filters.to_payload()
-        else:
-            filters_payload = dict(filters)
-
-        payload = {
-            'filters': filters_payload,
-            'limit': limit,
-            'cursor': cursor,
-            'include_total': include_total,
-        }
-        if fields:
-            payload['fields'] = list(fields)
-
-        normalized_enrichments = self._normalize_enrichments(enrichments=enrichments)
-
-        if normalized_enrichments:
-            payload['enrichments'] = normalized_enrichments
-
-        if query:
-            payload['query'] = query
+        payload = self._search_payload(filters=filters, limit=limit, cursor=cursor, include_total=include_total,
+            fields=fields, enrichments=enrichments, query=query)
 
         response = self._client._request('POST', '/businesses', use_handle_response=False, json=payload)
-        data = response.json()
-
-        if data.get('error'):
-            error_message = data.get('errorMessage')
-            raise Exception(f'error: {error_message}')
-
-        return BusinessSearchResult(
-            items=data.get('items') or [],
-            next_cursor=data.get('next_cursor'),
-            has_more=bool(data.get('has_more')) or bool(data.get('next_cursor')),
-        )
+        return self._search_result(response.json(), records)
 
     def iter_search(self, *, filters: FiltersLike = None, limit: int = 10, start_cursor: Optional[str] = None,
         include_total: bool = False, fields: Optional[list[str]] = None,
-        enrichments: EnrichmentsLike = None, query: str = '') -> Iterator[dict]:
+        enrichments: EnrichmentsLike = None, query: str = '', prefetch: int = 1,
+        records: bool = False) -> Iterator[Union[dict, BusinessRecord]]:
         '''
             Iterate over businesses across all pages (auto-pagination).
 
@@ -107,6 +158,9 @@ class BusinessesAPI:
             - yields each Business from the returned page
             - continues while next_cursor/has_more indicates more pages
 
+            The next page is requested in the background as soon as its cursor is known, so the processing of
+            a page overlaps with the download of the next ones. Items are yielded in the same order either way.
+
                 Parameters:
                     filters (BusinessFilters | dict | None): Same as `search()`.
                     limit (int): Page size per request. Default: 10.
@@ -118,6 +172,9 @@ class BusinessesAPI:
                     enrichments (dict | list[str] | str | None): Passed to `search()`.
                         Supports the same formats as `search()`.
                     query (str): Passed to `search()`.
+                    prefetch (int): Pages fetched ahead of the consumer; 0 requests each page only when it is needed.
+                        Default: 1.
+                    records (bool): Passed to `search()`.
 
                 Yields:
                         item (dict): Each business record from all pages.
@@ -125,23 +182,107 @@ class BusinessesAPI:
             See: https://app.outscraper.com/api-docs
         '''
 
-        cursor = start_cursor
+        fetch = self._page_fetcher(filters=filters, limit=limit, include_total=include_total, fields=fields,
+            enrichments=enrichments, query=query, records=records)
 
-        while True:
-            business_search_result = self.search(filters=filters,
-                limit=limit,
-                cursor=cursor,
-                include_total=include_total,
-                fields=fields,
-                enrichments=enrichments,
-                query=query)
+        for items in iter_pages(fetch, start_cursor, prefetch):
+            yield from items
 
-            for item in business_search_result.items:
-                yield item
-            if not business_search_result.next_cursor and not business_search_result.has_more:
-                break
+    def parallel_scan(self, *, filters: FiltersLike = None, partition_by: Optional[str] = None, concurrency: int = 4,
+        balance: bool = True, limit: int = 1000, fields: Optional[list[str]] = None,
+        enrichments: EnrichmentsLike = None, query: str = '',
+        records: bool = False) -> Iterator[Union[dict, BusinessRecord]]:
+        '''
+            Iterate over businesses with several cursor chains running concurrently.
+
+            The filters are split into partitions by the values of one of their list fields (`states`, `cities`,
+            `postal_codes` or `geo_filters`), each partition is walked by its own cursor chain and the pages are merged
+            as they arrive, without duplicates by `os_id`. Items come in no particular order.
+
+            With `balance`, the businesses of each value are counted first (`include_total`), values without businesses
+            are skipped and the others are grouped into `concurrency` partitions of similar size, so that the chains
+            finish at about the same time.
+
+            ```python
+            filters = BusinessFilters(country_code='US', states=['CA', 'TX', 'NY', 'FL'], types=['restaurant'])
+            for business in client.businesses.parallel_scan(filters=filters, concurrency=8):
+                ...
+            ```
 
-            cursor = business_search_result.next_cursor
+                Parameters:
+                    filters (BusinessFilters | dict | None): Same as `search()`.
+                    partition_by (str | None): Filter field to split: "states", "cities", "postal_codes" or "geo_filters".
+                        Default: the first of them with several values (no split when there is none).
+                    concurrency (int): Cursor chains running at once, keep it within the client's `pool_maxsize`.
+                        Default: 4.
+                    balance (bool): Whether to count the businesses of each value and group the values into partitions
+                        of similar size. Default: True.
+                    limit (int): Page size per request. Default: 1000.
+                    fields (list[str] | None): Passed to `search()`.
+                    enrichments (dict | list[str] | str | None): Passed to `search()`.
+                    query (str): Passed to `search()`.
+                    records (bool): Passed to `search()`.
+
+                Yields:
+                        item (dict): Each business record, once.
+        '''
+
+        field, values = self._partition_values(filters, partition_by)
+        groups = [[value] for value in values]
+        executor = ThreadPoolExecutor(concurrency, thread_name_prefix='outscraper-scan')
+
+        if balance and len(values) > 1:
+            counts = list(executor.map(lambda value: self._count(self._partition_filters(filters, field, [value]), query), values))
+            groups = self._balanced_groups(values, counts, concurrency)
+
+        # bounded, so that chains wait for the consumer instead of piling up pages
+        pages = Queue(concurrency * 2)
+        stopped = Event()
+
+        def put(page: tuple) -> None:
+            while not stopped.is_set():
+                try:
+                    return pages.put(page, timeout=0.1)
+                except Full:
+                    pass
+
+        def scan(group: list) -> None:
+            try:
+                fetch = self._page_fetcher(filters=self._partition_filters(filters, field, group), limit=limit,
+                    include_total=False, fields=fields, enrichments=enrichments, query=query, records=records)
+                for items in iter_pages(fetch, prefetch=0):
+                    if stopped.is_set():
+                        return
+                    put((items, None))
+            except Exception as e:
+                put((None, e))
+            finally:
+                put((LAST_PAGE, None))
+
+        for group in groups:
+            executor.submit(scan, group)
+
+        seen = set()
+        remaining = len(groups)
+        try:
+            while remaining:
+                items, exception = pages.get()
+                if exception is not None:
+                    raise exception
+                if items is LAST_PAGE:
+                    remaining -= 1
+                    continue
+
+                for item in items:
+                    os_id = item.get('os_id')
+                    if os_id is not None:
+                        if os_id in seen:
+                            continue
+                        seen.add(os_id)
+                    yield item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get(self, business_id: str, *, fields: Optional[list[str]] = None) -> dict:
         '''
@@ -169,16 +310,218 @@ class BusinessesAPI:
             params = {'fields': ','.join(fields)}
 
         resp = self._client._request('GET', f'/businesses/{business_id}', use_handle_response=False, params=params)
-        data = resp.json()
-        if data.get('error'):
+        return self._get_result(business_id, resp)
+
+    def get_many(self, business_ids: Iterable[str], *, fields: Optional[list[str]] = None, concurrency: int = 4,
+        batch_size: int = 500, kind: Optional[str] = None) -> list[Optional[dict]]:
+        '''
+            Get the details of many businesses.
+
+            os_ids are looked up in batches through `search()` (one request per `batch_size` businesses), place_ids
+            and google_ids are fetched with concurrent `get()` calls. The kind of each identifier is guessed from its
+            format (see `business_id_kind()`) unless `kind` is given.
+            Businesses are remembered under all their identifiers (see `identities`), so a business that was already
+            fetched, under any of its ids, is not requested again.
+
+            ```python
+            businesses = client.businesses.get_many(ids, fields=['name', 'phone', 'website'], concurrency=8)
+            ```
+
+                Parameters:
+                    business_ids (iterable[str]): Business identifiers (os_id, place_id, or google_id).
+                    fields (list[str] | None): List of fields to include in the response, the identifiers are always
+                        included. If not provided, API returns all fields.
+                    concurrency (int): Requests running at once, keep it within the client's `pool_maxsize`. Default: 4.
+                    batch_size (int): os_ids per search request, up to 1000. Default: 500.
+                    kind (str | None): kind of all `business_ids` ("os_id", "place_id" or "google_id"). Default: None (guessed).
+
+                Returns:
+                        data (list[dict | None]): businesses in the order of `business_ids`, None for the ones that were
+                            not found. Other errors (e.g., authentication or connection errors) are raised.
+        '''
+
+        business_ids = list(business_ids)
+        request_fields = self._identified_fields(fields)
+        found = self._cached_businesses(business_ids, fields)
+
+        def get(business_id: str) -> Optional[dict]:
+            try:
+                return self.get(business_id, fields=request_fields)
+            except APIError as e:
+                return self._not_found(e)
+
+        with ThreadPoolExecutor(concurrency, thread_name_prefix='outscraper-get') as executor:
+            batches = self._os_id_batches(business_ids, found, batch_size, kind)
+            search_batch = lambda batch: list(self.iter_search(filters=BusinessFilters(os_ids=batch), limit=len(batch),
+                fields=request_fields, prefetch=0))
+            for businesses in executor.map(search_batch, batches):
+                self._add_found(found, businesses, fields)
+
+            missing = self._missing_ids(business_ids, found, kind)
+            self._add_found(found, list(executor.map(get, missing)), fields, missing)
+
+        return [found.get(business_id) for business_id in business_ids]
+
+    def _identified_fields(self, fields: Optional[list[str]]) -> Optional[list[str]]:
+        if not fields:
+            return None
+        return list(dict.fromkeys([*IDENTIFIERS, *fields]))
+
+    def _cached_businesses(self, business_ids: list[str], fields: Optional[list[str]]) -> dict[str, dict]:
+        found = {}
+        for business_id in business_ids:
+            business = self.identities.get(business_id, fields)
+            if business is not None:
+                found[business_id] = business
+        return found
+
+    def _os_id_batches(self, business_ids: list[str], found: dict[str, dict], batch_size: int,
+        kind: Optional[str] = None) -> list[list[str]]:
+        if batch_size < 1 or batch_size > 1000:
+            raise ValueError('batch_size must be in range [1, 1000]')
+
+        os_ids = [business_id for business_id in dict.fromkeys(business_ids)
+            if business_id not in found and business_id_kind(business_id, kind) == 'os_id']
+        return [os_ids[start:start + batch_size] for start in range(0, len(os_ids), batch_size)]
+
+    def _missing_ids(self, business_ids: list[str], found: dict[str, dict], kind: Optional[str] = None) -> list[str]:
+        # place_ids and google_ids may belong to businesses found by os_id
+        return [business_id for business_id in dict.fromkeys(business_ids)
+            if business_id not in found and business_id_kind(business_id, kind) != 'os_id']
+
+    def _not_found(self, error: APIError) -> None:
+        # a business that doesn't exist leaves a None, any other error fails the whole call
+        if error.status_code != 404:
+            raise error
+        return None
+
+    def _add_found(self, found: dict[str, dict], businesses: list[dict], fields: Optional[list[str]],
+        business_ids: Optional[list[str]] = None) -> None:
+        for index, business in enumerate(businesses):
+            if business is None:
+                continue
+
+            self.identities.add(business, fields)
+            if business_ids is not None:
+                found[business_ids[index]] = business
+            for identifier in IDENTIFIERS:
+                if business.get(identifier):
+                    found[business[identifier]] = business
+
+    def _get_result(self, business_id: str, response) -> dict:
+        if response.status_code == 404:
+            raise status_error(response)
+
+        data = response.json()
+        if isinstance(data, dict) and data.get('error'):
             error_message = data.get('errorMessage')
-            raise Exception(f'error: {error_message}')
+            raise APIResponseError(f'error: {error_message}', error_message, status_code=response.status_code)
 
         if not isinstance(data, dict):
             raise Exception(f'Unexpected response for /businesses/{business_id}: {type(data)}')
 
         return data
 
+    def _page_fetcher(self, **search_kwargs) -> Callable:
+        def fetch(cursor: Optional[str]) -> tuple[list[dict], Any]:
+            business_search_result = self.search(cursor=cursor, **search_kwargs)
+            return business_search_result.items, self._next_cursor(business_search_result)
+
+        return fetch
+
+    def _count(self, filters: FiltersLike, query: str) -> Optional[int]:
+        return self.search(filters=filters, limit=1, include_total=True, fields=['os_id'], query=query).total
+
+    def _partition_values(self, filters: FiltersLike, partition_by: Optional[str]) -> tuple[Optional[str], list]:
+        if isinstance(filters, BusinessFilters):
+            filters_payload = filters.to_payload()
+        else:
+            filters_payload = dict(filters or {})
+
+        if partition_by is None:
+            partition_by = next((field for field in PARTITION_FIELDS if len(filters_payload.get(field) or []) > 1), None)
+            if partition_by is None:
+                return None, [None]
+        elif partition_by not in PARTITION_FIELDS:
+            raise ValueError(f'partition_by must be one of: {", ".join(PARTITION_FIELDS)}')
+
+        values = list(filters_payload.get(partition_by) or [])
+        if not values:
+            raise ValueError(f'filters have no {partition_by} to partition by')
+
+        return partition_by, values
+
+    def _partition_filters(self, filters: FiltersLike, field: Optional[str], values: list) -> FiltersLike:
+        if field is None:
+            return filters
+        if isinstance(filters, BusinessFilters):
+            return replace(filters, **{field: list(values)})
+        return {**dict(filters), field: list(values)}
+
+    def _balanced_groups(self, values: list, counts: list[Optional[int]], bins: int) -> list[list]:
+        '''Values grouped into at most `bins` groups of similar total count, largest first.'''
+
+        if any(count is None for count in counts):
+            return [[value] for value in values]
+
+        counted = sorted(((count, index) for index, count in enumerate(counts) if count), reverse=True)
+        loads = [(0, bin_index, []) for bin_index in range(min(bins, len(counted)))]
+        for count, index in counted:
+            load, bin_index, group = heappop(loads)
+            group.append(values[index])
+            heappush(loads, (load + count, bin_index, group))
+
+        return [group for _, _, group in sorted(loads, key=lambda load: load[0], reverse=True)]
+
+    def _next_cursor(self, business_search_result: BusinessSearchResult) -> Any:
+        if not business_search_result.next_cursor and not business_search_result.has_more:
+            return LAST_PAGE
+        return business_search_result.next_cursor
+
+    def _search_payload(self, *, filters: FiltersLike, limit: int, cursor: Optional[str], include_total: bool,
+        fields: Optional[list[str]], enrichments: EnrichmentsLike, query: str) -> dict[str, Any]:
+        if limit < 1 or limit > 1000:
+            raise ValueError('limit must be in range [1, 1000]')
+
+        if filters is None:
+            filters_payload = {}
+        elif isinstance(filters, BusinessFilters):
+            filters_payload = filters.to_payload()
+        else:
+            filters_payload = dict(filters)
+
+        payload = {
+            'filters': filters_payload,
+            'limit': limit,
+            'cursor': cursor,
+            'include_total': include_total,
+        }
+        if fields:
+            payload['fields'] = list(fields)
+
+        normalized_enrichments = self._normalize_enrichments(enrichments=enrichments)
+
+        if normalized_enrichments:
+            payload['enrichments'] = normalized_enrichments
+
+        if query:
+            payload['query'] = query
+
+        return payload
+
+    def _search_result(self, data: dict, records: bool = False) -> BusinessSearchResult:
+        if data.get('error'):
+            error_message = data.get('errorMessage')
+            raise APIResponseError(f'error: {error_message}', error_message)
+
+        items = data.get('items') or []
+        return BusinessSearchResult(
+            items=BusinessRecord.from_items(items) if records else items,
+            next_cursor=data.get('next_cursor'),
+            has_more=bool(data.get('has_more')) or bool(data.get('next_cursor')),
+            total=data.get('total'),
+        )
+
     def _normalize_enrichments(self, enrichments: EnrichmentsLike = None) -> dict[str, dict[str, Any]]:
         normalized_enrichments = {}
 
@@ -225,3 +568,160 @@ class BusinessesAPI:
                 raise ValueError('emails_per_contact must be an int >= 1')
 
         return normalized_enrichments
+
+
+class AsyncBusinessesAPI(BusinessesAPI):
+    _client: AsyncOutscraperClient
+
+    def __init__(self, client: AsyncOutscraperClient) -> None:
+        super().__init__(client)
+
+    async def search(self, *, filters: FiltersLike = None, limit: int = 10, cursor: Optional[str] = None, include_total: bool = False,
+        fields: Optional[list[str]] = None, enrichments: EnrichmentsLike = None, query: str = '',
+        records: bool = False) -> BusinessSearchResult:
+        '''
+            Awaitable version of `BusinessesAPI.search()`. Accepts the same parameters.
+
+            See: https://app.outscraper.com/api-docs
+        '''
+
+        payload = self._search_payload(filters=filters, limit=limit, cursor=cursor, include_total=include_total,
+            fields=fields, enrichments=enrichments, query=query)
+
+        response = await self._client._request('POST', '/businesses', use_handle_response=False, json=payload)
+        return self._search_result(response.json(), records)
+
+    async def iter_search(self, *, filters: FiltersLike = None, limit: int = 10, start_cursor: Optional[str] = None,
+        include_total: bool = False, fields: Optional[list[str]] = None,
+        enrichments: EnrichmentsLike = None, query: str = '', prefetch: int = 1,
+        records: bool = False) -> AsyncIterator[Union[dict, BusinessRecord]]:
+        '''
+            Async generator version of `BusinessesAPI.iter_search()`. Accepts the same parameters.
+
+            ```python
+            async for business in client.businesses.iter_search(filters=filters, limit=100):
+                ...
+            ```
+        '''
+
+        fetch = self._page_fetcher(filters=filters, limit=limit, include_total=include_total, fields=fields,
+            enrichments=enrichments, query=query, records=records)
+
+        async for items in aiter_pages(fetch, start_cursor, prefetch):
+            for item in items:
+                yield item
+
+    async def parallel_scan(self, *, filters: FiltersLike = None, partition_by: Optional[str] = None, concurrency: int = 4,
+        balance: bool = True, limit: int = 1000, fields: Optional[list[str]] = None,
+        enrichments: EnrichmentsLike = None, query: str = '',
+        records: bool = False) -> AsyncIterator[Union[dict, BusinessRecord]]:
+        '''
+            Async generator version of `BusinessesAPI.parallel_scan()`. Accepts the same parameters.
+        '''
+
+        field, values = self._partition_values(filters, partition_by)
+        groups = [[value] for value in values]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def count(value: Any) -> Optional[int]:
+            async with semaphore:
+                return await self._count(self._partition_filters(filters, field, [value]), query)
+
+        if balance and len(values) > 1:
+            counts = await asyncio.gather(*(count(value) for value in values))
+            groups = self._balanced_groups(values, counts, concurrency)
+
+        pages: asyncio.Queue = asyncio.Queue(concurrency * 2)
+        unscanned = iter(groups)
+
+        async def scan() -> None:
+            try:
+                for group in unscanned:
+                    fetch = self._page_fetcher(filters=self._partition_filters(filters, field, group), limit=limit,
+                        include_total=False, fields=fields, enrichments=enrichments, query=query, records=records)
+                    async for items in aiter_pages(fetch, prefetch=0):
+                        await pages.put((items, None))
+            except Exception as e:
+                await pages.put((None, e))
+            else:
+                await pages.put((LAST_PAGE, None))
+
+        workers = [asyncio.get_running_loop().create_task(scan()) for _ in range(min(concurrency, len(groups)))]
+
+        seen = set()
+        remaining = len(workers)
+        try:
+            while remaining:
+                items, exception = await pages.get()
+                if exception is not None:
+                    raise exception
+                if items is LAST_PAGE:
+                    remaining -= 1
+                    continue
+
+                for item in items:
+                    os_id = item.get('os_id')
+                    if os_id is not None:
+                        if os_id in seen:
+                            continue
+                        seen.add(os_id)
+                    yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    def _page_fetcher(self, **search_kwargs) -> Callable:
+        async def fetch(cursor: Optional[str]) -> tuple[list[dict], Any]:
+            business_search_result = await self.search(cursor=cursor, **search_kwargs)
+            return business_search_result.items, self._next_cursor(business_search_result)
+
+        return fetch
+
+    async def get_many(self, business_ids: Iterable[str], *, fields: Optional[list[str]] = None, concurrency: int = 4,
+        batch_size: int = 500, kind: Optional[str] = None) -> list[Optional[dict]]:
+        '''
+            Awaitable version of `BusinessesAPI.get_many()`. Accepts the same parameters.
+        '''
+
+        business_ids = list(business_ids)
+        request_fields = self._identified_fields(fields)
+        found = self._cached_businesses(business_ids, fields)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search_batch(batch: list[str]) -> list[dict]:
+            async with semaphore:
+                return [business async for business in self.iter_search(filters=BusinessFilters(os_ids=batch),
+                    limit=len(batch), fields=request_fields, prefetch=0)]
+
+        async def get(business_id: str) -> Optional[dict]:
+            async with semaphore:
+                try:
+                    return await self.get(business_id, fields=request_fields)
+                except APIError as e:
+                    return self._not_found(e)
+
+        batches = self._os_id_batches(business_ids, found, batch_size, kind)
+        for businesses in await asyncio.gather(*(search_batch(batch) for batch in batches)):
+            self._add_found(found, businesses, fields)
+
+        missing = self._missing_ids(business_ids, found, kind)
+        self._add_found(found, await asyncio.gather(*(get(business_id) for business_id in missing)), fields, missing)
+
+        return [found.get(business_id) for business_id in business_ids]
+
+    async def _count(self, filters: FiltersLike, query: str) -> Optional[int]:
+        return (await self.search(filters=filters, limit=1, include_total=True, fields=['os_id'], query=query)).total
+
+    async def get(self, business_id: str, *, fields: Optional[list[str]] = None) -> dict:
+        '''
+            Awaitable version of `BusinessesAPI.get()`. Accepts the same parameters.
+
+            See: https://app.outscraper.com/api-docs
+        '''
+
+        params = None
+        if fields:
+            params = {'fields': ','.join(fields)}
+
+        resp = await self._client._request('GET', f'/businesses/{business_id}', use_handle_response=False, params=params)
+        return self._get_result(business_id, resp)
@@ -0,0 +1,261 @@
+import json
+import sqlite3
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import sha256
+from threading import Lock
+from time import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .utils import parse_fields
+
+
+# parameters that change how a request is delivered, not what it returns
+DELIVERY_PARAMS = ('async', 'ui', 'webhook')
+MISSING = object()
+
+# API paths known to return one result entry per query, in query order; only their entries are shared by reordered query lists
+PER_QUERY_PATHS = frozenset({
+    '/google-maps-search',
+    '/maps/search',
+    '/maps/reviews-v2',
+    '/maps/reviews-v3',
+    '/maps/photos-v3',
+    '/maps/directions',
+    '/google-search-v3',
+    '/google-search-news',
+    '/google-play/reviews',
+    '/geocoding',
+    '/amazon/products-v2',
+    '/amazon/reviews',
+    '/yelp-search',
+    '/yelp/reviews',
+    '/tripadvisor/reviews',
+    '/appstore/reviews',
+    '/youtube-comments',
+    '/g2/reviews',
+    '/trustpilot/reviews',
+    '/glassdoor/reviews',
+    '/capterra-reviews',
+})
+
+
+def canonical_params(params, *, sort_queries: bool = False) -> Tuple[Any, Optional[List[int]]]:
+    '''
+        Normalize request parameters so that equivalent requests compare equal.
+
+        Empty values and delivery-only parameters are dropped and `fields` are normalized through `parse_fields`.
+        With `sort_queries`, the query list is sorted and the permutation (original indices in sorted order) is returned.
+    '''
+
+    if not isinstance(params, dict):
+        return params, None
+
+    canonical = {}
+    for name, value in params.items():
+        if name in DELIVERY_PARAMS or value is None or value == '' or value == []:
+            continue
+        if name == 'fields':
+            value = ','.join(sorted({field.strip() for field in parse_fields(value).split(',') if field.strip()}))
+        canonical[name] = value
+
+    order = None
+    queries = canonical.get('query')
+    if sort_queries and isinstance(queries, list) and len(queries) > 1:
+        order = sorted(range(len(queries)), key=lambda i: str(queries[i]))
+        canonical['query'] = [queries[i] for i in order]
+
+    return canonical, order
+
+
+def request_key(method: str, path: str, params, *, sort_queries: bool = False) -> Tuple[str, Optional[List[int]]]:
+    canonical, order = canonical_params(params, sort_queries=sort_queries)
+    # entries stored in sorted-query order never share a key with entries stored in request order
+    serialized = json.dumps([method.upper(), path, canonical, order is not None], sort_keys=True, separators=(',', ':'), default=str)
+    return sha256(serialized.encode()).hexdigest(), order
+
+
+class MemoryCache:
+    def __init__(self, max_entries: int = 1024) -> None:
+        '''
+            Bounded in-memory LRU tier.
+
+                Parameters:
+                    max_entries (int): maximum number of cached responses. Default: 1024.
+        '''
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+
+            value, expires_at = entry
+            if expires_at < time():
+                del self._entries[key]
+                self.evictions += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    def __init__(self, path: str) -> None:
+        '''
+            Persistent tier stored in a SQLite file, shared between runs and processes.
+
+                Parameters:
+                    path (str): path to the database file.
+        '''
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, path TEXT, value TEXT, expires_at REAL)')
+        self._lock = Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Tuple[Any, float]:
+        with self._lock:
+            row = self._connection.execute('SELECT value, expires_at FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return MISSING, 0.0
+
+            if row[1] < time():
+                self._connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self.evictions += 1
+                return MISSING, 0.0
+
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, expires_at: float, path: str = '') -> None:
+        serialized = json.dumps(value, separators=(',', ':'))
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO responses (key, path, value, expires_at) VALUES (?, ?, ?, ?)',
+                (key, path, serialized, expires_at))
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            deleted = self._connection.execute('DELETE FROM responses WHERE expires_at < ?', (time(),)).rowcount
+            self.evictions += deleted
+        return deleted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class ResponseCache:
+    def __init__(self, *, memory: Optional[MemoryCache] = None, path: Optional[str] = None, ttl: float = 24 * 60 * 60,
+        ttls: Optional[Dict[str, float]] = None, per_query_paths: Iterable[str] = PER_QUERY_PATHS) -> None:
+        '''
+            Two-tier cache of endpoint results keyed by endpoint path and canonicalized parameters.
+
+            ```python
+            cache = ResponseCache(path='outscraper-cache.sqlite3', ttls={'/geocoding': 30 * 24 * 60 * 60})
+            client = OutscraperClient(api_key='SECRET_API_KEY', cache=cache)
+            ```
+
+                Parameters:
+                    memory (MemoryCache | None): in-memory LRU tier. Default: MemoryCache().
+                    path (str | None): SQLite file for the persistent tier. Default: None (memory only).
+                    ttl (float): seconds a cached result stays valid. Default: 24 hours.
+                    ttls (dict[str, float] | None): per-endpoint TTLs by API path (e.g., {"/geocoding": 2592000}).
+                    per_query_paths (iterable[str]): API paths returning one entry per query, whose results are shared by
+                        requests with the same queries in another order. Default: PER_QUERY_PATHS.
+        '''
+
+        self.memory = memory or MemoryCache()
+        self.disk = SQLiteCache(path) if path else None
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._per_query_paths = frozenset(per_query_paths)
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, method: str, path: str, params) -> Tuple[Any, str, Optional[List[int]]]:
+        '''Returns (value or MISSING, key to store the response under, query order of that key).'''
+
+        # results with one entry per query are stored in sorted-query order so that reordered query lists share entries
+        sorted_key, order = request_key(method, path, params, sort_queries=self._per_query(path, params))
+        value = self._get(sorted_key)
+
+        if value is not MISSING and order is not None and len(value) == len(order):
+            restored = [None] * len(value)
+            for position, index in enumerate(order):
+                restored[index] = value[position]
+            value = restored
+
+        elif order is not None:
+            key, _ = request_key(method, path, params)
+            value = self._get(key)
+
+        with self._lock:
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        # callers may modify the results they get, the cached copy must stay intact
+        return deepcopy(value) if value is not MISSING else value, sorted_key, order
+
+    def store(self, method: str, path: str, params, value: Any, sorted_key: str, order: Optional[List[int]]) -> None:
+        key = sorted_key
+        if order is not None:
+            if isinstance(value, list) and len(value) == len(order):
+                value = [value[index] for index in order]
+            else:
+                key, _ = request_key(method, path, params)
+
+        expires_at = time() + self._ttls.get(path, self._ttl)
+        self.memory.set(key, value, expires_at)
+        if self.disk is not None:
+            self.disk.set(key, value, expires_at, path)
+
+    def _per_query(self, path: str, params) -> bool:
+        # dropDuplicates merges the places of all queries into one list
+        return path in self._per_query_paths and not (isinstance(params, dict) and params.get('dropDuplicates'))
+
+    def _get(self, key: str) -> Any:
+        value = self.memory.get(key)
+        if value is MISSING and self.disk is not None:
+            value, expires_at = self.disk.get(key)
+            if value is not MISSING:
+                self.memory.set(key, value, expires_at)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        evictions = self.memory.evictions + (self.disk.evictions if self.disk is not None else 0)
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': evictions}
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
@@ -0,0 +1,243 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from time import monotonic
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from .client import OutscraperClient
+from .journal import JobJournal
+from .sinks import iter_records, open_sink
+
+
+class Job:
+    __slots__ = ('ids', 'endpoint', 'kwargs')
+
+    def __init__(self, ids: List[str], endpoint: str, kwargs: Dict[str, Any]) -> None:
+        self.ids = ids
+        self.endpoint = endpoint
+        self.kwargs = kwargs
+
+
+def read_jobs(path: str) -> Iterator[Job]:
+    '''
+        Job specs from a JSONL file (objects with "endpoint", optional "id" and the method's kwargs, either inline or under
+        "kwargs") or a CSV file (an "endpoint" column and one column per kwarg; cells holding JSON are decoded).
+    '''
+
+    with open(path, encoding='utf-8', newline='') as file:
+        if path.lower().endswith('.csv'):
+            specs = (dict(row) for row in csv.DictReader(file))
+            decode = True
+        else:
+            specs = (json.loads(line) for line in file if line.strip())
+            decode = False
+
+        for number, spec in enumerate(specs, 1):
+            endpoint = spec.pop('endpoint', None)
+            if not endpoint:
+                raise ValueError(f'{path}:{number}: "endpoint" is missing')
+
+            job_id = str(spec.pop('id', None) or number)
+            kwargs = spec.pop('kwargs', None) or {}
+            kwargs.update(spec)
+            if decode:
+                kwargs = {name: _decode_cell(value) for name, value in kwargs.items() if value not in (None, '')}
+
+            yield Job([job_id], endpoint, kwargs)
+
+
+def _decode_cell(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def batch_jobs(jobs: Iterator[Job], batch_size: int) -> Iterator[Job]:
+    '''Merge consecutive single-query jobs that only differ by query into one job with up to `batch_size` queries.'''
+
+    batch: Optional[Job] = None
+    for job in jobs:
+        query = job.kwargs.get('query')
+        others = {name: value for name, value in job.kwargs.items() if name != 'query'}
+
+        if batch_size > 1 and isinstance(query, str):
+            if (batch is not None and batch.endpoint == job.endpoint and len(batch.ids) < batch_size
+                and {name: value for name, value in batch.kwargs.items() if name != 'query'} == others):
+                batch.ids.extend(job.ids)
+                batch.kwargs['query'].append(query)
+                continue
+
+            if batch is not None:
+                yield batch
+            batch = Job(list(job.ids), job.endpoint, {**others, 'query': [query]})
+            continue
+
+        if batch is not None:
+            yield batch
+            batch = None
+        yield job
+
+    if batch is not None:
+        yield batch
+
+
+class Progress:
+    def __init__(self, total: int, stream: Optional[TextIO] = sys.stderr) -> None:
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.records = 0
+        self._stream = stream
+        self._started_at = monotonic()
+
+    def update(self, jobs: int, records: int = 0, failed: bool = False) -> None:
+        self.done += jobs
+        self.records += records
+        if failed:
+            self.failed += jobs
+
+        if self._stream is None:
+            return
+
+        elapsed = monotonic() - self._started_at
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - self.done) / rate if rate > 0 else 0.0
+        self._stream.write(f'\r{self.done}/{self.total} jobs, {self.failed} failed, {self.records} records, '
+            f'{rate:.2f} jobs/s, ETA {_duration(eta)}   ')
+        self._stream.flush()
+
+    def finish(self) -> None:
+        if self._stream is not None:
+            self._stream.write('\n')
+
+
+def _duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours:d}:{minutes:02d}:{seconds:02d}'
+
+
+def run_job(client: OutscraperClient, job: Job, use_async: bool) -> Any:
+    # endpoints without an async mode run as regular requests
+    if use_async and client.supports_async(job.endpoint):
+        return client.submit(job.endpoint, **job.kwargs).result()
+
+    return getattr(client, job.endpoint)(**job.kwargs)
+
+
+def job_records(job: Job, result: Any) -> Iterator[dict]:
+    # results with one entry per query are attributed to the job of each query
+    per_query = isinstance(result, list) and len(job.ids) > 1 and len(result) == len(job.ids)
+
+    for index, item in enumerate(result if per_query else [result]):
+        job_id = job.ids[index] if per_query else ','.join(job.ids)
+        for record in iter_records(item):
+            yield {'_job': job_id, **record}
+
+
+def run(args: argparse.Namespace) -> int:
+    api_key = args.api_key or os.environ.get('OUTSCRAPER_API_KEY')
+    if not api_key:
+        raise SystemExit('an API key is required: --api-key or OUTSCRAPER_API_KEY')
+
+    progress_path = f'{args.output}.progress'
+    completed = set()
+    if args.resume and os.path.exists(progress_path):
+        with open(progress_path, encoding='utf-8') as file:
+            completed = {line.strip() for line in file if line.strip()}
+
+    jobs = [job for job in read_jobs(args.input) if job.ids[0] not in completed]
+    jobs = list(batch_jobs(iter(jobs), args.batch_size))
+    progress = Progress(sum(len(job.ids) for job in jobs), stream=None if args.quiet else sys.stderr)
+
+    journal_path = args.journal or f'{args.output}.journal.sqlite3'
+    journal = JobJournal(journal_path)
+    client = OutscraperClient(api_key, journal=journal, chunk_concurrency=args.chunk_concurrency, pool_maxsize=max(10, args.concurrency),
+        api_urls=args.api_urls)
+    sink = open_sink(args.output, args.format, append=args.resume)
+
+    with client, open(progress_path, 'a' if args.resume else 'w', encoding='utf-8') as progress_file:
+        executor = ThreadPoolExecutor(args.concurrency, thread_name_prefix='outscraper-job')
+        pending = {}
+        queue = iter(jobs)
+
+        def fill():
+            for job in queue:
+                pending[executor.submit(run_job, client, job, args.use_async)] = job
+                if len(pending) >= args.concurrency * 2:
+                    return
+
+        try:
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    if future.exception() is not None:
+                        sys.stderr.write(f'\njob {",".join(job.ids)} ({job.endpoint}) failed: {future.exception()}\n')
+                        progress.update(len(job.ids), failed=True)
+                        continue
+
+                    records = list(job_records(job, future.result()))
+                    sink.write(records)
+                    # recorded only once the results are written, so a resumed run never loses a job
+                    progress_file.write(''.join(f'{job_id}\n' for job_id in job.ids))
+                    progress_file.flush()
+                    progress.update(len(job.ids), len(records))
+                fill()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            progress.finish()
+
+    # with failed jobs, the progress file and the journal are kept for --resume, and the output is left for it to append to
+    # (e.g., the CSV header is completed only by the run that finishes every job)
+    sink.close(finalize=not progress.failed)
+    journal.close()
+
+    if progress.failed:
+        sys.stderr.write(f'{progress.failed} jobs failed, run again with --resume to retry them\n')
+        return 1
+
+    os.remove(progress_path)
+    if not args.journal:
+        os.remove(journal_path)
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='outscraper', description='Run Outscraper API jobs in bulk.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run jobs from a JSONL or CSV file',
+        description='Each job names an OutscraperClient method ("endpoint") and its keyword arguments, e.g. '
+        '{"endpoint": "google_maps_search", "query": "bars, NY", "limit": 20}.')
+    run_parser.add_argument('input', help='JSONL or CSV file with job specs')
+    run_parser.add_argument('-o', '--output', required=True, help='output file (.jsonl, .csv or .parquet)')
+    run_parser.add_argument('-f', '--format', choices=['jsonl', 'csv', 'parquet'], help='output format (default: from the file extension)')
+    run_parser.add_argument('-k', '--api-key', help='API key (default: OUTSCRAPER_API_KEY)')
+    run_parser.add_argument('--api-url', dest='api_urls', action='append', help='API URL to use instead of the default mirrors (repeatable)')
+    run_parser.add_argument('-c', '--concurrency', type=int, default=4, help='jobs run at once (default: 4)')
+    run_parser.add_argument('-b', '--batch-size', type=int, default=1,
+        help='merge consecutive single-query jobs with the same arguments into requests of up to this many queries (default: 1)')
+    run_parser.add_argument('--chunk-concurrency', type=int, default=4,
+        help="chunks of a job run at once when its queries exceed the endpoint's batch limit (default: 4)")
+    run_parser.add_argument('--async', dest='use_async', action='store_true', help='submit jobs as async requests')
+    run_parser.add_argument('--resume', action='store_true', help='skip jobs completed by a previous run with the same output')
+    run_parser.add_argument('--journal', help='job journal file (default: <output>.journal.sqlite3)')
+    run_parser.add_argument('-q', '--quiet', action='store_true', help="don't show progress")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    if args.command == 'run':
+        return run(args)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,13 +1,79 @@
 from __future__ import annotations
-from functools import cached_property
+import concurrent.futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from functools import cached_property, partial
+from inspect import iscoroutinefunction, isfunction, signature
+from types import MethodType
 
 import requests
-from typing import Union, Tuple, Optional
-
+from typing import Iterator, List, Union, Tuple, Optional
+
+from .cache import MISSING, ResponseCache, request_key
+from .dedup import ExactDeduplicator
+from .exceptions import APIError, APIResponseError, ChunkedRequestError, ClientClosedError, HTTPStatusError, TileSearchError, status_error
+from .futures import RequestHandle
+from .journal import EXPIRED, EXPIRED_STATUS_CODES, PENDING, SUCCESS, JobJournal, JournalEntry
+from .pagination import LAST_PAGE, first_key, iter_offsets, iter_pages
+from .polling import estimate_job_size
+from .singleflight import SingleFlight
+from .tiling import Area, AreaLike, Tile, plan_tiles
 from .transport import OutscraperTransport
 from .utils import as_list, parse_fields, format_direction_queries
 
 
+# maximum number of queries in one request, by API path
+DEFAULT_QUERY_LIMIT = 250
+# places one Google Maps search returns at most
+MAPS_SEARCH_RESULTS_LIMIT = 400
+# a capped search returns somewhat fewer places than the limit, so a tile is split from this share of its limit on
+TILE_SPLIT_RATIO = 0.8
+
+QUERY_LIMITS = {
+    '/walmart-reviews': 1000,
+    '/target-reviews': 1000,
+}
+
+
+def _drop_duplicates(results: List[Optional[list]]) -> List[Optional[list]]:
+    '''Chunk results (None for failed chunks) without the places that an earlier chunk already returned.'''
+
+    dedup = ExactDeduplicator(keys=('place_id', 'google_id'))
+
+    def unique(items: list) -> list:
+        return [list(dedup.filter(item)) if isinstance(item, list) else item
+            for item in items if not isinstance(item, dict) or dedup.is_new(item)]
+
+    return [None if result is None else unique(result) for result in results]
+
+
+class _Submission:
+    '''
+        Stands in for the client while `submit()` runs an endpoint method, so that the endpoint's request is submitted
+        without waiting for it, whatever the client's own `_request()` does (e.g., the awaitable one of the async client).
+    '''
+
+    def __init__(self, client: OutscraperClient) -> None:
+        self._client = client
+
+    def __getattr__(self, name: str):
+        attribute = getattr(type(self._client), name, None)
+        if isfunction(attribute):
+            if iscoroutinefunction(attribute):
+                # the awaitable endpoints of AsyncOutscraperClient build the same requests as their blocking versions
+                attribute = getattr(OutscraperClient, name)
+            # endpoints calling other endpoints (e.g., aliases) submit through the stand-in too
+            return MethodType(attribute, self)
+        return getattr(self._client, name)
+
+    def _request(self, method: str, path: str, *, wait_async: bool = False, async_request: bool = False, use_handle_response: bool = True,
+        **kwargs) -> RequestHandle:
+        if not use_handle_response:
+            # raised before anything is sent
+            raise ValueError(f'{method} {path} cannot be submitted')
+        return self._client._submit_request(method, path, wait_async=wait_async, **kwargs)
+
+
 class OutscraperClient(object):
     '''OutscraperClient - Python SDK that allows using Outscraper's services and Outscraper's API.
     ```python
@@ -20,17 +86,311 @@ class OutscraperClient(object):
     '''
 
 
-    def __init__(self, api_key: str) -> None:
-        self._transport = OutscraperTransport(api_key=api_key)
+    def __init__(self, api_key: str, cache: Optional[ResponseCache] = None, single_flight: bool = True, chunk_concurrency: int = 4,
+        journal: Optional[JobJournal] = None, **transport_options) -> None:
+        '''
+            Parameters:
+                api_key (str): Outscraper API key.
+                cache (ResponseCache | None): cache for endpoint results. Cached results are returned without any request. Default: None.
+                single_flight (bool): whether identical requests made at the same time (e.g., from several threads)
+                    share one network call and its result. Default: True.
+                chunk_concurrency (int): query lists longer than an endpoint's batch limit (250 queries for most endpoints) are split into
+                    async requests that fit the limit; this sets how many of them run at once. Default: 4.
+                journal (JobJournal | None): journal of async requests and their results, used to resume interrupted runs
+                    without submitting requests again. Default: None.
+                transport_options: connection options passed to `OutscraperTransport` (e.g., `pool_maxsize=20`, `keep_alive=False`, `timeout=60`).
+        '''
+
+        self._transport = OutscraperTransport(api_key=api_key, **transport_options)
+        self._cache = cache
+        self._single_flight = SingleFlight() if single_flight else None
+        self._chunk_concurrency = chunk_concurrency
+        self._journal = journal
+
+    def close(self) -> None:
+        '''Close pooled HTTP connections.'''
+
+        self._transport.close()
+
+    def mirror_stats(self) -> dict:
+        '''
+            Per-mirror health of the API URLs used by this client.
+
+                Returns:
+                    dict: {api_url: {'latency', 'error_rate', 'consecutive_failures', 'state', 'requests', 'errors'}}
+                        where latency (seconds) and error_rate are moving averages and state is the circuit breaker
+                        state ("closed", "open" or "half_open").
+        '''
+
+        return self._transport.mirrors.stats()
+
+    def __enter__(self) -> OutscraperClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def submit(self, endpoint: str, *args, **kwargs) -> RequestHandle:
+        '''
+            Submit a request to any endpoint without waiting for the results.
+
+            The arguments are the same as for the endpoint method. Long-running requests are sent as async requests and
+            tracked by the client's background archive watcher; quick real-time requests are resolved right away.
+            With a journal, async submissions are journaled too: submitting the same request again returns the stored
+            results or waits for the request still pending instead of submitting it twice.
+            ```python
+            handles = [client.submit('google_maps_reviews', place_id, reviews_limit=0) for place_id in place_ids]
+            for handle in outscraper.as_completed(handles):
+                print(handle.request_id, handle.result())
+            ```
+
+                Parameters:
+                    endpoint (str): name of the endpoint method (e.g., "google_maps_search").
+                    args, kwargs: arguments of the endpoint method.
+
+                Returns:
+                    RequestHandle: future of the endpoint's result with `request_id`, `status()`, `done()` and `result(timeout)`.
+        '''
+
+        self._endpoint_method(endpoint)
+        if self.supports_async(endpoint):
+            kwargs['async_request'] = True
+
+        handle = getattr(_Submission(self), endpoint)(*args, **kwargs)
+        if not isinstance(handle, RequestHandle):
+            raise ValueError(f'{endpoint} cannot be submitted')
+        return handle
+
+    def supports_async(self, endpoint: str) -> bool:
+        '''Whether an endpoint method can run as an async request (it takes `async_request`); decided without any request.'''
+
+        return 'async_request' in signature(self._endpoint_method(endpoint)).parameters
+
+    def _endpoint_method(self, endpoint: str):
+        method = getattr(type(self), endpoint, None)
+        if endpoint.startswith('_') or not callable(method):
+            raise ValueError(f'unknown endpoint: {endpoint}')
+        return method
+
+    def _submit_request(self, method: str, path: str, *, wait_async: bool = False, **kwargs) -> RequestHandle:
+        params = kwargs.get('params') or kwargs.get('json')
+        size_hint = estimate_job_size(params)
+
+        key = None
+        if self._journal is not None and wait_async and isinstance(params, dict) and not params.get('ui') and not params.get('webhook'):
+            key, entry = self._journal_lookup(method, path, params)
+            if entry is not None and entry.finished:
+                return RequestHandle.resolved(self._journal.results(key))
+            if entry is not None and entry.status == PENDING:
+                future = self._transport.watcher.watch(entry.request_id, size_hint=size_hint, callback=partial(self._journaled_archive, key))
+                return self._request_handle(entry.request_id, future)
+
+        result = self._transport.api_request(method, path, wait_async=wait_async, async_request=True, use_handle_response=True, watched=True, **kwargs)
+
+        if not wait_async:
+            return RequestHandle.resolved(result)
+
+        callback = None
+        if key is not None:
+            self._journal.submitted(key, method, path, params, result['id'])
+            callback = partial(self._journaled_archive, key)
+        return self._request_handle(result['id'], self._transport.watcher.watch(result['id'], size_hint=size_hint, callback=callback))
+
+    def _request_handle(self, request_id: str, future: Future) -> RequestHandle:
+        return RequestHandle.from_archive(request_id, future, fetch_status=self._request_status, on_cancel=self._transport.watcher.unwatch)
+
+    def _request_status(self, request_id: str) -> str:
+        archive = self._transport._get_archive(request_id)
+        if archive.get('status') != PENDING:
+            # the archive is already here, the watcher doesn't have to download it again
+            self._transport.watcher.report(request_id, archive)
+        return archive.get('status')
+
+    def cache_stats(self) -> dict:
+        '''
+            Counters of the response cache.
+
+                Returns:
+                    dict: {'hits', 'misses', 'evictions'} (empty when the client has no cache).
+        '''
+
+        return self._cache.stats() if self._cache is not None else {}
+
+    @property
+    def saved_requests(self) -> int:
+        '''Number of calls that were served by an identical request already in flight.'''
+
+        return self._single_flight.saved if self._single_flight is not None else 0
+
+    def _flight_key(self, method: str, path: str, wait_async: bool, async_request: bool, use_handle_response: bool, kwargs: dict) -> Optional[tuple]:
+        # each async submission creates its own request, only calls that return data can share a response
+        params = kwargs.get('params') or kwargs.get('json')
+        if (not use_handle_response or async_request
+            or (isinstance(params, dict) and (params.get('ui') or params.get('webhook')))):
+            return None
+
+        key, _ = request_key(method, path, params)
+        return key, wait_async
+
+    def resume_jobs(self) -> List[RequestHandle]:
+        '''
+            Resume waiting for the requests that are still pending in the journal, e.g. after a crash.
+            Their results are stored in the journal once they are finished.
+
+                Returns:
+                    list[RequestHandle]: one handle per pending request.
+        '''
+
+        if self._journal is None:
+            raise ValueError('the client has no journal')
+
+        handles = []
+        for entry in self._journal.pending():
+            future = self._transport.watcher.watch(entry.request_id, size_hint=estimate_job_size(entry.params),
+                callback=partial(self._journaled_archive, entry.key))
+            handles.append(self._request_handle(entry.request_id, future))
+        return handles
+
+    def _journaled(self, wait_async: bool, async_request: bool, use_handle_response: bool, params) -> bool:
+        # requests waited for through their archive have an id that can be resumed, whatever their `async` parameter
+        return (self._journal is not None and wait_async and use_handle_response and not async_request
+            and isinstance(params, dict) and not params.get('ui') and not params.get('webhook'))
+
+    def _journaled_archive(self, key: str, future: Future) -> None:
+        if future.cancelled() or isinstance(future.exception(), ClientClosedError):
+            # still running on the API, a resumed run waits for it
+            return
+        if future.exception() is not None:
+            self._journal.failed(key, future.exception())
+            return
+
+        archive = future.result()
+        status = archive.get('status') or SUCCESS
+        if status == SUCCESS:
+            self._journal.finished(key, status, archive.get('data', []))
+        else:
+            # e.g., an error status: not replayed from the journal, the request is submitted again
+            self._journal.failed(key, APIError(f'request {archive.get("id")} finished with status {status}'))
+
+    def _journal_lookup(self, method: str, path: str, params) -> Tuple[str, Optional[JournalEntry]]:
+        key, _ = request_key(method, path, params)
+        return key, self._journal.get(key)
+
+    def _request_journaled(self, method: str, path: str, kwargs: dict) -> list:
+        params = kwargs.get('params') or kwargs.get('json')
+        key, entry = self._journal_lookup(method, path, params)
+
+        if entry is not None and entry.finished:
+            return self._journal.results(key)
+
+        if entry is not None and entry.status == PENDING:
+            try:
+                archive = self._wait_journaled(key, entry.request_id, params)
+            except HTTPStatusError as e:
+                # only an expired archive is submitted again; other errors (e.g., authentication, connection, a closed
+                # client) are raised rather than paying for the request twice
+                if e.status_code not in EXPIRED_STATUS_CODES:
+                    raise
+            else:
+                if archive.get('status') != EXPIRED:
+                    return archive.get('data', [])
+
+        submitted = self._transport.api_request(method, path, wait_async=True, async_request=True, use_handle_response=True, watched=True, **kwargs)
+        self._journal.submitted(key, method, path, params, submitted['id'])
+        return self._wait_journaled(key, submitted['id'], params).get('data', [])
+
+    def _wait_journaled(self, key: str, request_id: str, params) -> dict:
+        future = self._transport.watcher.watch(request_id, size_hint=estimate_job_size(params))
+        # recorded before returning, so a crash right after can't lose the results
+        concurrent.futures.wait([future])
+        self._journaled_archive(key, future)
+        return future.result()
+
+    def _cacheable(self, use_handle_response: bool, async_request: bool, params) -> bool:
+        # async submissions, UI tasks and webhooks have side effects beyond returning data
+        return (self._cache is not None and use_handle_response and not async_request
+            and not (isinstance(params, dict) and (params.get('ui') or params.get('webhook'))))
+
+    def _chunks(self, path: str, async_request: bool, use_handle_response: bool, kwargs: dict) -> Optional[List[dict]]:
+        '''Returns request kwargs for each chunk when the query list exceeds the endpoint's limit, otherwise None.'''
+
+        name = 'json' if kwargs.get('json') is not None else 'params'
+        params = kwargs.get(name)
+        if not use_handle_response or async_request or not isinstance(params, dict):
+            return None
+
+        queries = params.get('query')
+        limit = QUERY_LIMITS.get(path, DEFAULT_QUERY_LIMIT)
+        # UI tasks and webhooks have to stay a single request
+        if not isinstance(queries, list) or len(queries) <= limit or params.get('ui') or params.get('webhook'):
+            return None
+
+        return [{**kwargs, name: {**params, 'query': queries[start:start + limit], 'async': True}}
+            for start in range(0, len(queries), limit)]
+
+    def _merge_chunks(self, chunks: List[dict], outcomes: list) -> list:
+        results, errors = [], {}
+        for index, (result, error) in enumerate(outcomes):
+            results.append(result)
+            if error is not None:
+                errors[index] = error
+
+        drop_duplicates = (chunks[0].get('json') or chunks[0].get('params')).get('dropDuplicates')
+        if drop_duplicates:
+            # each chunk is deduplicated by the API, the places returned by an earlier chunk are dropped here
+            results = _drop_duplicates(results)
+
+        if errors:
+            queries = [(chunk.get('json') or chunk.get('params'))['query'] for chunk in chunks]
+            raise ChunkedRequestError(queries, results, errors)
+
+        merged = [item for result in results for item in result]
+        if drop_duplicates and merged and all(isinstance(item, list) for item in merged):
+            # one array of places, as a single deduplicated request returns
+            return [[place for places in merged for place in places]]
+        return merged
+
+    def _request_chunks(self, method: str, path: str, chunks: List[dict]) -> list:
+        def send(chunk_kwargs):
+            try:
+                return self._request(method, path, wait_async=True, **chunk_kwargs), None
+            except Exception as e:
+                return None, e
+
+        with ThreadPoolExecutor(min(self._chunk_concurrency, len(chunks)), thread_name_prefix='outscraper-chunk') as executor:
+            return self._merge_chunks(chunks, list(executor.map(send, chunks)))
 
     def _request(self, method: str, path: str, *, wait_async: bool = False, async_request: bool = False, use_handle_response: bool = True, **kwargs):
-        return self._transport.api_request(method,
-            path,
-            wait_async=wait_async,
-            async_request=async_request,
-            use_handle_response=use_handle_response,
-            **kwargs,
-        )
+        chunks = self._chunks(path, async_request, use_handle_response, kwargs)
+        if chunks:
+            return self._request_chunks(method, path, chunks)
+
+        params = kwargs.get('params') or kwargs.get('json')
+        cacheable = self._cacheable(use_handle_response, async_request, params)
+
+        if cacheable:
+            cached, cache_key, query_order = self._cache.lookup(method, path, params)
+            if cached is not MISSING:
+                return cached
+
+        def send():
+            if self._journaled(wait_async, async_request, use_handle_response, params):
+                return self._request_journaled(method, path, kwargs)
+
+            return self._transport.api_request(method,
+                path,
+                wait_async=wait_async,
+                async_request=async_request,
+                use_handle_response=use_handle_response,
+                **kwargs,
+            )
+
+        flight_key = self._single_flight and self._flight_key(method, path, wait_async, async_request, use_handle_response, kwargs)
+        result = self._single_flight.do(flight_key, send) if flight_key else send()
+
+        if cacheable:
+            self._cache.store(method, path, params, result, cache_key, query_order)
+        return result
 
     def get_tasks(self, query: str = '', last_id: str = '', page_size: int = 10) -> Tuple[list, bool]:
         '''
@@ -53,16 +413,18 @@ class OutscraperClient(object):
             'pageSize': page_size,
         }
         response: requests.Response = self._request('GET', '/tasks', use_handle_response=False, params=params)
+        return self._tasks_result(response)
 
+    def _tasks_result(self, response: requests.Response) -> Tuple[list, bool]:
         if 199 < response.status_code < 300:
             data = response.json()
 
             if 'errorMessage' in data:
-                raise Exception(f'Error: {data["errorMessage"]}')
+                raise APIResponseError(f'Error: {data["errorMessage"]}', data['errorMessage'], status_code=response.status_code)
 
             return data['tasks'], data['has_more']
 
-        raise Exception(f'Response status code: {response.status_code}')
+        raise status_error(response)
 
     def get_requests_history(self, type: str = 'running', skip: int = 0, page_size: int = 25) -> list:
         '''
@@ -85,31 +447,134 @@ class OutscraperClient(object):
             'pageSize': page_size,
         }
         response: requests.Response = self._request('GET', '/requests', use_handle_response=False, params=params)
+        return self._json_result(response)
 
-        if 199 < response.status_code < 300:
-            return response.json()
+    def iter_requests_history(self, type: str = 'running', page_size: int = 100, limit: Optional[int] = None,
+        concurrency: int = 4) -> Iterator[dict]:
+        '''
+            Iterate over the requests history page by page (see `get_requests_history()`), without duplicates.
 
-        raise Exception(f'Response status code: {response.status_code}')
+                Parameters:
+                    type (str): parameter allows you to filter requests by type (running/finished).
+                    page_size (int): requests per page, up to 100. Default: 100.
+                    limit (int | None): maximum number of requests to read. With a limit, up to `concurrency` pages are
+                        requested at once. Default: None (all requests).
+                    concurrency (int): pages requested at once when `limit` is set. Default: 4.
 
-    def get_request_archive(self, request_id: str) -> dict:
+                Yields:
+                    request (dict): each request of the history.
+        '''
+
+        fetch = lambda skip: self._page_items(self.get_requests_history(type=type, skip=skip, page_size=page_size))
+        return iter_offsets(fetch, page_size, limit=limit, concurrency=concurrency, key=first_key('id'))
+
+    def _page_items(self, result: Union[list, dict]) -> list:
+        '''Items of one page of a listing: the results of its only query, or the list itself.'''
+
+        if isinstance(result, dict):
+            result = result.get('data') or result.get('requests') or []
+        if len(result) == 1 and isinstance(result[0], list):
+            return result[0]
+        return result
+
+    def get_request_archive(self, request_id: str, export_path: str = None) -> Union[dict, str]:
         '''
             Fetch request data from the archive
 
                 Parameters:
                     request_id (str): unique id for the request provided by ['id']
+                    export_path (str): if provided, the raw archive is written to this file instead of being decoded, see `export_request_archive()`.
 
                 Returns:
-                    dict: result from the archive
+                    dict: result from the archive (or the path of the exported file)
 
             See: https://app.outscraper.com/api-docs#tag/Requests/paths/~1requests~1{requestId}/get
         '''
 
+        if export_path:
+            return self.export_request_archive(request_id, export_path)
+
         response = self._request('GET', f'/requests/{request_id}',  use_handle_response=False)
+        return self._json_result(response)
+
+    def iter_request_archive(self, request_id: str, flatten: bool = True) -> Iterator:
+        '''
+            Stream the results of an async request: waits until the request is finished and yields the records of its
+            archive while it downloads, instead of decoding the whole archive in memory.
+
+                Parameters:
+                    request_id (str): id for the request provided by the async endpoint call.
+                    flatten (bool): whether to yield the records of each query one by one instead of a list per query. Default: True.
+
+                Returns:
+                    iterator: records of the archive's `data`.
+        '''
+
+        return self._transport.iter_archive(request_id, flatten=flatten)
+
+    def iter_results(self, endpoint: str, *args, flatten: bool = True, **kwargs) -> Iterator:
+        '''
+            Run an endpoint as an async request and stream its results, see `iter_request_archive()`.
+            ```python
+            for review in client.iter_results('google_maps_reviews', place_ids, reviews_limit=0):
+                ...
+            ```
+
+                Parameters:
+                    endpoint (str): name of an endpoint method that supports `async_request` (e.g., "google_maps_reviews").
+                    args, kwargs: arguments of the endpoint method.
+                    flatten (bool): whether to yield the records of each query one by one instead of a list per query. Default: True.
+        '''
+
+        request = self._async_endpoint_request(endpoint, args, kwargs)
+        return self._transport.iter_archive(request['id'], flatten=flatten)
+
+    def export_request_archive(self, request_id: str, path: str) -> str:
+        '''
+            Wait for an async request and save its raw archive (JSON) to a file without decoding it in memory.
+            Compressed transfer is used when available and interrupted downloads are resumed.
+            Use `outscraper.read_archive(path)` to walk the saved records later.
+
+                Parameters:
+                    request_id (str): id for the request provided by the async endpoint call.
+                    path (str): file to write the archive to.
 
+                Returns:
+                    str: the path of the file.
+        '''
+
+        return self._transport.export_archive(request_id, path)
+
+    def export(self, endpoint: str, path: str, *args, **kwargs) -> str:
+        '''
+            Run an endpoint as an async request and save its raw archive to a file, see `export_request_archive()`.
+            ```python
+            client.export('google_maps_reviews', 'reviews.json', place_ids, reviews_limit=0)
+            ```
+
+                Parameters:
+                    endpoint (str): name of an endpoint method that supports `async_request` (e.g., "google_maps_reviews").
+                    path (str): file to write the archive to.
+                    args, kwargs: arguments of the endpoint method.
+
+                Returns:
+                    str: the path of the file.
+        '''
+
+        request = self._async_endpoint_request(endpoint, args, kwargs)
+        return self._transport.export_archive(request['id'], path)
+
+    def _async_endpoint_request(self, endpoint: str, args: tuple, kwargs: dict):
+        method = self._endpoint_method(endpoint)
+        if 'async_request' not in signature(method).parameters:
+            raise ValueError(f'{endpoint} does not support async requests')
+        return method(self, *args, async_request=True, **kwargs)
+
+    def _json_result(self, response: requests.Response) -> Union[list, dict]:
         if 199 < response.status_code < 300:
             return response.json()
 
-        raise Exception(f'Response status code: {response.status_code}')
+        raise status_error(response)
 
     @cached_property
     def businesses(self):
@@ -282,6 +747,144 @@ class OutscraperClient(object):
 
         return self._request('POST', '/google-maps-search', wait_async=wait_async, async_request=async_request, json=payload)
 
+    def iter_google_maps_search(self, query: str, page_size: int = 100, limit: int = MAPS_SEARCH_RESULTS_LIMIT, concurrency: int = 4,
+        language: str = 'en', region: Optional[str] = None, coordinates: str = '', enrichment: Optional[list] = None,
+        fields: Union[list, str] = None) -> Iterator[dict]:
+        '''
+            Iterate over the places of one Google Maps search, page by page through `skip`.
+
+            A search returns at most about 400 places, so the pages up to `limit` are known in advance and up to
+            `concurrency` of them are requested at once; iteration stops at the first short page. Places that several
+            pages return are yielded once (by place_id/google_id).
+            ```python
+            for place in client.iter_google_maps_search('restaurants brooklyn usa', page_size=100):
+                ...
+            ```
+
+                Parameters:
+                    query (str): the search, see `google_maps_search()`.
+                    page_size (int): places per request, a multiple of 20. Default: 100.
+                    limit (int): maximum number of places to read. Default: 400.
+                    concurrency (int): pages requested at once. Default: 4.
+                    language, region, coordinates, enrichment, fields: see `google_maps_search()`.
+
+                Yields:
+                    place (dict): each place found.
+        '''
+
+        if page_size % 20:
+            raise ValueError('page_size must be a multiple of 20')
+
+        fetch = lambda skip: self._page_items(self.google_maps_search(query, limit=page_size, skip=skip, language=language,
+            region=region, coordinates=coordinates, enrichment=enrichment, fields=fields))
+        return iter_offsets(fetch, page_size, limit=limit, concurrency=concurrency, key=first_key('place_id', 'google_id'))
+
+    def iter_google_maps_search_area(self, query: str, area: Union[Area, AreaLike], cell_size_km: float = 2.0,
+        tile_limit: int = MAPS_SEARCH_RESULTS_LIMIT, min_cell_size_km: float = 0.25, concurrency: int = 4, clip: bool = True,
+        language: str = 'en', region: Optional[str] = None, enrichment: Optional[list] = None,
+        fields: Union[list, str] = None, split_threshold: Optional[int] = None, tile_retries: int = 1) -> Iterator[dict]:
+        '''
+            Search a whole area (e.g., all restaurants of a city) past the ~400 places limit of one Google Maps search.
+
+            The area is covered with a grid of tiles, each searched with its own `coordinates`; a tile that returns at
+            least `split_threshold` places (the search was likely capped) is split into four smaller tiles, which are
+            searched in turn.
+            Tiles are searched `concurrency` at a time and places are yielded as tiles complete, once each
+            (by place_id/google_id). A tile that keeps failing doesn't stop the search: once all other tiles are done,
+            `TileSearchError` lists the failed tiles.
+            ```python
+            brooklyn = (40.5707, -74.0421, 40.7395, -73.8334)  # south, west, north, east
+            for place in client.iter_google_maps_search_area('restaurants', brooklyn, concurrency=8):
+                ...
+            ```
+
+                Parameters:
+                    query (str): category to search (e.g., restaurants), without a location.
+                    area (tuple | list | Area): bounding box (south, west, north, east) or polygon of (latitude, longitude).
+                    cell_size_km (float): side of the tiles of the initial grid. Default: 2.
+                    tile_limit (int): places requested per tile. Default: 400.
+                    min_cell_size_km (float): tiles are not split below this size. Default: 0.25.
+                    concurrency (int): tiles searched at once. Default: 4.
+                    clip (bool): whether to drop places located outside of the area. Default: True.
+                    language, region, enrichment, fields: see `google_maps_search()`.
+                    split_threshold (int | None): places from which a tile is split. Default: 80% of `tile_limit`.
+                    tile_retries (int): times a failed tile is searched again before it is given up. Default: 1.
+
+                Yields:
+                    place (dict): each place found in the area.
+        '''
+
+        if not isinstance(area, Area):
+            area = Area(area)
+        split_threshold = self._split_threshold(tile_limit, split_threshold)
+
+        search = lambda tile: self._page_items(self.google_maps_search(query, limit=tile_limit, coordinates=tile.coordinates,
+            language=language, region=region, enrichment=enrichment, fields=fields))
+        return self._iter_tiles(search, area, plan_tiles(area, cell_size_km), split_threshold, min_cell_size_km, concurrency, clip,
+            tile_retries)
+
+    def _split_threshold(self, tile_limit: int, split_threshold: Optional[int]) -> int:
+        if split_threshold is None:
+            split_threshold = max(1, int(tile_limit * TILE_SPLIT_RATIO))
+        if not 0 < split_threshold <= tile_limit:
+            raise ValueError('split_threshold must be in range [1, tile_limit]')
+        return split_threshold
+
+    def _iter_tiles(self, search, area: Area, tiles: List[Tile], split_threshold: int, min_cell_size_km: float, concurrency: int,
+        clip: bool, tile_retries: int) -> Iterator[dict]:
+        executor = ThreadPoolExecutor(concurrency, thread_name_prefix='outscraper-tiles')
+        # tile and its attempt by search future
+        pending = {executor.submit(search, tile): (tile, 1) for tile in tiles}
+        seen = set()
+        failed = []
+
+        try:
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    tile, attempt = pending.pop(future)
+                    try:
+                        places = future.result()
+                    except Exception as e:
+                        if attempt <= tile_retries:
+                            pending[executor.submit(search, tile)] = (tile, attempt + 1)
+                        else:
+                            failed.append((tile, e))
+                        continue
+
+                    for child in self._split_capped_tile(area, tile, places, split_threshold, min_cell_size_km):
+                        pending[executor.submit(search, child)] = (child, 1)
+
+                    yield from self._new_places(area, places, seen, clip)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if failed:
+            raise TileSearchError(failed)
+
+    def _split_capped_tile(self, area: Area, tile: Tile, places: list, split_threshold: int, min_cell_size_km: float) -> List[Tile]:
+        if len(places) < split_threshold or tile.size_km / 2 < min_cell_size_km:
+            return []
+        return [child for child in tile.split() if area.intersects(child)]
+
+    def _new_places(self, area: Area, places: list, seen: set, clip: bool) -> Iterator[dict]:
+        for place in places:
+            if clip and not self._in_area(area, place):
+                continue
+
+            # a tile may return a place with only one of its ids: both are remembered, and either one marks a duplicate
+            keys = [(field, place[field]) for field in ('place_id', 'google_id') if place.get(field) is not None]
+            new = not any(key in seen for key in keys)
+            seen.update(keys)
+            if new:
+                yield place
+
+    def _in_area(self, area: Area, place: dict) -> bool:
+        lat, lng = place.get('latitude'), place.get('longitude')
+        if not isinstance(lat, (int, float)) or not isinstance(lng, (int, float)):
+            return True
+        return area.contains(lat, lng)
+
     def google_maps_directions(self, query: Union[list, str], departure_time: int = None, finish_time: int = None, interval: int = 60, travel_mode: str = 'best',
         language: str = 'en', region: str = None, fields: Union[list, str] = None, async_request: bool = False,
         ui: bool = None, webhook: str = None
@@ -439,6 +1042,75 @@ class OutscraperClient(object):
 
         return self._request('GET', '/maps/reviews-v3', wait_async=wait_async, async_request=async_request, params=params)
 
+    def iter_google_maps_reviews(self, query: str, page_size: int = 100, reviews_limit: int = 0, prefetch: int = 1,
+        sort: str = 'most_relevant', start: int = None, cutoff: int = None, cutoff_rating: int = None, ignore_empty: bool = False,
+        language: str = 'en', region: str = None, reviews_query: str = None, source: str = None,
+        last_pagination_id: str = None) -> Iterator[dict]:
+        '''
+            Iterate over the reviews of one place, page by page (auto-pagination through `last_pagination_id`).
+
+            Each page is a real time `google_maps_reviews()` request of `page_size` reviews; reviews are yielded as soon
+            as their page arrives and the next page is requested in the background meanwhile, so the first reviews come
+            quickly and memory stays bounded even for places with 100k+ reviews.
+            ```python
+            for review in client.iter_google_maps_reviews('ChIJrc9T9fpYwokRdvjYRHT8nI4', sort='newest'):
+                ...
+            ```
+
+                Parameters:
+                    query (str): the place: google_id, place_id, url or search query (the first place found is used).
+                    page_size (int): reviews per request, up to 499 to stay within the real time mode. Default: 100.
+                    reviews_limit (int): maximum number of reviews to yield (0 - unlimited). Default: 0.
+                    prefetch (int): pages fetched ahead of the consumer; 0 requests each page only when it is needed. Default: 1.
+                    sort, start, cutoff, cutoff_rating, ignore_empty, language, region, reviews_query, source:
+                        see `google_maps_reviews()`.
+                    last_pagination_id (str): review_pagination_id of the review to continue after. Default: None.
+
+                Yields:
+                    review (dict): each review of the place, in the order of `sort`.
+        '''
+
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1')
+
+        def fetch(last_pagination_id: Optional[str]) -> Tuple[list, Optional[str]]:
+            result = self.google_maps_reviews(query, reviews_limit=page_size, sort=sort, start=start, cutoff=cutoff,
+                cutoff_rating=cutoff_rating, ignore_empty=ignore_empty, language=language, region=region,
+                reviews_query=reviews_query, source=source, last_pagination_id=last_pagination_id)
+            return self._reviews_page(result, page_size)
+
+        return self._limited_reviews(iter_pages(fetch, last_pagination_id, prefetch), reviews_limit)
+
+    def _reviews_page(self, result: list, page_size: int) -> Tuple[list, Optional[str]]:
+        '''Reviews of the place of a `google_maps_reviews()` result, with the pagination id of the next page.'''
+
+        places = result[0] if result and isinstance(result[0], list) else result
+        place = places[0] if places else {}
+        reviews = place.get('reviews_data') or []
+
+        last_pagination_id = reviews[-1].get('review_pagination_id') if reviews else None
+        if len(reviews) < page_size or not last_pagination_id:
+            return reviews, LAST_PAGE
+        return reviews, last_pagination_id
+
+    def _limited_reviews(self, pages: Iterator[list], reviews_limit: int) -> Iterator[dict]:
+        yielded = 0
+        previous_ids = set()
+
+        with closing(pages):
+            for reviews in pages:
+                reviews, previous_ids = self._new_reviews(reviews, previous_ids)
+                for review in reviews:
+                    yield review
+                    yielded += 1
+                    if yielded == reviews_limit:
+                        return
+
+    def _new_reviews(self, reviews: list, previous_ids: set) -> Tuple[list, set]:
+        # a page may start with the review it continues after
+        new_reviews = [review for review in reviews if review.get('review_id') is None or review['review_id'] not in previous_ids]
+        return new_reviews, {review['review_id'] for review in reviews if review.get('review_id') is not None}
+
     def google_maps_photos(self, query: Union[list, str], photosLimit: int = 100, limit: int = 1, tag: str = None, language: str = 'en',
         region: str = None, fields: Union[list, str] = None, async_request: bool = False, ui: bool = None, webhook: str = None
     ) -> list:
@@ -1251,6 +1923,27 @@ class OutscraperClient(object):
 
         return self._request('GET', '/trustpilot', wait_async=wait_async, async_request=async_request, params=params)
 
+    def iter_trustpilot_search(self, query: str, page_size: int = 100, limit: Optional[int] = None, concurrency: int = 4,
+        enrichment: list = None, fields: Union[list, str] = None) -> Iterator[dict]:
+        '''
+            Iterate over the results of one Trustpilot search, page by page through `skip`, without duplicates.
+
+                Parameters:
+                    query (str): Company or category to search on Trustpilot (e.g., real estate).
+                    page_size (int): items per request. Default: 100.
+                    limit (int | None): maximum number of items to read. With a limit, up to `concurrency` pages are
+                        requested at once. Default: None (all items).
+                    concurrency (int): pages requested at once when `limit` is set. Default: 4.
+                    enrichment, fields: see `trustpilot_search()`.
+
+                Yields:
+                    item (dict): each search result.
+        '''
+
+        fetch = lambda skip: self._page_items(self.trustpilot_search(query, limit=page_size, skip=skip, enrichment=enrichment,
+            fields=fields))
+        return iter_offsets(fetch, page_size, limit=limit, concurrency=concurrency, key=first_key('domain', 'url'))
+
     def trustpilot(self, query: Union[list, str], enrichment: list = None, fields: Union[list, str] = None, async_request: bool = False, ui: bool = None, webhook: str = None) -> Union[list, dict]:
         '''
             Trustpilot
@@ -0,0 +1,177 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from hashlib import blake2b
+from math import ceil, log
+from threading import Lock
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Sequence
+
+
+# identifiers of a place or business; records sharing any of them are the same entity
+DEDUP_KEYS = ('place_id', 'google_id', 'os_id')
+
+
+class Deduplicator(ABC):
+    def __init__(self, keys: Sequence[str] = DEDUP_KEYS) -> None:
+        '''
+            Streaming deduplication of records across requests (e.g., chunks, pages or map tiles of one crawl).
+
+            A record is a duplicate when any of its identifiers was seen before; all its identifiers are remembered,
+            so the same entity is recognized under each of them. Records without identifiers are always kept.
+            ```python
+            dedup = ExactDeduplicator()
+            for place in dedup.filter(client.iter_results('google_maps_search', queries, limit=400)):
+                ...
+            ```
+
+                Parameters:
+                    keys (sequence[str]): record fields identifying an entity. Default: ("place_id", "google_id", "os_id").
+        '''
+
+        self.keys = tuple(keys)
+        self.unique = 0
+        self.duplicates = 0
+        self._lock = Lock()
+
+    def is_new(self, record: Any) -> bool:
+        '''Whether the record was not seen before; the record is remembered either way.'''
+
+        if not isinstance(record, dict):
+            return True
+
+        keys = [str(record[key]) for key in self.keys if record.get(key)]
+        if not keys:
+            return True
+
+        with self._lock:
+            new = self._add(keys)
+            if new:
+                self.unique += 1
+            else:
+                self.duplicates += 1
+        return new
+
+    def filter(self, records: Iterable[Any]) -> Iterator[Any]:
+        '''Records of a stream that were not seen before, in order.'''
+
+        for record in records:
+            if self.is_new(record):
+                yield record
+
+    async def afilter(self, records: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        '''Async generator version of `filter()`.'''
+
+        async for record in records:
+            if self.is_new(record):
+                yield record
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @abstractmethod
+    def _add(self, keys: List[str]) -> bool:
+        '''Remember the keys, returns whether none of them was known.'''
+
+
+class ExactDeduplicator(Deduplicator):
+    '''Keeps every identifier in memory: no false positives, memory grows with the number of entities.'''
+
+    def __init__(self, keys: Sequence[str] = DEDUP_KEYS) -> None:
+        super().__init__(keys)
+        self._seen = set()
+
+    def _add(self, keys: List[str]) -> bool:
+        new = not any(key in self._seen for key in keys)
+        self._seen.update(keys)
+        return new
+
+
+class BloomDeduplicator(Deduplicator):
+    def __init__(self, capacity: int = 10_000_000, error_rate: float = 0.001, keys: Sequence[str] = DEDUP_KEYS) -> None:
+        '''
+            Keeps identifiers in a Bloom filter of fixed size: memory stays bounded, but a new record is taken for a
+            duplicate with a probability of about `error_rate` (more once over `capacity` identifiers).
+
+                Parameters:
+                    capacity (int): number of identifiers the filter is sized for. Default: 10,000,000.
+                    error_rate (float): false positive probability at capacity. Default: 0.001.
+                    keys (sequence[str]): see `Deduplicator`.
+        '''
+
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError('capacity must be positive and error_rate in range (0, 1)')
+
+        super().__init__(keys)
+        self._size = ceil(-capacity * log(error_rate) / log(2) ** 2)
+        self._hashes = range(max(1, round(self._size / capacity * log(2))))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    @property
+    def memory(self) -> int:
+        '''Size of the filter in bytes.'''
+
+        return len(self._bits)
+
+    def _add(self, keys: List[str]) -> bool:
+        new = True
+        bits, size, hashes = self._bits, self._size, self._hashes
+        for key in keys:
+            # double hashing: the positions of a key are first + i * step
+            digest = blake2b(key.encode(), digest_size=16).digest()
+            position = int.from_bytes(digest[:8], 'little') % size
+            step = int.from_bytes(digest[8:], 'little') % size or 1
+
+            # a key is known when all its bits were already set
+            known = True
+            for _ in hashes:
+                byte, bit = position >> 3, 1 << (position & 7)
+                if not bits[byte] & bit:
+                    bits[byte] |= bit
+                    known = False
+                position = (position + step) % size
+            if known:
+                new = False
+        return new
+
+
+class DiskDeduplicator(Deduplicator):
+    def __init__(self, path: str, keys: Sequence[str] = DEDUP_KEYS, commit_every: int = 10000) -> None:
+        '''
+            Keeps identifiers in a SQLite file: exact, memory stays bounded, and the identifiers seen survive the run,
+            so a resumed crawl skips the entities it already got.
+
+                Parameters:
+                    path (str): path to the database file.
+                    keys (sequence[str]): see `Deduplicator`.
+                    commit_every (int): records between commits. Default: 10000.
+        '''
+
+        super().__init__(keys)
+        self._commit_every = commit_every
+        self._uncommitted = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY) WITHOUT ROWID')
+
+    def _add(self, keys: List[str]) -> bool:
+        new = True
+        for key in keys:
+            if self._connection.execute('INSERT OR IGNORE INTO seen (key) VALUES (?)', (key,)).rowcount == 0:
+                new = False
+
+        self._uncommitted += 1
+        if self._uncommitted >= self._commit_every:
+            self._connection.commit()
+            self._uncommitted = 0
+        return new
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
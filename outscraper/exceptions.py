@@ -0,0 +1,117 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class OutscraperError(Exception):
+    '''Base class of the errors raised by the SDK.'''
+
+
+class ChunkedRequestError(OutscraperError):
+    def __init__(self, chunks: List[list], results: List[Optional[list]], errors: Dict[int, BaseException]) -> None:
+        '''
+            Raised when some chunks of a request split by the client failed. The results of the other chunks are kept.
+
+                Parameters:
+                    chunks (list[list]): queries of each chunk, in the original order.
+                    results (list[list | None]): results of each chunk, None for the failed ones.
+                    errors (dict[int, Exception]): errors by chunk index.
+        '''
+
+        super().__init__(f'{len(errors)} of {len(chunks)} chunks failed: ' + '; '.join(
+            f'chunk {index}: {error}' for index, error in sorted(errors.items())))
+        self.chunks = chunks
+        self.results = results
+        self.errors = errors
+
+    @property
+    def data(self) -> list:
+        '''Merged results of the successful chunks.'''
+
+        return [item for result in self.results if result is not None for item in result]
+
+    @property
+    def failed_queries(self) -> list:
+        '''Queries of the failed chunks, to be retried.'''
+
+        return [query for index in sorted(self.errors) for query in self.chunks[index]]
+
+
+class TileSearchError(OutscraperError):
+    def __init__(self, errors: List[Tuple[Any, BaseException]]) -> None:
+        '''
+            Raised once an area search has gone through all its other tiles, when some tiles still failed after their
+            retries. The places of the other tiles have been yielded.
+
+                Parameters:
+                    errors (list[tuple[Tile, Exception]]): the failed tiles with their last error.
+        '''
+
+        super().__init__(f'{len(errors)} tiles failed: ' + '; '.join(f'{tile.coordinates}: {error}' for tile, error in errors))
+        self.errors = errors
+
+    @property
+    def tiles(self) -> list:
+        '''The failed tiles, to be searched again.'''
+
+        return [tile for tile, _ in self.errors]
+
+
+class RateLimitExceeded(OutscraperError):
+    def __init__(self, method: str, path: str, retry_after: float) -> None:
+        '''
+            Raised by a non-blocking `RateLimiter` when a request doesn't fit the client-side limits.
+
+                Parameters:
+                    method (str): HTTP method of the rejected request.
+                    path (str): API path of the rejected request.
+                    retry_after (float): approximate seconds until the request would fit.
+        '''
+
+        super().__init__(f'rate limit exceeded for {method} {path}, retry in {retry_after:.2f}s')
+        self.method = method
+        self.path = path
+        self.retry_after = retry_after
+
+
+class ClientClosedError(OutscraperError):
+    '''The client was closed while a request was still pending.'''
+
+
+class APIError(OutscraperError):
+    def __init__(self, message: str, *, status_code: Optional[int] = None, mirror: Optional[str] = None, attempts: int = 1) -> None:
+        '''
+            Error of an API request.
+
+                Parameters:
+                    message (str): error description.
+                    status_code (int | None): HTTP status of the last response, None if no response was received.
+                    mirror (str | None): API URL of the last attempt.
+                    attempts (int): number of attempts made, including retries.
+        '''
+
+        super().__init__(message)
+        self.status_code = status_code
+        self.mirror = mirror
+        self.attempts = attempts
+
+
+class HTTPStatusError(APIError):
+    '''The API responded with a non-2xx status (after any retries).'''
+
+
+class APIResponseError(APIError):
+    '''The API responded with `"error": true`, `errorMessage` is the message from the API.'''
+
+    def __init__(self, message: str, error_message: Optional[str] = None, **kwargs) -> None:
+        super().__init__(message, **kwargs)
+        self.error_message = error_message
+
+
+class APIConnectionError(APIError):
+    '''No mirror could be reached (after any retries).'''
+
+
+def status_error(response) -> HTTPStatusError:
+    '''HTTPStatusError for a non-2xx response returned by `OutscraperTransport.api_request()`.'''
+
+    return HTTPStatusError(f'Response status code: {response.status_code}', status_code=response.status_code,
+        mirror=getattr(response, 'mirror', None), attempts=getattr(response, 'attempts', 1))
@@ -0,0 +1,45 @@
+import json
+import mmap
+import os
+from typing import Any, Iterator
+
+from .streaming import JSONStream
+
+
+# archives of pending requests are tiny; files up to this size are decoded to check whether the request is finished
+PENDING_PROBE_SIZE = 64 * 1024
+
+
+def is_pending_archive(path: str) -> bool:
+    if os.path.getsize(path) > PENDING_PROBE_SIZE:
+        return False
+
+    with open(path, 'rb') as file:
+        try:
+            archive = json.load(file)
+        except ValueError:
+            return False
+    return isinstance(archive, dict) and archive.get('status') == 'Pending'
+
+
+def read_archive(path: str, flatten: bool = True, chunk_size: int = 1024 * 1024) -> Iterator[Any]:
+    '''
+        Walk an archive saved by `export_request_archive()` without loading it: the file is memory-mapped and its
+        records are decoded one by one, see `JSONStream`.
+
+            Parameters:
+                path (str): path to the exported archive.
+                flatten (bool): whether to yield the records of each query one by one instead of a list per query. Default: True.
+                chunk_size (int): bytes handed to the parser at a time. Default: 1 MiB.
+
+            Returns:
+                iterator: records of the archive's `data`.
+    '''
+
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            chunks = (view[start:start + chunk_size] for start in range(0, len(view), chunk_size))
+            yield from JSONStream(chunks, flatten=flatten)
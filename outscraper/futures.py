@@ -0,0 +1,109 @@
+from concurrent import futures
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, FIRST_EXCEPTION, Future
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Set
+
+
+class RequestHandle(Future):
+    '''
+        Future of an Outscraper request returned by `OutscraperClient.submit()`.
+
+        `result()` returns the same data the blocking endpoint would return. The handle works with
+        `outscraper.wait()`, `outscraper.as_completed()` and anything else that accepts `concurrent.futures.Future`.
+    '''
+
+    def __init__(self, request_id: Optional[str] = None) -> None:
+        super().__init__()
+        self.request_id = request_id
+        self.archive: Optional[dict] = None
+        self._status = 'Pending'
+        self._fetch_status: Optional[Callable[[str], str]] = None
+        self._on_cancel: Optional[Callable[[str], None]] = None
+
+    @classmethod
+    def from_archive(cls, request_id: str, archive_future: Future, fetch_status: Optional[Callable[[str], str]] = None,
+        on_cancel: Optional[Callable[[str], None]] = None) -> 'RequestHandle':
+        handle = cls(request_id)
+        handle._fetch_status = fetch_status
+        handle._on_cancel = on_cancel
+        archive_future.add_done_callback(handle._resolve)
+        return handle
+
+    @classmethod
+    def resolved(cls, data) -> 'RequestHandle':
+        handle = cls()
+        handle._status = 'Success'
+        handle.set_result(data)
+        return handle
+
+    def status(self) -> str:
+        '''
+            Request status as reported by the request archive: "Pending" until the request is finished, then e.g. "Success".
+            While the handle is not done, every call asks the API for the current status.
+        '''
+
+        if not self.done() and self._fetch_status is not None:
+            status = self._fetch_status(self.request_id)
+            if not self.done():
+                self._status = status
+        return self._status
+
+    def cancel(self) -> bool:
+        '''
+            Stop waiting for the request: its archive is no longer polled. The request itself keeps running on the API.
+        '''
+
+        if self.cancelled():
+            return True
+        if not super().cancel():
+            return False
+
+        self._status = 'Cancelled'
+        if self._on_cancel is not None:
+            self._on_cancel(self.request_id)
+        return True
+
+    def _resolve(self, archive_future: Future) -> None:
+        if self.cancelled():
+            return
+
+        exception = archive_future.exception()
+        if exception is not None:
+            self._status = 'Failed'
+            self.set_exception(exception)
+            return
+
+        self.archive = archive_future.result()
+        self._status = self.archive.get('status')
+        self.set_result(self.archive.get('data', []))
+
+    def __repr__(self) -> str:
+        return f'<RequestHandle {self.request_id} {self._status}>'
+
+
+def wait(handles: Iterable[Future], timeout: Optional[float] = None, return_when: str = ALL_COMPLETED) -> Tuple[Set[Future], Set[Future]]:
+    '''
+        Wait for request handles to complete.
+
+            Parameters:
+                handles (iterable[RequestHandle]): handles returned by `submit()`.
+                timeout (float | None): maximum number of seconds to wait. Default: None (no limit).
+                return_when (str): FIRST_COMPLETED, FIRST_EXCEPTION or ALL_COMPLETED (default).
+
+            Returns:
+                (done, not_done): named tuple of two sets of handles.
+    '''
+
+    return futures.wait(handles, timeout=timeout, return_when=return_when)
+
+
+def as_completed(handles: Iterable[Future], timeout: Optional[float] = None) -> Iterator[Future]:
+    '''
+        Iterate over request handles as they complete, regardless of submission order.
+
+            Parameters:
+                handles (iterable[RequestHandle]): handles returned by `submit()`.
+                timeout (float | None): maximum number of seconds to wait for all handles. Default: None (no limit).
+    '''
+
+    return futures.as_completed(handles, timeout=timeout)
+
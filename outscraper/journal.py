@@ -0,0 +1,110 @@
+import json
+import sqlite3
+from dataclasses import dataclass
+from threading import Lock
+from time import time
+from typing import Any, List, Optional
+
+
+PENDING = 'Pending'
+SUCCESS = 'Success'
+FAILED = 'Failed'
+# archive status and HTTP statuses of requests whose results are no longer kept, only these are submitted again
+EXPIRED = 'Expired'
+EXPIRED_STATUS_CODES = (404, 410)
+
+
+@dataclass
+class JournalEntry:
+    key: str
+    method: str
+    path: str
+    params: Any
+    request_id: str
+    status: str
+    submitted_at: float
+    updated_at: float
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        # requests that ended with any other status are submitted again
+        return self.status == SUCCESS
+
+
+class JobJournal:
+    def __init__(self, path: str) -> None:
+        '''
+            SQLite journal of the async requests a client waits for, so a batch run can be resumed after a crash.
+
+            Every submitted request is recorded with its endpoint, parameters hash and request id before the client starts
+            waiting for it, and its results are stored once downloaded. A client with the same journal returns stored
+            results instead of submitting a request again, and waits for a request that is still pending instead of
+            submitting a new one. `OutscraperClient.resume_jobs()` collects all pending requests at once.
+
+            ```python
+            client = OutscraperClient(api_key='SECRET_API_KEY', journal=JobJournal('outscraper-jobs.sqlite3'))
+            ```
+
+                Parameters:
+                    path (str): path to the database file.
+        '''
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS jobs (key TEXT PRIMARY KEY, method TEXT, path TEXT, params TEXT, '
+            'request_id TEXT, status TEXT, results TEXT, error TEXT, submitted_at REAL, updated_at REAL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status)')
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[JournalEntry]:
+        with self._lock:
+            row = self._connection.execute(f'SELECT {self._columns} FROM jobs WHERE key = ?', (key,)).fetchone()
+        return self._entry(row) if row else None
+
+    def results(self, key: str) -> Any:
+        with self._lock:
+            row = self._connection.execute('SELECT results FROM jobs WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else None
+
+    def pending(self) -> List[JournalEntry]:
+        return self.entries(PENDING)
+
+    def entries(self, status: Optional[str] = None) -> List[JournalEntry]:
+        query = f'SELECT {self._columns} FROM jobs'
+        with self._lock:
+            if status is None:
+                rows = self._connection.execute(query + ' ORDER BY submitted_at').fetchall()
+            else:
+                rows = self._connection.execute(query + ' WHERE status = ? ORDER BY submitted_at', (status,)).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def submitted(self, key: str, method: str, path: str, params: Any, request_id: str) -> None:
+        now = time()
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO jobs (key, method, path, params, request_id, status, submitted_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (key, method, path, json.dumps(params, default=str), request_id, PENDING, now, now))
+
+    def finished(self, key: str, status: str, results: Any) -> None:
+        serialized = json.dumps(results, separators=(',', ':'))
+        with self._lock:
+            self._connection.execute('UPDATE jobs SET status = ?, results = ?, error = NULL, updated_at = ? WHERE key = ?',
+                (status or SUCCESS, serialized, time(), key))
+
+    def failed(self, key: str, error: BaseException) -> None:
+        with self._lock:
+            self._connection.execute('UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE key = ?', (FAILED, str(error), time(), key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute('DELETE FROM jobs')
+
+    def close(self) -> None:
+        self._connection.close()
+
+    _columns = 'key, method, path, params, request_id, status, submitted_at, updated_at, error'
+
+    @staticmethod
+    def _entry(row: tuple) -> JournalEntry:
+        key, method, path, params, request_id, status, submitted_at, updated_at, error = row
+        return JournalEntry(key, method, path, json.loads(params) if params else None, request_id, status, submitted_at, updated_at, error)
@@ -0,0 +1,167 @@
+from threading import Lock, Thread, Event
+from time import monotonic
+from typing import Callable, Dict, List, Optional
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class MirrorStats:
+    __slots__ = ('url', 'index', 'latency', 'error_rate', 'consecutive_failures', 'state', 'opened_at', 'probe_started_at',
+        'requests', 'errors')
+
+    def __init__(self, url: str, index: int) -> None:
+        self.url = url
+        self.index = index
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        # when the trial request of a half-open circuit was let through, None if there is none
+        self.probe_started_at: Optional[float] = None
+        self.requests = 0
+        self.errors = 0
+
+    def to_dict(self) -> dict:
+        return {
+            'latency': self.latency,
+            'error_rate': self.error_rate,
+            'consecutive_failures': self.consecutive_failures,
+            'state': self.state,
+            'requests': self.requests,
+            'errors': self.errors,
+        }
+
+
+class MirrorSelector:
+    def __init__(self, urls: List[str], *, alpha: float = 0.3, failure_threshold: int = 3, recovery_time: float = 30.0,
+        probe: Optional[Callable[[str], float]] = None) -> None:
+        '''
+            Ranks API mirrors by EWMA latency and error rate and keeps a circuit breaker per mirror.
+
+            A mirror's circuit opens after `failure_threshold` consecutive failures. Open mirrors are only used
+            as a last resort and are probed in a background thread every `recovery_time` seconds; after
+            `recovery_time` they are also let through again (half-open) for a single trial request that closes the
+            circuit or opens it again, while the other requests keep avoiding the mirror.
+
+            Latency is only sampled from cheap calls (probes, request status and archive calls): the duration of
+            scraping calls depends on the job, not on the mirror.
+
+                Parameters:
+                    urls (list[str]): mirrors in order of preference.
+                    alpha (float): EWMA smoothing factor for latency and error rate. Default: 0.3.
+                    failure_threshold (int): consecutive failures that open a mirror's circuit. Default: 3.
+                    recovery_time (float): seconds before an open circuit is probed again. Default: 30.
+                    probe (callable | None): `probe(url) -> latency` used by the background probe; raises on failure.
+        '''
+
+        self._mirrors: Dict[str, MirrorStats] = {url: MirrorStats(url, index) for index, url in enumerate(urls)}
+        self._alpha = alpha
+        self._failure_threshold = failure_threshold
+        self._recovery_time = recovery_time
+        self._probe = probe
+        self._lock = Lock()
+        self._probe_thread: Optional[Thread] = None
+        self._stopped = Event()
+
+    def ordered(self) -> List[str]:
+        with self._lock:
+            mirrors = self._sorted(monotonic())
+        return [mirror.url for mirror in mirrors]
+
+    def choose(self, tried: List[str]) -> Optional[str]:
+        '''The best mirror not in `tried`, None when all were tried. A half-open mirror is chosen for one request at a time.'''
+
+        now = monotonic()
+        with self._lock:
+            for mirror in self._sorted(now):
+                if mirror.url not in tried:
+                    if mirror.state == HALF_OPEN:
+                        mirror.probe_started_at = now
+                    return mirror.url
+        return None
+
+    def _sorted(self, now: float) -> List[MirrorStats]:
+        for mirror in self._mirrors.values():
+            if mirror.state == OPEN and now - mirror.opened_at >= self._recovery_time:
+                mirror.state = HALF_OPEN
+                mirror.probe_started_at = None
+
+        return sorted(self._mirrors.values(), key=lambda mirror: self._rank(mirror, now))
+
+    def _rank(self, mirror: MirrorStats, now: float) -> tuple:
+        if mirror.latency is None:
+            score = float('inf')
+        else:
+            score = mirror.latency * (1 + 4 * mirror.error_rate)
+
+        # a trial request that never reported back (e.g., it was abandoned) stops blocking the mirror after `recovery_time`
+        probing = (mirror.state == HALF_OPEN and mirror.probe_started_at is not None
+            and now - mirror.probe_started_at < self._recovery_time)
+        return (mirror.state == OPEN or probing, score, mirror.index)
+
+    def record_success(self, url: str, latency: Optional[float] = None) -> None:
+        '''A successful request; `latency` only for calls whose duration reflects the mirror (see the class docstring).'''
+
+        with self._lock:
+            mirror = self._mirrors[url]
+            mirror.requests += 1
+            if latency is not None:
+                mirror.latency = latency if mirror.latency is None else self._alpha * latency + (1 - self._alpha) * mirror.latency
+            mirror.error_rate = (1 - self._alpha) * mirror.error_rate
+            mirror.consecutive_failures = 0
+            mirror.state = CLOSED
+            mirror.probe_started_at = None
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            mirror = self._mirrors[url]
+            mirror.requests += 1
+            mirror.errors += 1
+            mirror.error_rate = self._alpha + (1 - self._alpha) * mirror.error_rate
+            mirror.consecutive_failures += 1
+
+            if mirror.state == HALF_OPEN or mirror.consecutive_failures >= self._failure_threshold:
+                mirror.state = OPEN
+                mirror.opened_at = monotonic()
+                mirror.probe_started_at = None
+                self._start_probing()
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            return {url: mirror.to_dict() for url, mirror in self._mirrors.items()}
+
+    def stop(self) -> None:
+        '''Stop the background probe; it starts again if a circuit opens later (e.g., once the transport is used again).'''
+
+        self._stopped.set()
+
+    def _start_probing(self) -> None:
+        if self._probe is None or (self._probe_thread is not None and self._probe_thread.is_alive()):
+            return
+
+        # each probe thread has its own stop event, so a stopped selector can probe again
+        self._stopped = Event()
+        self._probe_thread = Thread(target=self._probe_loop, args=(self._stopped,), name='outscraper-mirror-probe', daemon=True)
+        self._probe_thread.start()
+
+    def _probe_loop(self, stopped: Event) -> None:
+        while not stopped.wait(self._recovery_time):
+            with self._lock:
+                open_urls = [mirror.url for mirror in self._mirrors.values() if mirror.state != CLOSED]
+
+            if not open_urls:
+                return
+
+            for url in open_urls:
+                try:
+                    latency = self._probe(url)
+                except Exception:
+                    with self._lock:
+                        self._mirrors[url].opened_at = monotonic()
+                    continue
+
+                self.record_success(url, latency)
@@ -0,0 +1,230 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
+from threading import Event, Semaphore, Thread
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Iterator, List, Optional, Tuple
+
+
+# returned by a page fetcher instead of the next cursor after the last page
+LAST_PAGE = object()
+
+PageFetcher = Callable[[Any], Tuple[List[Any], Any]]
+AsyncPageFetcher = Callable[[Any], Awaitable[Tuple[List[Any], Any]]]
+OffsetFetcher = Callable[[int], List[Any]]
+AsyncOffsetFetcher = Callable[[int], Awaitable[List[Any]]]
+ItemKey = Callable[[Any], Optional[Hashable]]
+
+
+def iter_pages(fetch: PageFetcher, cursor: Any = None, prefetch: int = 1) -> Iterator[List[Any]]:
+    '''
+        Pages of a cursor chain, in order. The next page is requested in a background thread as soon as its cursor is
+        known, so fetching overlaps with the processing of the pages already returned.
+
+            Parameters:
+                fetch (callable): returns (items, next cursor or LAST_PAGE) for a cursor.
+                cursor (Any): cursor of the first page. Default: None.
+                prefetch (int): pages fetched ahead of the consumer; 0 fetches each page only when it is needed. Default: 1.
+
+            Yields:
+                items (list): items of each page.
+    '''
+
+    if prefetch < 1:
+        while cursor is not LAST_PAGE:
+            items, cursor = fetch(cursor)
+            yield items
+        return
+
+    pages = SimpleQueue()
+    # one slot per page fetched ahead, a slot is freed when the consumer takes a page
+    slots = Semaphore(prefetch)
+    stopped = Event()
+
+    def produce(cursor: Any) -> None:
+        try:
+            while cursor is not LAST_PAGE:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                items, cursor = fetch(cursor)
+                pages.put((items, None))
+        except BaseException as e:
+            pages.put((None, e))
+        else:
+            pages.put((LAST_PAGE, None))
+
+    Thread(target=produce, args=(cursor,), name='outscraper-prefetch', daemon=True).start()
+
+    try:
+        while True:
+            items, exception = pages.get()
+            if exception is not None:
+                raise exception
+            if items is LAST_PAGE:
+                return
+            slots.release()
+            yield items
+    finally:
+        # an abandoned iteration must not leave the producer blocked or fetching
+        stopped.set()
+        slots.release()
+
+
+async def aiter_pages(fetch: AsyncPageFetcher, cursor: Any = None, prefetch: int = 1) -> AsyncIterator[List[Any]]:
+    '''Async generator version of `iter_pages()`; the pages are fetched ahead by a task on the running loop.'''
+
+    if prefetch < 1:
+        while cursor is not LAST_PAGE:
+            items, cursor = await fetch(cursor)
+            yield items
+        return
+
+    pages: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch)
+
+    async def produce(cursor: Any) -> None:
+        try:
+            while cursor is not LAST_PAGE:
+                await slots.acquire()
+                items, cursor = await fetch(cursor)
+                pages.put_nowait((items, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            pages.put_nowait((None, e))
+        else:
+            pages.put_nowait((LAST_PAGE, None))
+
+    producer = asyncio.get_running_loop().create_task(produce(cursor))
+
+    try:
+        while True:
+            items, exception = await pages.get()
+            if exception is not None:
+                raise exception
+            if items is LAST_PAGE:
+                return
+            slots.release()
+            yield items
+    finally:
+        producer.cancel()
+
+
+def iter_offsets(fetch: OffsetFetcher, page_size: int, start: int = 0, limit: Optional[int] = None, concurrency: int = 1,
+    key: Optional[ItemKey] = None) -> Iterator[Any]:
+    '''
+        Items of a skip/offset listing, in order, until a page comes back short (or `limit` items were read).
+
+        When `limit` bounds the listing, up to `concurrency` pages are requested at once from a thread pool; without
+        a bound the pages are requested one after another, as each request past the end of the listing would be wasted.
+
+            Parameters:
+                fetch (callable): returns the items of the page at an offset.
+                page_size (int): items per page, a page with fewer items is the last one.
+                start (int): offset of the first page. Default: 0.
+                limit (int | None): maximum number of items to read. Default: None (until a short page).
+                concurrency (int): pages requested at once when `limit` is set. Default: 1.
+                key (callable | None): key of an item to drop items that several pages return (e.g., when the listing
+                    shifts while it is read); items with a None key are always kept. Default: None (no deduplication).
+
+            Yields:
+                item (Any): each item of the listing.
+    '''
+
+    offsets = _offsets(page_size, start, limit)
+    seen = set()
+
+    if concurrency < 2 or limit is None:
+        for offset in offsets:
+            items = fetch(offset)
+            yield from _new_items(items, key, seen, start + limit - offset if limit is not None else None)
+            if len(items) < page_size:
+                return
+        return
+
+    executor = ThreadPoolExecutor(concurrency, thread_name_prefix='outscraper-offsets')
+    pending = deque((offset, executor.submit(fetch, offset)) for _, offset in zip(range(concurrency), offsets))
+
+    try:
+        while pending:
+            offset, future = pending.popleft()
+            items = future.result()
+            yield from _new_items(items, key, seen, start + limit - offset)
+            if len(items) < page_size:
+                return
+
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append((offset, executor.submit(fetch, offset)))
+    finally:
+        # pages past a short page or an abandoned iteration are not needed
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_offsets(fetch: AsyncOffsetFetcher, page_size: int, start: int = 0, limit: Optional[int] = None,
+    concurrency: int = 1, key: Optional[ItemKey] = None) -> AsyncIterator[Any]:
+    '''Async generator version of `iter_offsets()`; the pages are requested by tasks on the running loop.'''
+
+    offsets = _offsets(page_size, start, limit)
+    seen = set()
+    loop = asyncio.get_running_loop()
+    window = concurrency if concurrency > 1 and limit is not None else 1
+    pending = deque((offset, loop.create_task(fetch(offset))) for _, offset in zip(range(window), offsets))
+
+    try:
+        while pending:
+            offset, task = pending.popleft()
+            items = await task
+            for item in _new_items(items, key, seen, start + limit - offset if limit is not None else None):
+                yield item
+            if len(items) < page_size:
+                return
+
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append((offset, loop.create_task(fetch(offset))))
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+def first_key(*fields: str) -> ItemKey:
+    '''Item key for `iter_offsets()`: the value of the first of `fields` that a (dict) item has.'''
+
+    def key(item: Any) -> Optional[Hashable]:
+        if isinstance(item, dict):
+            for field in fields:
+                if item.get(field) is not None:
+                    return field, item[field]
+        return None
+
+    return key
+
+
+def _offsets(page_size: int, start: int, limit: Optional[int]) -> Iterator[int]:
+    if page_size < 1:
+        raise ValueError('page_size must be at least 1')
+
+    offset = start
+    while limit is None or offset < start + limit:
+        yield offset
+        offset += page_size
+
+
+def _new_items(items: List[Any], key: Optional[ItemKey], seen: set, remaining: Optional[int] = None) -> Iterator[Any]:
+    # the last page of a limited listing may have more items than the limit leaves
+    if remaining is not None:
+        items = items[:remaining]
+
+    if key is None:
+        yield from items
+        return
+
+    for item in items:
+        item_key = key(item)
+        if item_key is not None:
+            if item_key in seen:
+                continue
+            seen.add(item_key)
+        yield item
@@ -0,0 +1,70 @@
+from random import uniform
+from typing import Iterator, Optional
+
+
+# parameters that multiply the amount of work done per query
+SIZE_PARAMS = ('organizationsPerQueryLimit', 'limit', 'reviewsLimit', 'photosLimit', 'pagesPerQuery', 'per_query')
+UNLIMITED_SIZE = 1000
+
+
+class PollingStrategy:
+    def __init__(self, first_delay: float = 1.0, multiplier: float = 1.5, max_delay: float = 30.0, jitter: float = 0.1,
+        max_ttl: float = 60 * 60, seconds_per_item: float = 0.02) -> None:
+        '''
+            Schedule of archive polls for async requests: a short first poll, then exponentially growing pauses.
+
+                Parameters:
+                    first_delay (float): seconds before the first poll of a small job. Default: 1.
+                    multiplier (float): growth factor between consecutive pauses. Default: 1.5.
+                    max_delay (float): the longest pause between two polls. Default: 30.
+                    jitter (float): random +/- fraction applied to each pause so that many jobs don't poll in lockstep. Default: 0.1.
+                    max_ttl (float): total seconds to wait for a result before giving up. Default: 1 hour.
+                    seconds_per_item (float): extra delay before the first poll per expected result item
+                        (see `estimate_job_size`), so large jobs don't poll before they can possibly be done. Default: 0.02.
+
+            Fixed 5 seconds pauses (the previous behaviour) can be configured with
+            `PollingStrategy(first_delay=5, multiplier=1, max_delay=5, jitter=0)`.
+        '''
+
+        if first_delay <= 0 or max_delay <= 0:
+            raise ValueError('first_delay and max_delay must be positive')
+        if multiplier < 1:
+            raise ValueError('multiplier must be >= 1')
+
+        self.first_delay = first_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_ttl = max_ttl
+        self.seconds_per_item = seconds_per_item
+
+    def delays(self, size_hint: Optional[int] = None) -> Iterator[float]:
+        delay = self.first_delay
+        if size_hint:
+            delay += self.seconds_per_item * size_hint
+        delay = min(delay, self.max_delay)
+
+        waited = 0.0
+        while waited < self.max_ttl:
+            pause = delay * uniform(1 - self.jitter, 1 + self.jitter) if self.jitter else delay
+            waited += pause
+            yield pause
+
+            delay = min(delay * self.multiplier, self.max_delay)
+
+
+def estimate_job_size(params) -> Optional[int]:
+    '''Rough number of result items a request will produce: queries count times per-query limits.'''
+
+    if not isinstance(params, dict):
+        return None
+
+    queries = params.get('query')
+    size = len(queries) if isinstance(queries, list) else 1
+
+    for name in SIZE_PARAMS:
+        value = params.get(name)
+        if isinstance(value, int) and not isinstance(value, bool):
+            size *= value if value > 0 else UNLIMITED_SIZE
+
+    return size
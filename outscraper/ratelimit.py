@@ -0,0 +1,206 @@
+import os
+import struct
+from threading import Lock
+from time import sleep, time
+from typing import Dict, List, Optional, Tuple, Union
+
+from .exceptions import RateLimitExceeded
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+Limit = Union[float, Tuple[float, float]]
+STATE = struct.Struct('<dd')
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        '''
+            Token bucket shared by the threads of one process.
+
+                Parameters:
+                    rate (float): tokens (requests) added per second.
+                    burst (float | None): bucket capacity, i.e. requests that can be sent at once. Default: max(1, rate).
+        '''
+
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated_at = time()
+        self._lock = Lock()
+
+    def reserve(self, tokens: float = 1, max_wait: Optional[float] = None) -> Optional[float]:
+        '''
+            Take tokens, going into debt if the bucket is short. Returns the seconds to wait before the tokens are
+            actually available, or None (taking nothing) if that would be longer than `max_wait`.
+        '''
+
+        with self._lock:
+            tokens_left, updated_at = self._load()
+            tokens_left, wait = self._take(tokens_left, updated_at, tokens, max_wait)
+            if wait is not None:
+                self._save(tokens_left)
+            return wait
+
+    def refund(self, tokens: float = 1) -> None:
+        with self._lock:
+            tokens_left, updated_at = self._load()
+            self._save(min(self.burst, self._refill(tokens_left, updated_at) + tokens))
+
+    def _refill(self, tokens_left: float, updated_at: float) -> float:
+        return min(self.burst, tokens_left + (time() - updated_at) * self.rate)
+
+    def _take(self, tokens_left: float, updated_at: float, tokens: float, max_wait: Optional[float]) -> Tuple[float, Optional[float]]:
+        tokens_left = self._refill(tokens_left, updated_at)
+        wait = max(0.0, (tokens - tokens_left) / self.rate)
+        if max_wait is not None and wait > max_wait:
+            return tokens_left, None
+        return tokens_left - tokens, wait
+
+    def _load(self) -> Tuple[float, float]:
+        return self._tokens, self._updated_at
+
+    def _save(self, tokens_left: float) -> None:
+        self._tokens = tokens_left
+        self._updated_at = time()
+
+
+class FileTokenBucket(TokenBucket):
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None) -> None:
+        '''
+            Token bucket whose state lives in a small file, shared by all processes that use the same path.
+            Updates are serialized with an exclusive `flock`, so it needs a POSIX system.
+
+                Parameters:
+                    path (str): state file, created if missing.
+                    rate (float): tokens (requests) added per second.
+                    burst (float | None): bucket capacity. Default: max(1, rate).
+        '''
+
+        if fcntl is None:
+            raise RuntimeError('FileTokenBucket requires fcntl (POSIX)')
+
+        super().__init__(rate, burst)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def reserve(self, tokens: float = 1, max_wait: Optional[float] = None) -> Optional[float]:
+        # the thread lock is needed too: flock doesn't exclude threads sharing one file descriptor
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                tokens_left, updated_at = self._load()
+                tokens_left, wait = self._take(tokens_left, updated_at, tokens, max_wait)
+                if wait is not None:
+                    self._save(tokens_left)
+                return wait
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def refund(self, tokens: float = 1) -> None:
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                tokens_left, updated_at = self._load()
+                self._save(min(self.burst, self._refill(tokens_left, updated_at) + tokens))
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _load(self) -> Tuple[float, float]:
+        data = os.pread(self._fd, STATE.size, 0)
+        if len(data) < STATE.size:
+            return self.burst, time()
+        return STATE.unpack(data)
+
+    def _save(self, tokens_left: float) -> None:
+        os.pwrite(self._fd, STATE.pack(tokens_left, time()), 0)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class RateLimiter:
+    def __init__(self, rate: Optional[Limit] = None, *, paths: Optional[Dict[str, Limit]] = None, submit: Optional[Limit] = None,
+        poll: Optional[Limit] = None, block: bool = True, max_wait: Optional[float] = None, state_dir: Optional[str] = None) -> None:
+        '''
+            Client-side rate limits for an `OutscraperTransport`, checked before every HTTP request.
+
+            A limit is a rate in requests per second, or a (rate, burst) tuple. A request has to fit all limits that apply:
+            the global one, the one for submissions or for archive polls (`GET /requests...`) and the one for its path.
+            ```python
+            limiter = RateLimiter(10, submit=2, poll=(5, 20), paths={'/maps/reviews-v3': 1}, state_dir='/tmp/outscraper-limits')
+            client = OutscraperClient(api_key='SECRET_API_KEY', rate_limiter=limiter)
+            ```
+
+                Parameters:
+                    rate (float | tuple | None): global limit for all requests. Default: None (no limit).
+                    paths (dict[str, float | tuple] | None): limits by API path; a key also applies to the paths it's a prefix of.
+                    submit (float | tuple | None): limit for endpoint calls (everything but archive polls).
+                    poll (float | tuple | None): limit for archive polls and request listings.
+                    block (bool): whether to wait until a request fits the limits. With False, `RateLimitExceeded` is raised
+                        right away instead. Default: True.
+                    max_wait (float | None): with `block`, the longest wait before `RateLimitExceeded` is raised. Default: None (no limit).
+                    state_dir (str | None): directory for shared bucket files, so that processes using the same directory share
+                        the limits. Default: None (limits are per process).
+        '''
+
+        self._block = block
+        self._max_wait = max_wait if block else 0.0
+        self._state_dir = state_dir
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+
+        self._global = self._bucket('global', rate)
+        self._submit = self._bucket('submit', submit)
+        self._poll = self._bucket('poll', poll)
+        self._paths = {path: self._bucket('path' + path.replace('/', '_'), limit) for path, limit in (paths or {}).items()}
+
+        self.waited = 0.0
+        self.rejected = 0
+
+    def _bucket(self, name: str, limit: Optional[Limit]) -> Optional[TokenBucket]:
+        if limit is None:
+            return None
+
+        rate, burst = limit if isinstance(limit, tuple) else (limit, None)
+        if self._state_dir:
+            return FileTokenBucket(os.path.join(self._state_dir, f'{name}.bucket'), rate, burst)
+        return TokenBucket(rate, burst)
+
+    def buckets(self, method: str, path: str) -> List[TokenBucket]:
+        is_poll = method.upper() == 'GET' and path.startswith('/requests')
+        buckets = [self._global, self._poll if is_poll else self._submit]
+
+        prefixes = [prefix for prefix in self._paths if path.startswith(prefix)]
+        if prefixes:
+            buckets.append(self._paths[max(prefixes, key=len)])
+
+        return [bucket for bucket in buckets if bucket is not None]
+
+    def acquire(self, method: str, path: str) -> None:
+        '''Wait until a request fits all its limits or raise `RateLimitExceeded`.'''
+
+        reserved = []
+        for bucket in self.buckets(method, path):
+            wait = bucket.reserve(max_wait=self._max_wait)
+            if wait is None:
+                for taken in reserved:
+                    taken[0].refund()
+                self.rejected += 1
+                raise RateLimitExceeded(method, path, 1 / bucket.rate)
+            reserved.append((bucket, wait))
+
+        wait = max((wait for _, wait in reserved), default=0.0)
+        if wait > 0:
+            self.waited += wait
+            sleep(wait)
+
+    def close(self) -> None:
+        for bucket in [self._global, self._submit, self._poll, *self._paths.values()]:
+            if isinstance(bucket, FileTokenBucket):
+                bucket.close()
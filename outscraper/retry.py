@@ -0,0 +1,104 @@
+from email.utils import parsedate_to_datetime
+from random import uniform
+from time import time
+from typing import Dict, Iterable, Optional
+
+import requests
+
+
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'DELETE')
+# POST endpoints that only read data, so repeating them can't create duplicate requests
+IDEMPOTENT_POST_PATHS = ('/businesses',)
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int = 3, backoff: float = 0.5, multiplier: float = 2.0, max_backoff: float = 30.0,
+        jitter: float = 0.1, statuses: Iterable[int] = (429, 500, 502, 503, 504), status_attempts: Optional[Dict[int, int]] = None,
+        respect_retry_after: bool = True, max_retry_after: float = 120.0, retry_post: bool = False,
+        idempotent_post_paths: Iterable[str] = IDEMPOTENT_POST_PATHS) -> None:
+        '''
+            When and how `OutscraperTransport` retries a request.
+
+            Requests that fail with a connection error or a mirror failure status (502, 503, 504) are tried on the next
+            mirror right away; once every mirror has been tried, attempts wait for the backoff.
+            GET requests, including archive polls, are retried; POST requests (e.g., `google_maps_search` submissions) only
+            with `retry_post`, because a repeated submission may start a second request. Connection errors are failed over
+            for every method, since the request didn't reach the API.
+
+                Parameters:
+                    max_attempts (int): attempts per request, including the first one. Default: 3.
+                    backoff (float): seconds before the first retry. Default: 0.5.
+                    multiplier (float): growth factor of the backoff. Default: 2.
+                    max_backoff (float): the longest backoff. Default: 30.
+                    jitter (float): random +/- fraction applied to each backoff. Default: 0.1.
+                    statuses (iterable[int]): HTTP statuses to retry. Default: 429, 500, 502, 503, 504.
+                    status_attempts (dict[int, int] | None): max attempts for specific statuses (e.g., {429: 10}).
+                    respect_retry_after (bool): whether to wait as long as the `Retry-After` header asks. Default: True.
+                    max_retry_after (float): the longest `Retry-After` wait to honor. Default: 120.
+                    retry_post (bool): whether to retry POST requests on error statuses. Default: False.
+                    idempotent_post_paths (iterable[str]): POST paths that are always safe to retry. Default: ('/businesses',).
+        '''
+
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be >= 1')
+
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.status_attempts = dict(status_attempts or {})
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_post = retry_post
+        self.idempotent_post_paths = tuple(idempotent_post_paths)
+
+    @classmethod
+    def never(cls) -> 'RetryPolicy':
+        '''No retries, apart from trying each mirror once on connection errors.'''
+
+        return cls(max_attempts=1)
+
+    def is_idempotent(self, method: str, path: str) -> bool:
+        method = method.upper()
+        return (method in IDEMPOTENT_METHODS or self.retry_post
+            or (method == 'POST' and any(path == prefix or path.startswith(prefix + '/') for prefix in self.idempotent_post_paths)))
+
+    def should_retry(self, method: str, path: str, status_code: Optional[int], attempt: int) -> bool:
+        '''Whether to make another attempt after `attempt` attempts; `status_code` is None for connection errors.'''
+
+        if status_code is None:
+            return attempt < self.max_attempts
+
+        if status_code not in self.statuses or not self.is_idempotent(method, path):
+            return False
+        return attempt < self.status_attempts.get(status_code, self.max_attempts)
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        '''Seconds to wait before the attempt that follows `attempt` failed attempts.'''
+
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        delay = min(self.backoff * self.multiplier ** (attempt - 1), self.max_backoff)
+        return delay * uniform(1 - self.jitter, 1 + self.jitter) if self.jitter else delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    '''Seconds from a `Retry-After` header, which is either a number of seconds or an HTTP date.'''
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field, fields as dc_fields
-from typing import List, Optional, Any, Dict, Generic, TypeVar
+from itertools import zip_longest
+from operator import attrgetter
+from typing import ClassVar, Iterable, List, Optional, Any, Dict, Generic, Tuple, TypeVar, Union
 
 
 T = TypeVar('T')
@@ -67,10 +69,13 @@ class Business:
 
     extra: Dict[str, Any] = field(default_factory=dict)
 
+    # names of the fields other than `extra`, set once the class is defined
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+
     @classmethod
     def from_dict(cls, data: dict) -> 'Business':
-        allowed = {f.name for f in dc_fields(cls)}
-        known = {k: v for k, v in data.items() if k in allowed and k != 'extra'}
+        fields = cls.FIELDS
+        known = {k: v for k, v in data.items() if k in fields}
         obj = cls(**known)
         obj.extra = data
         return obj
@@ -78,12 +83,10 @@ class Business:
     def to_dict(self, *, include_extra: bool = True) -> Dict[str, Any]:
         result: Dict[str, Any] = {}
 
-        for f in dc_fields(self):
-            if f.name == 'extra':
-                continue
-            value = getattr(self, f.name)
+        for name in self.FIELDS:
+            value = getattr(self, name)
             if value is not None:
-                result[f.name] = value
+                result[name] = value
 
         if include_extra:
             for k, v in self.extra.items():
@@ -92,6 +95,77 @@ class Business:
         return result
 
 
+Business.FIELDS = tuple(f.name for f in dc_fields(Business) if f.name != 'extra')
+_field_values = attrgetter(*Business.FIELDS)
+
+
+class BusinessRecord:
+    '''
+        Compact business record: the fields of `Business` are stored in slots and the other keys of the API item,
+        only those, in `extra`. Build many at once from a page of items with `BusinessRecord.from_items()`.
+    '''
+
+    FIELDS = Business.FIELDS
+    __slots__ = FIELDS + ('extra',)
+
+    _known = frozenset(FIELDS)
+
+    def __init__(self, *values: Any, extra: Optional[Dict[str, Any]] = None, **fields: Any) -> None:
+        '''
+            Parameters:
+                values: values of `FIELDS`, in that order; the missing ones are None.
+                extra (dict | None): the other keys of the API item. Default: None (empty).
+                fields: values of `FIELDS` by name.
+        '''
+
+        if len(values) > len(self.FIELDS):
+            raise TypeError(f'BusinessRecord takes at most {len(self.FIELDS)} field values ({len(values)} given)')
+        if fields and not fields.keys() <= self._known:
+            raise TypeError(f'unknown BusinessRecord fields: {", ".join(sorted(fields.keys() - self._known))}')
+
+        for name, value in zip_longest(self.FIELDS, values):
+            setattr(self, name, value)
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.extra = {} if extra is None else extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BusinessRecord':
+        known = cls._known
+        return cls(*map(data.get, cls.FIELDS), extra={k: v for k, v in data.items() if k not in known})
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict]) -> List['BusinessRecord']:
+        '''Records of a page of API items.'''
+
+        known = cls._known
+        fields = cls.FIELDS
+        return [cls(*map(data.get, fields), extra={k: v for k, v in data.items() if k not in known}) for data in items]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        '''Value of a field or an extra key, like `dict.get()` on the API item.'''
+
+        if key in self._known:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extra.get(key, default)
+
+    def to_dict(self, *, include_extra: bool = True) -> Dict[str, Any]:
+        result = {name: value for name, value in zip(self.FIELDS, _field_values(self)) if value is not None}
+        if include_extra:
+            for k, v in self.extra.items():
+                result.setdefault(k, v)
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BusinessRecord):
+            return NotImplemented
+        return _field_values(self) == _field_values(other) and self.extra == other.extra
+
+    def __repr__(self) -> str:
+        return f'BusinessRecord(os_id={self.os_id!r}, name={self.name!r})'
+
+
 @dataclass
 class Page(Generic[T]):
     items: List[T]
@@ -104,5 +178,5 @@ class Page(Generic[T]):
 
 
 @dataclass
-class BusinessSearchResult(Page[dict]):
-    pass
+class BusinessSearchResult(Page[Union[dict, BusinessRecord]]):
+    total: Optional[int] = None
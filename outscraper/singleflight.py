@@ -0,0 +1,74 @@
+import asyncio
+from concurrent.futures import Future
+from copy import deepcopy
+from threading import Lock
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    '''
+        Collapses identical concurrent calls into one: the first caller runs the call, callers arriving
+        while it is in flight wait for it and get a copy of its result (or its exception).
+    '''
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+        self.saved = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.saved += 1
+
+        if not leader:
+            return deepcopy(future.result())
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    '''asyncio version of SingleFlight, for calls made from one event loop.'''
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.saved = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+
+        if future is not None:
+            self.saved += 1
+            return deepcopy(await asyncio.shield(future))
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await func()
+        except BaseException as e:
+            future.set_exception(e)
+            # the exception is delivered to waiting callers, don't report it as never retrieved when there are none
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
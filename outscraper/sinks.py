@@ -0,0 +1,340 @@
+import csv
+import json
+import os
+import shutil
+from glob import glob
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+def iter_records(result: Any) -> Iterator[dict]:
+    '''Records of an endpoint result: nested lists (e.g., results per query) are flattened, scalars become {"value": ...}.'''
+
+    if isinstance(result, list):
+        for item in result:
+            yield from iter_records(item)
+    elif isinstance(result, dict):
+        yield result
+    elif result is not None:
+        yield {'value': result}
+
+
+class JSONLSink:
+    def __init__(self, path: str, append: bool = False) -> None:
+        '''
+            Writes records as JSON lines.
+
+                Parameters:
+                    path (str): output file.
+                    append (bool): whether to keep the records already in the file (e.g., when resuming a run). Default: False.
+        '''
+
+        self.path = path
+        self.records = 0
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, records: Iterable[dict]) -> None:
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+            self._file.write('\n')
+            self.records += 1
+        self._file.flush()
+
+    def close(self, finalize: bool = True) -> None:
+        # every line is complete as written, there is nothing to finalize
+        self._file.close()
+
+
+class CSVSink:
+    def __init__(self, path: str, append: bool = False) -> None:
+        '''
+            Writes records as CSV with one column per field seen in any record; nested values are JSON encoded.
+
+            Rows are written as they come. The header holds the columns of the first batch of records; columns that
+            appear later are added at the end of the rows and listed in `<path>.columns.json`, and the file is
+            rewritten once with the full header when the sink is closed. A sink closed with `finalize=False` (or an
+            interrupted run) keeps the list, so a resumed run appends rows with the same columns.
+
+                Parameters:
+                    path (str): output file.
+                    append (bool): whether to keep the records already in the file (e.g., when resuming a run). Default: False.
+        '''
+
+        self.path = path
+        self.records = 0
+        self._columns_path = f'{path}.columns.json'
+        self._header: List[str] = []
+
+        if append and os.path.exists(path):
+            with open(path, encoding='utf-8', newline='') as file:
+                self._header = next(csv.reader(file), [])
+        elif os.path.exists(self._columns_path):
+            os.remove(self._columns_path)
+
+        self._columns = list(self._header)
+        if append and os.path.exists(self._columns_path):
+            with open(self._columns_path, encoding='utf-8') as file:
+                self._columns = json.load(file)
+
+        self._known = set(self._columns)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=self._columns)
+
+    def write(self, records: Iterable[dict]) -> None:
+        records = list(records)
+        columns = [column for column in dict.fromkeys(column for record in records for column in record) if column not in self._known]
+        if columns:
+            self._columns.extend(columns)
+            self._known.update(columns)
+            if self._header or self.records or self._file.tell():
+                self._save_columns()
+            else:
+                # nothing written yet, the header takes the columns of the first batch
+                self._header = list(self._columns)
+                self._writer.writeheader()
+
+        for record in records:
+            self._writer.writerow({column: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+                for column, value in record.items()})
+            self.records += 1
+        self._file.flush()
+
+    def close(self, finalize: bool = True) -> None:
+        '''Close the file; with `finalize`, columns added after the header are written into it.'''
+
+        self._file.close()
+        if finalize and len(self._columns) > len(self._header):
+            self._rewrite_header()
+
+    def _save_columns(self) -> None:
+        with open(self._columns_path, 'w', encoding='utf-8') as file:
+            json.dump(self._columns, file, ensure_ascii=False)
+
+    def _rewrite_header(self) -> None:
+        '''Rewrite the file once with the full header, rows written before a column appeared leave it empty.'''
+
+        extended = f'{self.path}.tmp'
+        with open(extended, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(self._columns)
+            with open(self.path, encoding='utf-8', newline='') as rows:
+                reader = csv.reader(rows)
+                next(reader, None)
+                for row in reader:
+                    writer.writerow(row + [''] * (len(self._columns) - len(row)))
+        os.replace(extended, self.path)
+        os.remove(self._columns_path)
+        self._header = list(self._columns)
+
+
+class ParquetSink:
+    def __init__(self, path: str, append: bool = False, batch_size: int = 10000, children: Optional[Dict[str, str]] = None,
+        compression: str = 'snappy') -> None:
+        '''
+            Writes records as a Parquet dataset (requires `pyarrow`), converting them to Arrow record batches of
+            `batch_size` rows as they come, so memory is bounded by the batch size rather than the size of the results.
+
+            The schema is inferred from the records and evolves with them: columns that appear later or values that need
+            a wider type (e.g., int -> float -> string) start a new part file with the extended schema, and the earlier
+            parts are converted to the final schema when the sink is finalized on close. Nested values are stored as JSON
+            strings, except for child fields (`reviews_data` by default), whose items go to a table of their own linked to
+            the parent record by a key:
+            ```
+            results.parquet/records/part-00000.parquet
+            results.parquet/reviews_data/part-00000.parquet  # one row per review, with the place_id of its place
+            ```
+
+                Parameters:
+                    path (str): output directory.
+                    append (bool): whether to keep the parts already written (e.g., when resuming a run). Default: False.
+                    batch_size (int): rows per record batch and row group. Default: 10000.
+                    children (dict[str, str] | None): child fields by name, with the parent field linking them. Default: {"reviews_data": "place_id"}.
+                    compression (str): Parquet compression codec. Default: "snappy".
+        '''
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError('Parquet output requires pyarrow: pip install outscraper[parquet]')
+
+        if not append and os.path.isdir(path):
+            shutil.rmtree(path)
+
+        self.path = path
+        self.records = 0
+        self._children = {'reviews_data': 'place_id'} if children is None else dict(children)
+        self._tables = {name: ArrowTableWriter(os.path.join(path, name), batch_size, compression)
+            for name in ['records', *self._children]}
+
+    def write(self, records: Iterable[dict]) -> None:
+        for record in records:
+            for field, key in self._children.items():
+                items = record.get(field)
+                if isinstance(items, list):
+                    record = {name: value for name, value in record.items() if name != field}
+                    for item in items:
+                        self._tables[field].append({key: record.get(key), **item} if isinstance(item, dict) else {key: record.get(key), 'value': item})
+
+            self._tables['records'].append(record)
+            self.records += 1
+
+    def close(self, finalize: bool = True) -> None:
+        '''
+            Write the buffered rows; with `finalize`, convert the parts written before a schema change to the final
+            schema. Without it (e.g., a run to be resumed) the parts are left as they are, the resumed run converts them.
+        '''
+
+        for table in self._tables.values():
+            table.close(conform=finalize)
+
+
+class ArrowTableWriter:
+    def __init__(self, directory: str, batch_size: int = 10000, compression: str = 'snappy') -> None:
+        '''
+            Buffers rows (dicts) and writes them as Arrow record batches to `part-NNNNN.parquet` files in `directory`,
+            rolling over to a new part whenever the schema has to change.
+        '''
+
+        self.directory = directory
+        self.rows = 0
+        self._batch_size = batch_size
+        self._compression = compression
+        self._buffer: List[dict] = []
+        self._schema = None
+        self._writer = None
+        self._part = len(glob(os.path.join(directory, 'part-*.parquet')))
+
+    def append(self, row: dict) -> None:
+        self._buffer.append(row)
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self._buffer:
+            return
+
+        rows, self._buffer = self._buffer, []
+        types: Dict[str, Any] = {}
+        for row in rows:
+            for column, value in row.items():
+                types[column] = widen_type(types.get(column), value_type(value))
+
+        schema = evolve_schema(self._schema, types)
+        if self._writer is None or not schema.equals(self._schema):
+            self._close_writer()
+            os.makedirs(self.directory, exist_ok=True)
+            self._writer = pq.ParquetWriter(os.path.join(self.directory, f'part-{self._part:05d}.parquet'), schema,
+                compression=self._compression)
+            self._schema = schema
+            self._part += 1
+
+        columns = [pa.array([arrow_value(row.get(field.name), field.type) for row in rows], type=field.type) for field in schema]
+        self._writer.write_batch(pa.record_batch(columns, schema=schema))
+        self.rows += len(rows)
+
+    def close(self, conform: bool = True) -> None:
+        self.flush()
+        self._close_writer()
+        if conform:
+            self._conform_parts()
+
+    def _conform_parts(self) -> None:
+        '''Rewrite the parts written before the last schema change, one batch at a time, so that all parts share one schema.'''
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parts = sorted(glob(os.path.join(self.directory, 'part-*.parquet')))
+        schemas = {part: pq.read_schema(part) for part in parts}
+
+        schema = None
+        for part_schema in schemas.values():
+            schema = evolve_schema(schema, {field.name: field.type for field in part_schema})
+
+        for part, part_schema in schemas.items():
+            if part_schema.equals(schema):
+                continue
+
+            conformed = f'{part}.tmp'
+            with pq.ParquetWriter(conformed, schema, compression=self._compression) as writer:
+                for batch in pq.ParquetFile(part).iter_batches(batch_size=self._batch_size):
+                    columns = [batch.column(field.name).cast(field.type) if field.name in part_schema.names
+                        else pa.nulls(batch.num_rows, field.type) for field in schema]
+                    writer.write_batch(pa.record_batch(columns, schema=schema))
+            os.replace(conformed, part)
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def value_type(value):
+    import pyarrow as pa
+
+    if value is None:
+        return pa.null()
+    if isinstance(value, bool):
+        return pa.bool_()
+    if isinstance(value, int):
+        return pa.int64()
+    if isinstance(value, float):
+        return pa.float64()
+    return pa.string()
+
+
+def widen_type(current, kind):
+    '''The narrowest of null < bool | int64 < float64 < string that holds values of both types.'''
+
+    import pyarrow as pa
+
+    if current is None or current == pa.null():
+        return kind
+    if kind == pa.null() or kind == current:
+        return current
+    if {current, kind} == {pa.int64(), pa.float64()}:
+        return pa.float64()
+    return pa.string()
+
+
+def evolve_schema(schema, types: Dict[str, Any]):
+    '''`schema` extended with new columns and widened to hold values of `types`.'''
+
+    import pyarrow as pa
+
+    fields = {field.name: field.type for field in schema} if schema is not None else {}
+    for column, kind in types.items():
+        fields[column] = widen_type(fields.get(column), kind)
+    return pa.schema(list(fields.items()))
+
+
+def arrow_value(value, kind):
+    import pyarrow as pa
+
+    if value is None or kind == pa.null():
+        return None
+    if kind == pa.string():
+        return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, default=str)
+    if kind == pa.float64():
+        return float(value)
+    return value
+
+
+SINKS = {
+    'jsonl': JSONLSink,
+    'csv': CSVSink,
+    'parquet': ParquetSink,
+}
+
+
+def open_sink(path: str, format: Optional[str] = None, append: bool = False):
+    '''Sink for `path`, with the format taken from the file extension unless given.'''
+
+    format = format or os.path.splitext(path)[1].lstrip('.').lower() or 'jsonl'
+    if format == 'json':
+        format = 'jsonl'
+    if format not in SINKS:
+        raise ValueError(f'unsupported output format: {format}')
+    return SINKS[format](path, append=append)
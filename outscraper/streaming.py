@@ -0,0 +1,180 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, Union
+
+
+WHITESPACE = ' \t\n\r'
+
+# characters that matter when looking for the end of a value, inside and outside of strings
+STRING_SPECIAL = re.compile(r'["\\]')
+# a whole string (the closing quote is missing when the string goes on in the next chunk) or a bracket
+STRUCTURE_SPECIAL = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*(")?|[][{}]')
+SCALAR_END = re.compile(r'[\s,\]}]')
+
+
+class JSONStream:
+    def __init__(self, chunks: Iterable[Union[bytes, str]], field: str = 'data', flatten: bool = True) -> None:
+        '''
+            Incremental parser of a JSON response body that yields the items of its `field` array while the body is
+            still downloading, so only the item being decoded is held in memory.
+
+            ```python
+            response = session.get(url, stream=True)
+            for place in JSONStream(response.iter_content(64 * 1024)):
+                ...
+            ```
+
+                Parameters:
+                    chunks (iterable[bytes | str]): pieces of the body, e.g. `response.iter_content()`.
+                    field (str): top-level field with the items. A body that is an array itself is streamed as is. Default: "data".
+                    flatten (bool): whether to yield the items of nested arrays (e.g., results per query) instead of the arrays. Default: True.
+
+            The other top-level fields (e.g., `id`, `status`) are collected in `fields`.
+        '''
+
+        self.field = field
+        self.flatten = flatten
+        self.fields: Dict[str, Any] = {}
+
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        start = self._peek()
+        if start == '[':
+            yield from self._items()
+            return
+
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            self._expect(':')
+
+            if key == self.field and self._peek() == '[':
+                yield from self._items()
+            else:
+                self.fields[key] = self._value()
+
+            if self._expect(',}') == '}':
+                return
+
+    def _items(self) -> Iterator[Any]:
+        self._pos += 1
+        if self._peek() == ']':
+            self._pos += 1
+            return
+
+        while True:
+            if self.flatten and self._peek() == '[':
+                yield from self._items()
+            else:
+                yield self._value()
+
+            if self._expect(',]') == ']':
+                return
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        # the consumed part of the buffer is never needed again
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            self._buffer += self._decoder.decode(b'', final=True)
+            return False
+
+        self._buffer += self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f'invalid JSON: expected one of {chars!r}, got {char or "end of data"!r}')
+
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        end = self._scan()
+        value, self._pos = self._json.raw_decode(self._buffer, self._pos)
+        if self._pos != end:
+            raise ValueError(f'invalid JSON: unexpected data at {self._pos}')
+        return value
+
+    def _scan(self) -> int:
+        '''
+            End of the value at the current position, reading chunks until the value is complete. The bracket depth and
+            string state are kept across chunks, so each value is scanned once and decoded once, whatever its size.
+        '''
+
+        scalar = self._buffer[self._pos:self._pos + 1] not in ('[', '{', '"')
+        depth = 0
+        in_string = False
+        # relative to `_pos`, since filling the buffer drops its consumed part
+        offset = 0
+
+        while True:
+            buffer = self._buffer
+            index = self._pos + offset
+
+            if scalar:
+                match = SCALAR_END.search(buffer, index)
+                if match:
+                    return match.start()
+                index = len(buffer)
+
+            while not scalar:
+                match = (STRING_SPECIAL if in_string else STRUCTURE_SPECIAL).search(buffer, index)
+                if match is None:
+                    # an escape at the end of the buffer already skipped past it
+                    index = max(index, len(buffer))
+                    break
+
+                char, index = match.group(), match.end()
+                if in_string:
+                    if char == '\\':
+                        index += 1
+                        continue
+                    in_string = False
+                elif char[0] == '"':
+                    if match.group(1) is None:
+                        in_string = True
+                        continue
+                elif char in '[{':
+                    depth += 1
+                    continue
+                else:
+                    depth -= 1
+
+                if depth == 0:
+                    return index
+
+            offset = index - self._pos
+            if not self._fill():
+                if scalar:
+                    return len(self._buffer)
+                raise ValueError('invalid JSON: unexpected end of data')
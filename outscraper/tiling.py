@@ -0,0 +1,161 @@
+from math import ceil, cos, floor, log2, radians
+from typing import List, Sequence, Tuple, Union
+
+
+KM_PER_DEGREE = 111.32
+
+# width in pixels of the map viewport that a zoom level is computed for
+VIEWPORT_PX = 800
+# the viewport of a tile is a bit larger than the tile, so that places on its edges are not missed
+TILE_OVERLAP = 1.1
+
+Point = Tuple[float, float]
+# (south, west, north, east) or a polygon as a sequence of (latitude, longitude) vertices
+AreaLike = Union[Tuple[float, float, float, float], Sequence[Point]]
+
+
+class Area:
+    def __init__(self, area: AreaLike) -> None:
+        '''
+            Region to cover: a bounding box (south, west, north, east) or a polygon of (latitude, longitude) vertices.
+        '''
+
+        if len(area) == 4 and all(isinstance(value, (int, float)) for value in area):
+            south, west, north, east = area
+            self.polygon: List[Point] = [(south, west), (south, east), (north, east), (north, west)]
+            self.is_box = True
+        else:
+            self.polygon = [(float(lat), float(lng)) for lat, lng in area]
+            self.is_box = False
+            if len(self.polygon) < 3:
+                raise ValueError('a polygon needs at least 3 vertices')
+
+        lats = [lat for lat, _ in self.polygon]
+        lngs = [lng for _, lng in self.polygon]
+        self.bounds = (min(lats), min(lngs), max(lats), max(lngs))
+
+    def contains(self, lat: float, lng: float) -> bool:
+        south, west, north, east = self.bounds
+        if not (south <= lat <= north and west <= lng <= east):
+            return False
+        return self.is_box or _in_polygon(lat, lng, self.polygon)
+
+    def intersects(self, tile: 'Tile') -> bool:
+        if self.is_box:
+            south, west, north, east = self.bounds
+            return tile.south <= north and tile.north >= south and tile.west <= east and tile.east >= west
+
+        corners = tile.corners()
+        if any(self.contains(lat, lng) for lat, lng in corners + [tile.center]):
+            return True
+        if any(tile.contains(lat, lng) for lat, lng in self.polygon):
+            return True
+
+        edges = list(zip(self.polygon, self.polygon[1:] + self.polygon[:1]))
+        tile_edges = list(zip(corners, corners[1:] + corners[:1]))
+        return any(_segments_cross(a, b, c, d) for a, b in edges for c, d in tile_edges)
+
+
+class Tile:
+    __slots__ = ('south', 'west', 'north', 'east', 'depth')
+
+    def __init__(self, south: float, west: float, north: float, east: float, depth: int = 0) -> None:
+        self.south = south
+        self.west = west
+        self.north = north
+        self.east = east
+        self.depth = depth
+
+    @property
+    def center(self) -> Point:
+        return (self.south + self.north) / 2, (self.west + self.east) / 2
+
+    @property
+    def size_km(self) -> float:
+        '''Length of the longer side.'''
+
+        lat, _ = self.center
+        return max((self.north - self.south) * KM_PER_DEGREE, (self.east - self.west) * KM_PER_DEGREE * cos(radians(lat)))
+
+    @property
+    def zoom(self) -> float:
+        '''Zoom level at which the tile (with some overlap) fills the map viewport.'''
+
+        lat, _ = self.center
+        # spans in degrees of longitude, latitude degrees being stretched by the Mercator projection
+        span = max(self.east - self.west, (self.north - self.south) / max(cos(radians(lat)), 0.01)) * TILE_OVERLAP
+        zoom = log2(360 * VIEWPORT_PX / 256 / max(span, 1e-9))
+        return min(max(floor(zoom * 10) / 10, 3.0), 21.0)
+
+    @property
+    def coordinates(self) -> str:
+        '''Value of the `coordinates` parameter of Google Maps endpoints ("@latitude,longitude,zoomz").'''
+
+        lat, lng = self.center
+        return f'@{lat:.7f},{lng:.7f},{self.zoom}z'
+
+    def corners(self) -> List[Point]:
+        return [(self.south, self.west), (self.south, self.east), (self.north, self.east), (self.north, self.west)]
+
+    def contains(self, lat: float, lng: float) -> bool:
+        return self.south <= lat <= self.north and self.west <= lng <= self.east
+
+    def split(self) -> List['Tile']:
+        lat, lng = self.center
+        return [
+            Tile(self.south, self.west, lat, lng, self.depth + 1),
+            Tile(self.south, lng, lat, self.east, self.depth + 1),
+            Tile(lat, self.west, self.north, lng, self.depth + 1),
+            Tile(lat, lng, self.north, self.east, self.depth + 1),
+        ]
+
+    def __repr__(self) -> str:
+        return f'Tile({self.south}, {self.west}, {self.north}, {self.east}, depth={self.depth})'
+
+
+def plan_tiles(area: Union[Area, AreaLike], cell_size_km: float = 2.0) -> List[Tile]:
+    '''
+        Grid of tiles of about `cell_size_km` covering an area; cells outside of a polygon are left out.
+
+            Parameters:
+                area (Area | tuple | list): bounding box (south, west, north, east) or polygon of (latitude, longitude).
+                cell_size_km (float): side of the cells. Default: 2.
+
+            Returns:
+                list[Tile]: the tiles, use `tile.coordinates` for the `coordinates` parameter of `google_maps_search()`.
+    '''
+
+    if not isinstance(area, Area):
+        area = Area(area)
+    if cell_size_km <= 0:
+        raise ValueError('cell_size_km must be positive')
+
+    south, west, north, east = area.bounds
+    mid_lat = radians((south + north) / 2)
+    rows = max(1, ceil((north - south) * KM_PER_DEGREE / cell_size_km))
+    cols = max(1, ceil((east - west) * KM_PER_DEGREE * cos(mid_lat) / cell_size_km))
+    lat_step = (north - south) / rows
+    lng_step = (east - west) / cols
+
+    tiles = []
+    for row in range(rows):
+        for col in range(cols):
+            tile = Tile(south + row * lat_step, west + col * lng_step, south + (row + 1) * lat_step, west + (col + 1) * lng_step)
+            if area.intersects(tile):
+                tiles.append(tile)
+    return tiles
+
+
+def _in_polygon(lat: float, lng: float, polygon: List[Point]) -> bool:
+    inside = False
+    for (lat1, lng1), (lat2, lng2) in zip(polygon, polygon[1:] + polygon[:1]):
+        if (lng1 > lng) != (lng2 > lng) and lat < (lat2 - lat1) * (lng - lng1) / (lng2 - lng1) + lat1:
+            inside = not inside
+    return inside
+
+
+def _segments_cross(a: Point, b: Point, c: Point, d: Point) -> bool:
+    def orientation(p: Point, q: Point, r: Point) -> float:
+        return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+    return (orientation(a, b, c) * orientation(a, b, d) < 0) and (orientation(c, d, a) * orientation(c, d, b) < 0)
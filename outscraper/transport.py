@@ -1,7 +1,23 @@
+import json
+import os
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock, Thread
 from time import sleep
-from typing import Dict, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from .exceptions import APIConnectionError, APIResponseError, status_error
+from .export import PENDING_PROBE_SIZE, is_pending_archive
+from .mirrors import MirrorSelector
+from .polling import PollingStrategy, estimate_job_size
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .webhooks import WebhookReceiver
+from .streaming import JSONStream
+from .watcher import ArchiveWatcher
 
 
 API_URLS = [
@@ -10,68 +26,376 @@ API_URLS = [
     'https://api.outscraper.net'
 ]
 
+# statuses that mean the mirror itself (not the request) is unhealthy
+MIRROR_FAILURE_STATUSES = (502, 503, 504)
+
 
 class OutscraperTransport:
     _max_ttl = 60 * 60
-    _requests_pause = 5
-    _max_retries = 2
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, *, api_urls: Optional[List[str]] = None, pool_connections: Optional[int] = None,
+        pool_maxsize: int = 10, pool_block: bool = True, keep_alive: bool = True, timeout: Optional[float] = None,
+        mirror_failure_threshold: int = 3, mirror_recovery_time: float = 30.0, prewarm: bool = False,
+        polling: Optional[PollingStrategy] = None, rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+        webhook_receiver: Optional[WebhookReceiver] = None):
+        '''
+            HTTP transport with a shared, thread-safe pool of keep-alive connections.
+
+                Parameters:
+                    api_key (str): Outscraper API key.
+                    api_urls (list[str] | None): API mirrors to use, in order of preference. Default: API_URLS.
+                    pool_connections (int | None): number of per-host connection pools to cache. Default: one per mirror.
+                    pool_maxsize (int): maximum number of connections kept open to each host. Default: 10.
+                    pool_block (bool): whether threads should wait for a free connection when a host reaches `pool_maxsize`
+                        instead of opening throwaway connections. Default: True.
+                    keep_alive (bool): whether to reuse connections between requests. Default: True.
+                    timeout (float | None): default timeout in seconds for each HTTP request. Default: None (no timeout).
+                    mirror_failure_threshold (int): consecutive failures after which a mirror is taken out of rotation. Default: 3.
+                    mirror_recovery_time (float): seconds between background probes of a failing mirror. Default: 30.
+                    prewarm (bool): whether to open a connection to every mirror in the background right away,
+                        which also measures their latency before the first request. Default: False.
+                    polling (PollingStrategy | None): schedule of archive polls while waiting for async requests.
+                        Default: PollingStrategy() (first poll after ~1 second, then growing pauses up to 30 seconds).
+                    rate_limiter (RateLimiter | None): client-side limits checked before every request; one limiter can be
+                        shared by several clients. Default: None.
+                    retry_policy (RetryPolicy | None): retries of failed requests and failover between mirrors.
+                        Default: RetryPolicy() (3 attempts for 429 and 5xx responses of GET requests).
+                    webhook_receiver (WebhookReceiver | None): local server whose callbacks replace most archive polls. With a
+                        `public_url`, its URL is sent as the `webhook` of the async requests the client waits for itself
+                        (unless a webhook is given explicitly), which replaces the webhook of the account's integrations
+                        for these requests. Default: None.
+        '''
+
         self._api_headers: Dict[str, str] = {'X-API-KEY': api_key, 'client': f'Python SDK'}
+        self._api_urls: List[str] = list(api_urls or API_URLS)
+        self._pool_connections = pool_connections or len(self._api_urls)
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keep_alive = keep_alive
+        self._timeout = timeout
+        self.polling = polling or PollingStrategy(max_ttl=self._max_ttl)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.webhook_receiver = webhook_receiver
+
+        if not keep_alive:
+            self._api_headers['Connection'] = 'close'
+
+        self._session: Optional[requests.Session] = None
+        self._watcher: Optional[ArchiveWatcher] = None
+        self._session_lock = Lock()
+
+        self.mirrors = MirrorSelector(self._api_urls,
+            failure_threshold=mirror_failure_threshold,
+            recovery_time=mirror_recovery_time,
+            probe=self._probe_mirror,
+        )
+
+        if prewarm:
+            self.prewarm()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @property
+    def watcher(self) -> ArchiveWatcher:
+        if self._watcher is None:
+            with self._session_lock:
+                if self._watcher is None:
+                    self._watcher = ArchiveWatcher(self)
+        return self._watcher
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        # the API is authenticated by header, dropping cookies keeps the session free of shared mutable state between threads
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.headers.update(self._api_headers)
+
+        adapter = HTTPAdapter(pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize, pool_block=self._pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def prewarm(self) -> None:
+        for api_url in self._api_urls:
+            Thread(target=self._prewarm_mirror, args=(api_url,), name='outscraper-prewarm', daemon=True).start()
+
+    def _prewarm_mirror(self, api_url: str) -> None:
+        try:
+            latency = self._probe_mirror(api_url)
+        except Exception:
+            self.mirrors.record_failure(api_url)
+        else:
+            self.mirrors.record_success(api_url, latency)
+
+    def _probe_mirror(self, api_url: str) -> float:
+        response = self.session.head(api_url, timeout=10)
+        if response.status_code in MIRROR_FAILURE_STATUSES:
+            raise status_error(response)
+        return response.elapsed.total_seconds()
+
+    def close(self) -> None:
+        self.mirrors.stop()
+
+        with self._session_lock:
+            if self._watcher is not None:
+                self._watcher.stop()
+                self._watcher = None
+
+            if self._session is not None:
+                self._session.close()
+                self._session = None
 
-    def api_request(self, method: str, path: str, *, wait_async: bool, async_request: bool, use_handle_response: bool, **kwargs) -> Union[
-        requests.Response, list, dict]:
-        for api_url in API_URLS:
+    def api_request(self, method: str, path: str, *, wait_async: bool, async_request: bool, use_handle_response: bool,
+        watched: bool = False, **kwargs) -> Union[requests.Response, list, dict]:
+        '''
+            Send a request to the first healthy mirror, with retries and failover.
+
+            `watched` tells that the client waits for the archive of this async request itself (e.g., `submit()`), even
+            though `async_request` makes the call return the submitted request.
+        '''
+
+        if self._timeout is not None:
+            kwargs.setdefault('timeout', self._timeout)
+
+        # the caller's own async requests keep the webhook it gave, or the one of the account's integrations
+        webhook = wait_async and (watched or not async_request) and self._set_webhook(kwargs)
+
+        policy = self.retry_policy
+        tried: List[str] = []
+        attempt = 0
+
+        while True:
+            attempt += 1
+            api_url = self._next_mirror(tried)
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method, path)
 
             try:
-                response = requests.request(method, f'{api_url}{path}', headers=self._api_headers, **kwargs)
-            except (requests.exceptions.ConnectionError, requests.exceptions.SSLError):
+                response = self.session.request(method, f'{api_url}{path}', **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.SSLError) as e:
+                self.mirrors.record_failure(api_url)
+
+                # the request didn't reach the API, so every mirror gets a chance whatever the method
+                if attempt >= len(self._api_urls) and not policy.should_retry(method, path, None, attempt):
+                    raise APIConnectionError('Failed to perform request against all API URLs', mirror=api_url, attempts=attempt) from e
+                if not self._has_untried_mirror(tried):
+                    sleep(policy.delay(attempt))
+                continue
+
+            status_code = response.status_code
+            if status_code in MIRROR_FAILURE_STATUSES:
+                self.mirrors.record_failure(api_url)
+            else:
+                self.mirrors.record_success(api_url, response.elapsed.total_seconds() if self._samples_latency(method, path) else None)
+
+            if policy.should_retry(method, path, status_code, attempt):
+                delay = policy.delay(attempt, response)
+                response.close()
+
+                # an unhealthy mirror is swapped for an untried one right away, other statuses (e.g., 429) need the wait
+                if status_code not in MIRROR_FAILURE_STATUSES or not self._has_untried_mirror(tried):
+                    sleep(delay)
                 continue
 
+            response.mirror = api_url
+            response.attempts = attempt
+            response.webhook = webhook
+
             if use_handle_response:
-                return self._handle_response(response, wait_async, async_request)
+                return self._handle_response(response, wait_async, async_request, size_hint=estimate_job_size(kwargs.get('params') or kwargs.get('json')))
             return response
 
-        raise Exception('Failed to perform request against all API URLs')
+    def _set_webhook(self, kwargs: dict) -> bool:
+        '''Send the receiver's URL as the request's webhook, only when Outscraper can reach it; returns whether it was sent.'''
+
+        if self.webhook_receiver is None or not self.webhook_receiver.public_url:
+            return False
+
+        name = 'json' if kwargs.get('json') is not None else 'params'
+        params = kwargs.get(name)
+        if not isinstance(params, dict) or not params.get('async', True) or params.get('webhook'):
+            return False
+
+        kwargs[name] = {**params, 'webhook': self.webhook_receiver.url}
+        return True
+
+    def _next_mirror(self, tried: List[str]) -> str:
+        api_url = self.mirrors.choose(tried)
+        if api_url is None:
+            # every mirror has been tried, start another round from the best one
+            tried.clear()
+            api_url = self.mirrors.choose(tried)
+
+        tried.append(api_url)
+        return api_url
 
-    def _handle_response(self, response: requests.models.Response, wait_async: bool, async_request: bool) -> Union[list, dict]:
+    def _samples_latency(self, method: str, path: str) -> bool:
+        # request status and archive calls return right away, scraping calls take as long as their job
+        return method.upper() in ('GET', 'HEAD') and (path == '/requests' or path.startswith('/requests/'))
+
+    def _has_untried_mirror(self, tried: List[str]) -> bool:
+        return any(api_url not in tried for api_url in self._api_urls)
+
+    def _handle_response(self, response: requests.models.Response, wait_async: bool, async_request: bool, size_hint: Optional[int] = None) -> Union[list, dict]:
         if 199 < response.status_code < 300:
-            if response.json().get('error'):
-                error_message = response.json().get('errorMessage')
-                raise Exception(f'error: {error_message}')
+            response_json = response.json()
+
+            if response_json.get('error'):
+                error_message = response_json.get('errorMessage')
+                raise APIResponseError(f'error: {error_message}', error_message, status_code=response.status_code,
+                    mirror=getattr(response, 'mirror', None), attempts=getattr(response, 'attempts', 1))
 
             if wait_async:
-                response_json = response.json()
+                if getattr(response, 'webhook', False) and 'id' in response_json:
+                    self.watcher.expect_callback(response_json['id'])
 
                 if async_request:
                     return response_json
                 else:
-                    return self._wait_request_archive(response_json['id']).get('data', [])
+                    return self._wait_request_archive(response_json['id'], size_hint=size_hint).get('data', [])
             else:
-                return response.json().get('data', [])
+                return response_json.get('data', [])
 
-        raise Exception(f'Response status code: {response.status_code}')
+        raise status_error(response)
 
-    def _wait_request_archive(self, request_id: str) -> dict:
-        ttl = self._max_ttl / self._requests_pause
+    def _wait_request_archive(self, request_id: str, size_hint: Optional[int] = None) -> dict:
+        return self.watcher.watch(request_id, size_hint=size_hint).result()
 
-        while ttl > 0:
-            ttl -= 1
+    def _get_archive(self, request_id: str) -> dict:
+        response = self.api_request('GET', f'/requests/{request_id}', use_handle_response=False, wait_async=False, async_request=False)
+        if 199 < response.status_code < 300:
+            return response.json()
+        raise status_error(response)
 
-            sleep(self._requests_pause)
+    def iter_archive(self, request_id: str, *, flatten: bool = True, size_hint: Optional[int] = None,
+        chunk_size: int = 64 * 1024) -> Iterator[Any]:
+        '''
+            Wait for an async request and yield the items of its archive while it downloads, see `JSONStream`.
+            Closing the generator early closes the connection without downloading the rest.
+        '''
 
-            try:
-                result = self._get_archive(request_id)
-            except:
-                sleep(self._requests_pause)
-                result = self._get_archive(request_id)
+        for delay in self.polling.delays(size_hint):
+            response = self.api_request('GET', f'/requests/{request_id}', use_handle_response=False, wait_async=False,
+                async_request=False, stream=True)
+
+            with response:
+                if not 199 < response.status_code < 300:
+                    raise status_error(response)
 
-            if result['status'] != 'Pending': return result
+                archive = JSONStream(response.iter_content(chunk_size), flatten=flatten)
+                items = 0
+                for item in archive:
+                    items += 1
+                    yield item
+
+                if items or archive.fields.get('status') != 'Pending':
+                    return
+
+            sleep(delay)
 
         raise Exception('Timeout exceeded')
 
-    def _get_archive(self, request_id: str) -> dict:
-        response = self.api_request('GET', f'/requests/{request_id}', use_handle_response=False, wait_async=False, async_request=False)
-        if 199 < response.status_code < 300:
-            return response.json()
-        raise Exception(f'Response status code: {response.status_code}')
+    def export_archive(self, request_id: str, path: str, *, size_hint: Optional[int] = None, chunk_size: int = 1024 * 1024,
+        max_resumes: int = 3) -> str:
+        '''
+            Wait for an async request and write its raw archive to `path` without decoding it.
+
+            The body is requested compressed (gzip, or brotli when the `brotli` package is installed) and decompressed
+            while writing. It is downloaded to `<path>.part` first; an interrupted download, in this call or a previous one,
+            continues from the end of the partial file with an HTTP Range request. The request id and ETag of the
+            partial file are kept in `<path>.part.json`; a partial file of another request or of a changed archive is
+            downloaded again from the start.
+        '''
+
+        part_path = f'{path}.part'
+        source_path = f'{part_path}.json'
+
+        for delay in self.polling.delays(size_hint):
+            resumes = 0
+            while True:
+                try:
+                    self._download_archive(request_id, part_path, source_path, chunk_size)
+                    break
+                except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                    resumes += 1
+                    if resumes > max_resumes:
+                        raise
+
+            if not is_pending_archive(part_path):
+                os.replace(part_path, path)
+                os.remove(source_path)
+                return path
+
+            os.remove(part_path)
+            os.remove(source_path)
+            sleep(delay)
+
+        raise Exception('Timeout exceeded')
+
+    def _download_archive(self, request_id: str, part_path: str, source_path: str, chunk_size: int) -> None:
+        source = _read_part_source(source_path)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        # a shorter partial file may be the archive of a pending request, which is not worth resuming
+        if offset <= PENDING_PROBE_SIZE or source.get('request_id') != request_id:
+            offset = 0
+
+        headers = {'Accept-Encoding': ACCEPT_ENCODING}
+        if offset:
+            # the partial file holds the decompressed body, ranges of the uncompressed representation continue it
+            headers = {'Accept-Encoding': 'identity', 'Range': f'bytes={offset}-'}
+            if source.get('etag') and not source['etag'].startswith('W/'):
+                # a changed archive comes back whole instead of as a range
+                headers['If-Range'] = source['etag']
+
+        response = self.api_request('GET', f'/requests/{request_id}', use_handle_response=False, wait_async=False,
+            async_request=False, stream=True, headers=headers)
+
+        with response:
+            if offset and response.status_code == 416:
+                return
+            if not 199 < response.status_code < 300:
+                raise status_error(response)
+
+            etag = response.headers.get('ETag')
+            if offset and response.status_code == 206 and not _same_etag(etag, source.get('etag')):
+                # the range belongs to another version of the archive, start over
+                os.remove(part_path)
+                return self._download_archive(request_id, part_path, source_path, chunk_size)
+
+            # servers without range support send the whole body again
+            resumed = offset > 0 and response.status_code == 206
+            if not resumed:
+                _write_part_source(source_path, {'request_id': request_id, 'etag': etag})
+
+            with open(part_path, 'ab' if resumed else 'wb') as file:
+                for chunk in response.iter_content(chunk_size):
+                    file.write(chunk)
+
+
+def _read_part_source(path: str) -> dict:
+    try:
+        with open(path) as file:
+            source = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return source if isinstance(source, dict) else {}
+
+
+def _write_part_source(path: str, source: dict) -> None:
+    with open(path, 'w') as file:
+        json.dump(source, file)
+
+
+def _same_etag(etag: Optional[str], stored: Optional[str]) -> bool:
+    # compressed responses often carry the weak form of the same tag
+    def strip(tag):
+        return tag[2:] if tag and tag.startswith('W/') else tag
+
+    return strip(etag) == strip(stored)
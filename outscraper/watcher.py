@@ -0,0 +1,333 @@
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from heapq import heapify, heappop, heappush
+from itertools import chain
+from threading import Condition, Thread
+from time import monotonic
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from .exceptions import ClientClosedError, RateLimitExceeded, status_error
+
+
+# finished request ids reported before their watch started, e.g. by a webhook for a quick job
+MAX_EARLY_NOTIFICATIONS = 1000
+# requests sent with the webhook receiver's URL whose watch hasn't started yet
+MAX_EXPECTED_CALLBACKS = 1000
+
+
+class _Watch:
+    __slots__ = ('request_id', 'future', 'delays', 'errors', 'seq', 'in_flight', 'notified', 'watchers')
+
+    def __init__(self, request_id: str, future: Future, delays: Iterator[float]) -> None:
+        self.request_id = request_id
+        self.future = future
+        self.delays = delays
+        self.errors = 0
+        # schedule entries of older generations are stale
+        self.seq = 0
+        self.in_flight = False
+        self.notified = False
+        # callers of watch() that still wait for the request
+        self.watchers = 0
+
+
+class ArchiveWatcher:
+    def __init__(self, transport: OutscraperTransport, *, history_threshold: int = 3, history_page_size: int = 100,
+        max_fetch_workers: Optional[int] = None) -> None:
+        '''
+            One background thread that polls every outstanding request of a transport on a shared schedule.
+
+            When several requests are due at the same time, one `GET /requests?type=running` listing tells which of
+            them are still running; archives are fetched only for requests that are no longer listed.
+
+                Parameters:
+                    transport (OutscraperTransport): transport used for the polls; its `polling` strategy sets the schedule.
+                    history_threshold (int): minimum number of due requests to check through the running requests
+                        listing instead of fetching their archives one by one. Default: 3.
+                    history_page_size (int): page size of the running requests listing. Default: 100.
+                    max_fetch_workers (int | None): archives downloaded in parallel. Default: the transport's `pool_maxsize`.
+        '''
+
+        self._transport = transport
+        self._history_threshold = history_threshold
+        self._history_page_size = history_page_size
+        self._fetch_executor = ThreadPoolExecutor(max_fetch_workers or transport._pool_maxsize, thread_name_prefix='outscraper-archive')
+
+        self._watches: Dict[str, _Watch] = {}
+        self._early: OrderedDict = OrderedDict()
+        self._expected: OrderedDict = OrderedDict()
+        self._schedule: List[tuple] = []
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._stopped = False
+
+        self.polls = 0
+        self.history_polls = 0
+        self.notifications = 0
+
+        self._receiver = transport.webhook_receiver
+        if self._receiver is not None:
+            self._receiver.add_listener(self.notify)
+
+    def watch(self, request_id: str, size_hint: Optional[int] = None, callback: Optional[Callable[[Future], None]] = None) -> Future:
+        '''
+            Start tracking an async request.
+
+                Parameters:
+                    request_id (str): id of the submitted request.
+                    size_hint (int | None): expected number of result items, see `PollingStrategy`.
+                    callback (callable | None): called with the future once the request is finished.
+
+                Returns:
+                    Future: resolves to the archive (dict with `status` and `data`) when the request is finished.
+        '''
+
+        with self._condition:
+            if self._stopped:
+                raise ClientClosedError('the archive watcher is stopped')
+
+            watch = self._watches.get(request_id)
+
+            if watch is None:
+                delays = self._transport.polling.delays(size_hint)
+                if self._receiver is not None and self._expected.pop(request_id, None):
+                    # the webhook is expected to report the request; polling only starts after the grace period
+                    delays = chain([self._receiver.grace_period], delays)
+
+                watch = _Watch(request_id, Future(), delays)
+                self._watches[request_id] = watch
+                self._schedule_next(watch, 0.0 if self._early.pop(request_id, None) else None)
+                self._ensure_thread()
+                self._condition.notify()
+
+            watch.watchers += 1
+
+        if callback is not None:
+            watch.future.add_done_callback(callback)
+        return watch.future
+
+    def unwatch(self, request_id: str) -> None:
+        '''
+            Stop tracking a request for one caller of `watch()` (e.g., a cancelled `RequestHandle`).
+            Once no caller waits for the request, it is no longer polled and its future is cancelled.
+        '''
+
+        with self._condition:
+            watch = self._watches.get(request_id)
+            if watch is None:
+                return
+
+            watch.watchers -= 1
+            if watch.watchers > 0:
+                return
+            # its schedule entries are stale now and skipped by the polling thread
+            del self._watches[request_id]
+
+        watch.future.cancel()
+
+    def expect_callback(self, request_id: str) -> None:
+        '''Report that a request was sent with the webhook receiver's URL, so its polling waits for the grace period.'''
+
+        with self._condition:
+            self._expected[request_id] = True
+            while len(self._expected) > MAX_EXPECTED_CALLBACKS:
+                self._expected.popitem(last=False)
+
+    def notify(self, request_id: str) -> None:
+        '''Report that a request is finished (e.g., from a webhook), so its archive is fetched right away.'''
+
+        with self._condition:
+            self.notifications += 1
+            watch = self._watches.get(request_id)
+
+            if watch is None:
+                self._early[request_id] = True
+                while len(self._early) > MAX_EARLY_NOTIFICATIONS:
+                    self._early.popitem(last=False)
+                return
+
+            if watch.in_flight:
+                # the poll in progress may have been too early, _reschedule() polls again right away
+                watch.notified = True
+            else:
+                self._schedule_next(watch, 0.0)
+                self._condition.notify()
+
+    def report(self, request_id: str, archive: dict) -> None:
+        '''Resolve a watched request with its finished archive fetched elsewhere (e.g., by `RequestHandle.status()`).'''
+
+        with self._condition:
+            watch = self._watches.get(request_id)
+        if watch is not None:
+            self._finish(watch, result=archive)
+
+    def pending(self) -> Set[str]:
+        with self._condition:
+            return set(self._watches)
+
+    def stop(self) -> None:
+        '''Stop polling; the requests still watched fail with `ClientClosedError`, so nobody waits for them forever.'''
+
+        if self._receiver is not None:
+            self._receiver.remove_listener(self.notify)
+
+        with self._condition:
+            self._stopped = True
+            watches = list(self._watches.values())
+            self._watches.clear()
+            self._schedule = []
+            self._condition.notify()
+        self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+
+        for watch in watches:
+            watch.future.set_exception(ClientClosedError(f'the client was closed while request {watch.request_id} was pending'))
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = Thread(target=self._run, name='outscraper-watcher', daemon=True)
+            self._thread.start()
+
+    def _schedule_next(self, watch: _Watch, delay: Optional[float] = None) -> bool:
+        if delay is None:
+            delay = next(watch.delays, None)
+            if delay is None:
+                return False
+
+        watch.seq += 1
+        due_at = monotonic() + delay
+        # a request may be polled early, once it has waited at least half of its pause, to share a batch with others
+        heappush(self._schedule, (due_at, due_at - delay / 2, watch.request_id, watch.seq))
+        return True
+
+    def _reschedule(self, watch: _Watch) -> None:
+        with self._condition:
+            if self._watches.get(watch.request_id) is not watch:
+                # failed by stop()
+                return
+
+            scheduled = self._schedule_next(watch, 0.0 if watch.notified else None)
+            watch.in_flight = watch.notified = False
+            if scheduled:
+                self._condition.notify()
+            else:
+                self._watches.pop(watch.request_id, None)
+
+        if not scheduled:
+            watch.future.set_exception(Exception('Timeout exceeded'))
+
+    def _finish(self, watch: _Watch, result: Optional[dict] = None, exception: Optional[BaseException] = None) -> None:
+        with self._condition:
+            if self._watches.get(watch.request_id) is not watch:
+                return
+            del self._watches[watch.request_id]
+
+        if exception is not None:
+            watch.future.set_exception(exception)
+        else:
+            watch.future.set_result(result)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and (not self._schedule or self._schedule[0][0] > monotonic()):
+                    self._condition.wait(self._schedule[0][0] - monotonic() if self._schedule else None)
+
+                if self._stopped:
+                    return
+
+                now = monotonic()
+                due = []
+                while self._schedule and self._schedule[0][0] <= now:
+                    due.append(heappop(self._schedule))
+
+                if len(due) + len(self._schedule) >= self._history_threshold:
+                    waiting = []
+                    for entry in self._schedule:
+                        if entry[1] <= now:
+                            due.append(entry)
+                        else:
+                            waiting.append(entry)
+                    self._schedule = waiting
+                    heapify(self._schedule)
+
+                due = [self._watches[request_id] for _, _, request_id, seq in due
+                    if request_id in self._watches and self._watches[request_id].seq == seq]
+                for watch in due:
+                    watch.in_flight = True
+
+            if len(due) >= self._history_threshold:
+                # the listing may take several calls, it must not hold up the timers of the other requests
+                self._submit(self._poll_finished, due)
+            else:
+                for watch in due:
+                    self._submit(self._poll, watch)
+
+    def _submit(self, fn: Callable, *args) -> None:
+        try:
+            self._fetch_executor.submit(fn, *args)
+        except RuntimeError:
+            # stopped meanwhile, stop() failed the watches
+            pass
+
+    def _poll_finished(self, due: List[_Watch]) -> None:
+        '''Fetch the archives of the due requests that the running requests listing no longer shows.'''
+
+        try:
+            running = self._running_request_ids()
+        except Exception:
+            running = set()
+
+        for watch in due:
+            if watch.request_id in running:
+                self._reschedule(watch)
+            else:
+                self._submit(self._poll, watch)
+
+    def _running_request_ids(self) -> Set[str]:
+        running = set()
+        skip = 0
+
+        while True:
+            with self._condition:
+                self.history_polls += 1
+
+            response = self._transport.api_request('GET', '/requests', wait_async=False, async_request=False, use_handle_response=False,
+                params={'type': 'running', 'skip': skip, 'pageSize': self._history_page_size})
+
+            if not 199 < response.status_code < 300:
+                raise status_error(response)
+
+            page = response.json()
+            if isinstance(page, dict):
+                page = page.get('data') or page.get('requests') or []
+
+            running.update(item['id'] for item in page if isinstance(item, dict) and 'id' in item)
+
+            if len(page) < self._history_page_size:
+                return running
+            skip += self._history_page_size
+
+    def _poll(self, watch: _Watch) -> None:
+        with self._condition:
+            self.polls += 1
+
+        try:
+            result = self._transport._get_archive(watch.request_id)
+        except RateLimitExceeded:
+            # the poll was never sent, try again on the next turn
+            self._reschedule(watch)
+            return
+        except Exception as e:
+            watch.errors += 1
+            if watch.errors > 1:
+                self._finish(watch, exception=e)
+            else:
+                self._reschedule(watch)
+            return
+
+        watch.errors = 0
+        if result.get('status') == 'Pending':
+            self._reschedule(watch)
+        else:
+            self._finish(watch, result=result)
@@ -0,0 +1,113 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from secrets import token_urlsafe
+from threading import Lock, Thread
+from typing import Callable, List, Optional
+
+
+class WebhookReceiver:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, public_url: Optional[str] = None, grace_period: Optional[float] = None,
+        token: Optional[str] = None) -> None:
+        '''
+            Local HTTP server that receives Outscraper webhooks, so that finished requests are collected right away
+            instead of being polled for.
+
+            With a `public_url` (e.g., the URL of a proxy or tunnel), the client passes the receiver's URL as the
+            `webhook` of every async request it waits for itself, never of requests sent with `async_request=True`.
+            When a callback arrives, the request's archive is fetched at once; requests without a callback within
+            `grace_period` seconds are polled as usual. The URL sent replaces the webhook configured in the account's
+            integrations for those requests.
+
+            Without a `public_url` no webhook is sent, since Outscraper can't reach a local address; callbacks that
+            arrive anyway (e.g., from a forwarder of the account's integration webhook) still end the polling early.
+            ```python
+            receiver = WebhookReceiver(port=8765, public_url='https://hooks.example.com')
+            client = OutscraperClient(api_key='SECRET_API_KEY', webhook_receiver=receiver)
+            ```
+
+                Parameters:
+                    host (str): interface to listen on. Default: "127.0.0.1".
+                    port (int): port to listen on. Default: 0 (any free port).
+                    public_url (str | None): URL under which Outscraper can reach this server (e.g., behind a proxy or tunnel).
+                        Default: None (no webhook is sent).
+                    grace_period (float | None): seconds to wait for a callback before falling back to polling.
+                        Default: 30 with a `public_url`, otherwise 0.
+                    token (str | None): secret path segment that callbacks have to use. Default: a random token.
+        '''
+
+        if grace_period is None:
+            grace_period = 30.0 if public_url else 0.0
+        self.grace_period = grace_period
+        self.public_url = public_url
+        self.token = token or token_urlsafe(16)
+        self.received = 0
+
+        self._listeners: List[Callable[[str], None]] = []
+        self._lock = Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = Thread(target=self._server.serve_forever, name='outscraper-webhooks', daemon=True)
+        self._thread.start()
+
+        bound_host, bound_port = self._server.server_address[:2]
+        base_url = public_url or f'http://{"127.0.0.1" if bound_host == "0.0.0.0" else bound_host}:{bound_port}'
+        self.url = f'{base_url.rstrip("/")}/outscraper-webhook/{self.token}'
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        '''`listener(request_id)` is called for every callback received.'''
+
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str], None]) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'WebhookReceiver':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _notify(self, request_id: str) -> None:
+        with self._lock:
+            self.received += 1
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            listener(request_id)
+
+    def _handler(self):
+        receiver = self
+        path = f'/outscraper-webhook/{self.token}'
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if self.path.split('?')[0].rstrip('/') != path:
+                    return self._respond(404)
+
+                try:
+                    payload = json.loads(body or b'{}')
+                except ValueError:
+                    return self._respond(400)
+
+                request_id = payload.get('id') or payload.get('request_id') if isinstance(payload, dict) else None
+                self._respond(200 if request_id else 400)
+                if request_id:
+                    receiver._notify(request_id)
+
+            def _respond(self, status: int) -> None:
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
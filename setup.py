@@ -24,6 +24,13 @@ setup(
     license='MIT',
     packages=['outscraper'],
     install_requires=['requests'],
+    extras_require={
+        'brotli': ['brotli'],
+        'parquet': ['pyarrow'],
+    },
+    entry_points={
+        'console_scripts': ['outscraper=outscraper.cli:main'],
+    },
     include_package_data=True,
     zip_safe=False,
     long_description_content_type='text/x-rst',
@@ -0,0 +1,30 @@
+import unittest
+
+from outscraper import OutscraperClient
+from outscraper.tiling import Area
+
+
+class NewPlacesTest(unittest.TestCase):
+    def test_duplicate_by_either_id(self):
+        client = OutscraperClient('k')
+        area = Area((40.0, -74.0, 40.2, -73.8))
+        seen = set()
+
+        first = list(client._new_places(area, [{'place_id': 'p1', 'google_id': 'g1'}, {'name': 'no ids'}], seen, True))
+        later = list(client._new_places(area, [{'google_id': 'g1'}, {'place_id': 'p1'}, {'place_id': 'p2'},
+            {'place_id': 'p2', 'google_id': 'g2'}, {'google_id': 'g2'}, {'name': 'no ids'}], seen, True))
+
+        self.assertEqual(first, [{'place_id': 'p1', 'google_id': 'g1'}, {'name': 'no ids'}])
+        self.assertEqual(later, [{'place_id': 'p2'}, {'name': 'no ids'}])
+
+    def test_clip(self):
+        client = OutscraperClient('k')
+        area = Area((40.0, -74.0, 40.2, -73.8))
+        places = [{'place_id': 'in', 'latitude': 40.1, 'longitude': -73.9}, {'place_id': 'out', 'latitude': 41.0, 'longitude': -73.9}]
+
+        self.assertEqual([place['place_id'] for place in client._new_places(area, places, set(), True)], ['in'])
+        self.assertEqual([place['place_id'] for place in client._new_places(area, places, set(), False)], ['in', 'out'])
+
+
+if __name__ == '__main__':
+    unittest.main()
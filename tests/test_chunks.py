@@ -0,0 +1,107 @@
+import random
+import time
+import unittest
+from threading import Lock
+
+from outscraper import ChunkedRequestError, OutscraperClient
+
+
+class StandInTransport:
+    '''Answers each query with its places at once; queries starting with "bad" fail their whole request.'''
+
+    def __init__(self, places_per_query=2):
+        self.places_per_query = places_per_query
+        self.requests = []
+        self._lock = Lock()
+
+    def api_request(self, method, path, *, wait_async, async_request, use_handle_response, **kwargs):
+        payload = kwargs.get('json') or kwargs.get('params')
+        with self._lock:
+            self.requests.append(payload)
+        # chunks finish out of order
+        time.sleep(random.random() * 0.01)
+
+        queries = payload['query']
+        if any(query.startswith('bad') for query in queries):
+            raise ValueError('bad query')
+
+        if payload.get('dropDuplicates'):
+            # one array of places without repetitions, places of queries sharing a number are the same
+            places, seen = [], set()
+            for query in queries:
+                place_id = f'place-{query.split("-")[-1]}'
+                if place_id not in seen:
+                    seen.add(place_id)
+                    places.append({'query': query, 'place_id': place_id})
+            return [places]
+        return [[{'query': query, 'place_id': f'{query}-{i}'} for i in range(self.places_per_query)] for query in queries]
+
+    def close(self):
+        pass
+
+
+class ChunkedRequestTest(unittest.TestCase):
+    def client(self, transport):
+        client = OutscraperClient('k', chunk_concurrency=4)
+        client._transport = transport
+        return client
+
+    def test_chunks(self):
+        client = self.client(StandInTransport())
+        params = {'query': [f'q{i}' for i in range(600)], 'async': False}
+
+        chunks = client._chunks('/google-maps-search', False, True, {'json': params})
+        self.assertEqual([len(chunk['json']['query']) for chunk in chunks], [250, 250, 100])
+        self.assertTrue(all(chunk['json']['async'] for chunk in chunks))
+        self.assertIsNone(client._chunks('/google-maps-search', True, True, {'json': params}))
+        self.assertIsNone(client._chunks('/google-maps-search', False, True, {'json': {**params, 'ui': True}}))
+        self.assertIsNone(client._chunks('/google-maps-search', False, True, {'json': {**params, 'query': params['query'][:250]}}))
+
+    def test_merge_keeps_query_order(self):
+        transport = StandInTransport(places_per_query=1)
+        client = self.client(transport)
+        queries = [f'q{i}' for i in range(1100)]
+
+        results = client.google_maps_search(queries, limit=1)
+        self.assertEqual(len(transport.requests), 5)
+        self.assertEqual([places[0]['query'] for places in results], queries)
+
+    def test_failed_chunk_keeps_partial_results(self):
+        client = self.client(StandInTransport(places_per_query=1))
+        queries = [f'q{i}' for i in range(600)]
+        queries[300] = 'bad'
+
+        with self.assertRaises(ChunkedRequestError) as context:
+            client.google_maps_search(queries, limit=1)
+
+        error = context.exception
+        self.assertEqual(list(error.errors), [1])
+        self.assertIsNone(error.results[1])
+        self.assertEqual(error.failed_queries, queries[250:500])
+        self.assertEqual([places[0]['query'] for places in error.data], queries[:250] + queries[500:])
+
+    def test_drop_duplicates_across_chunks(self):
+        client = self.client(StandInTransport())
+        # 1000 queries over 300 distinct places, repeated in every chunk
+        queries = [f'q{i}-{i % 300}' for i in range(1000)]
+
+        results = client.google_maps_search(queries, limit=1, drop_duplicates=True)
+        self.assertEqual(len(results), 1)
+        place_ids = [place['place_id'] for place in results[0]]
+        self.assertEqual(place_ids, [f'place-{i}' for i in range(300)])
+
+    def test_drop_duplicates_in_partial_results(self):
+        client = self.client(StandInTransport())
+        queries = [f'q{i}-{i % 300}' for i in range(1000)]
+        queries[260] = 'bad'
+
+        with self.assertRaises(ChunkedRequestError) as context:
+            client.google_maps_search(queries, limit=1, drop_duplicates=True)
+
+        place_ids = [place['place_id'] for places in context.exception.data for place in places]
+        self.assertEqual(len(place_ids), len(set(place_ids)))
+        self.assertEqual(set(place_ids), {f'place-{i}' for i in range(300)})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import time
+import unittest
+from datetime import timedelta
+
+import requests
+
+from outscraper import OutscraperClient
+from outscraper.polling import PollingStrategy
+
+
+def response(body):
+    result = requests.Response()
+    result.status_code = 200
+    result._content = json.dumps(body).encode()
+    result.elapsed = timedelta(0)
+    return result
+
+
+class StandInAPI:
+    '''Session of a fake Outscraper API whose requests never finish.'''
+
+    def __init__(self):
+        self.archive_polls = 0
+        self.submitted = 0
+
+    def request(self, method, url, **kwargs):
+        if '/requests/' in url:
+            self.archive_polls += 1
+            return response({'id': url.rsplit('/', 1)[-1], 'status': 'Pending'})
+
+        self.submitted += 1
+        return response({'id': f'r{self.submitted}', 'status': 'Pending'})
+
+    def close(self):
+        pass
+
+
+class RequestHandleTest(unittest.TestCase):
+    def setUp(self):
+        self.api = StandInAPI()
+        self.client = OutscraperClient('k', api_urls=['http://api.test'], polling=PollingStrategy(first_delay=0.02, max_delay=0.02, jitter=0))
+        self.client._transport._session = self.api
+        self.addCleanup(self.client.close)
+
+    def test_cancel_stops_polling(self):
+        handle = self.client.submit('google_maps_search', 'restaurants, Brooklyn', limit=500)
+        time.sleep(0.1)
+        self.assertEqual(self.client._transport.watcher.pending(), {'r1'})
+        self.assertGreater(self.api.archive_polls, 0)
+
+        self.assertTrue(handle.cancel())
+        self.assertTrue(handle.cancel())
+        self.assertEqual(handle.status(), 'Cancelled')
+        self.assertEqual(self.client._transport.watcher.pending(), set())
+
+        polls = self.api.archive_polls
+        time.sleep(0.1)
+        self.assertLessEqual(self.api.archive_polls, polls + 1)
+
+    def test_other_watchers_keep_polling(self):
+        handle = self.client.submit('google_maps_search', 'restaurants, Brooklyn', limit=500)
+        other = self.client._request_handle('r1', self.client._transport.watcher.watch('r1'))
+
+        handle.cancel()
+        self.assertEqual(self.client._transport.watcher.pending(), {'r1'})
+        self.assertFalse(other.done())
+
+        other.cancel()
+        self.assertEqual(self.client._transport.watcher.pending(), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
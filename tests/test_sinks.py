@@ -0,0 +1,85 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from outscraper.sinks import CSVSink, ParquetSink
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+class CSVSinkTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'out.csv')
+
+    def read(self):
+        with open(self.path, encoding='utf-8', newline='') as file:
+            return list(csv.reader(file))
+
+    def test_header_of_first_batch(self):
+        sink = CSVSink(self.path)
+        sink.write([{'a': 1}, {'a': 2, 'b': {'x': 1}}])
+        sink.close()
+
+        self.assertEqual(self.read(), [['a', 'b'], ['1', ''], ['2', '{"x": 1}']])
+        self.assertFalse(os.path.exists(f'{self.path}.columns.json'))
+
+    def test_later_columns_rewrite_once_on_close(self):
+        sink = CSVSink(self.path)
+        sink.write([{'a': 1}])
+        for i in range(3):
+            sink.write([{'a': i, f'c{i}': i}])
+            # rows go to the end of the file, the header stays as written
+            self.assertEqual(self.read()[0], ['a'])
+        sink.close()
+
+        self.assertEqual(self.read(), [['a', 'c0', 'c1', 'c2'], ['1', '', '', ''], ['0', '0', '', ''], ['1', '', '1', ''],
+            ['2', '', '', '2']])
+        self.assertFalse(os.path.exists(f'{self.path}.columns.json'))
+
+    def test_unfinalized_output_resumes(self):
+        sink = CSVSink(self.path)
+        sink.write([{'a': 1}])
+        sink.write([{'b': 2}])
+        sink.close(finalize=False)
+        self.assertEqual(self.read()[0], ['a'])
+        self.assertTrue(os.path.exists(f'{self.path}.columns.json'))
+
+        sink = CSVSink(self.path, append=True)
+        sink.write([{'b': 3, 'a': 4}, {'c': 5}])
+        sink.close()
+
+        self.assertEqual(self.read(), [['a', 'b', 'c'], ['1', '', ''], ['', '2', ''], ['4', '3', ''], ['', '', '5']])
+        self.assertFalse(os.path.exists(f'{self.path}.columns.json'))
+
+
+@unittest.skipIf(pq is None, 'requires pyarrow')
+class ParquetSinkTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'out.parquet')
+
+    def schemas(self):
+        records = os.path.join(self.path, 'records')
+        return [pq.read_schema(os.path.join(records, part)).names for part in sorted(os.listdir(records))]
+
+    def test_unfinalized_parts_conformed_by_resumed_run(self):
+        sink = ParquetSink(self.path, batch_size=1)
+        sink.write([{'a': 1}, {'a': 2, 'b': 'x'}])
+        sink.close(finalize=False)
+        self.assertEqual(self.schemas(), [['a'], ['a', 'b']])
+
+        sink = ParquetSink(self.path, append=True, batch_size=1)
+        sink.write([{'c': 1.5}])
+        sink.close()
+        self.assertEqual(self.schemas(), [['a', 'b', 'c']] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import unittest
+from unittest import mock
+
+from outscraper import streaming
+from outscraper.streaming import JSONStream
+
+
+def chunked(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class Counting:
+    '''Wraps a compiled pattern or a JSON decoder and counts the characters it goes through.'''
+
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+        self.calls = 0
+        self.chars = 0
+
+    def search(self, string, pos=0):
+        match = self.wrapped.search(string, pos)
+        self.calls += 1
+        self.chars += (match.end() if match else len(string)) - pos
+        return match
+
+    def raw_decode(self, string, idx=0):
+        self.calls += 1
+        try:
+            value, end = self.wrapped.raw_decode(string, idx)
+        except ValueError:
+            # an incomplete value, read up to the end of the string
+            self.chars += len(string) - idx
+            raise
+        self.chars += end - idx
+        return value, end
+
+
+class JSONStreamTest(unittest.TestCase):
+    def test_large_record(self):
+        place = {'place_id': 'ChIJ1', 'reviews_data': [{'review_id': f'r{i}', 'review_text': 'Great "food", a \\ here. ' * 4,
+            'review_rating': 5, 'owner_answer': None} for i in range(30000)]}
+        body = json.dumps({'id': 'a', 'status': 'Success', 'data': [[place, {'place_id': 'ChIJ2'}]]}).encode()
+        self.assertGreater(len(body), 4 * 1024 * 1024)
+
+        structure = Counting(streaming.STRUCTURE_SPECIAL)
+        strings = Counting(streaming.STRING_SPECIAL)
+        scalars = Counting(streaming.SCALAR_END)
+        with mock.patch.multiple(streaming, STRUCTURE_SPECIAL=structure, STRING_SPECIAL=strings, SCALAR_END=scalars):
+            stream = JSONStream(chunked(body, 64 * 1024))
+            decoder = stream._json = Counting(stream._json)
+            items = list(stream)
+
+        self.assertEqual(items, [place, {'place_id': 'ChIJ2'}])
+        self.assertEqual(stream.fields, {'id': 'a', 'status': 'Success'})
+        # each value is decoded once, not again after every chunk: the two fields, their keys and the two items
+        self.assertEqual(decoder.calls, 2 + 3 + 2)
+        self.assertLessEqual(decoder.chars, len(body))
+        # and its end is found in one pass over the body, not by scanning the value again from its start
+        self.assertLessEqual(structure.chars + strings.chars + scalars.chars, len(body))
+
+    def test_values_split_across_chunks(self):
+        body = json.dumps({'data': [{'s': 'a\\"b]}', 'x': [1, {'y': '\\\\'}]}, 12, 'str', -1.5e3, [[]], {}, 'x\\"y'],
+            'status': 'Success'}, ensure_ascii=False).encode()
+        expected = list(JSONStream([body]))
+        self.assertEqual(expected, [{'s': 'a\\"b]}', 'x': [1, {'y': '\\\\'}]}, 12, 'str', -1500.0, {}, 'x\\"y'])
+
+        for size in (1, 2, 3, 7):
+            self.assertEqual(list(JSONStream(chunked(body, size))), expected)
+
+    def test_invalid(self):
+        for body in ('{"data": [{"a": 1}', '{"data": [{"a": 1]]}', '[tru]', '{"data": ["abc'):
+            with self.assertRaises(ValueError):
+                list(JSONStream([body]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Timer
+from urllib.request import Request, urlopen
+
+import requests
+
+from outscraper import WebhookReceiver
+from outscraper.polling import PollingStrategy
+from outscraper.transport import OutscraperTransport
+
+
+ARCHIVE = {'id': 'r1', 'status': 'Success', 'data': [[{'place_id': 'ChIJ1'}]]}
+
+
+def response(body):
+    result = requests.Response()
+    result.status_code = 200
+    result._content = json.dumps(body).encode()
+    result.elapsed = timedelta(0)
+    return result
+
+
+class StandInAPI:
+    '''Session of a fake Outscraper API: submits requests as async and, if asked, POSTs the webhook callback.'''
+
+    def __init__(self, receiver, callback=True):
+        self.receiver = receiver
+        self.callback = callback
+        self.sent = []
+        self.archive_polls = 0
+
+    def request(self, method, url, **kwargs):
+        if '/requests/' in url:
+            self.archive_polls += 1
+            return response(ARCHIVE)
+
+        self.sent.append(kwargs.get('params') or kwargs.get('json'))
+        if self.callback and self.sent[-1].get('webhook'):
+            Timer(0.1, self.post_callback).start()
+        return response({'id': 'r1', 'status': 'Pending'})
+
+    def post_callback(self):
+        host, port = self.receiver._server.server_address[:2]
+        request = Request(f'http://{host}:{port}/outscraper-webhook/{self.receiver.token}', data=json.dumps({'id': 'r1'}).encode(),
+            headers={'Content-Type': 'application/json'})
+        urlopen(request).close()
+
+    def close(self):
+        pass
+
+
+class WebhookReceiverTest(unittest.TestCase):
+    def transport(self, receiver, api):
+        transport = OutscraperTransport('k', api_urls=['http://api.test'], webhook_receiver=receiver,
+            polling=PollingStrategy(first_delay=0.05, jitter=0))
+        transport._session = api
+        self.addCleanup(transport.close)
+        self.addCleanup(receiver.close)
+        return transport
+
+    def wait(self, transport, async_request=False):
+        params = {'query': ['a', 'b'], 'async': True}
+        with ThreadPoolExecutor(1) as executor:
+            future = executor.submit(transport.api_request, 'GET', '/maps/search-v3', wait_async=True, async_request=async_request,
+                use_handle_response=True, params=params)
+            return future.result(timeout=10)
+
+    def test_callback_resolves_request(self):
+        receiver = WebhookReceiver(public_url='https://hooks.example.com', grace_period=60)
+        api = StandInAPI(receiver)
+        transport = self.transport(receiver, api)
+
+        self.assertEqual(self.wait(transport), ARCHIVE['data'])
+        self.assertEqual(api.sent[0]['webhook'], receiver.url)
+        self.assertEqual(receiver.received, 1)
+        self.assertEqual(api.archive_polls, 1)
+
+    def test_grace_period_falls_back_to_polling(self):
+        receiver = WebhookReceiver(public_url='https://hooks.example.com', grace_period=0.3)
+        api = StandInAPI(receiver, callback=False)
+        transport = self.transport(receiver, api)
+
+        started = time.monotonic()
+        self.assertEqual(self.wait(transport), ARCHIVE['data'])
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
+        self.assertEqual(api.sent[0]['webhook'], receiver.url)
+        self.assertEqual(receiver.received, 0)
+        self.assertEqual(api.archive_polls, 1)
+
+    def test_no_webhook_without_public_url(self):
+        receiver = WebhookReceiver()
+        api = StandInAPI(receiver)
+        transport = self.transport(receiver, api)
+
+        self.assertEqual(receiver._server.server_address[0], '127.0.0.1')
+        self.assertEqual(self.wait(transport), ARCHIVE['data'])
+        self.assertNotIn('webhook', api.sent[0])
+
+    def test_no_webhook_on_callers_async_request(self):
+        receiver = WebhookReceiver(public_url='https://hooks.example.com')
+        api = StandInAPI(receiver)
+        transport = self.transport(receiver, api)
+
+        self.assertEqual(self.wait(transport, async_request=True), {'id': 'r1', 'status': 'Pending'})
+        self.assertNotIn('webhook', api.sent[0])
+
+
+if __name__ == '__main__':
+    unittest.main()